@@ -2,22 +2,118 @@ from typing import ClassVar
 
 from bson import ObjectId
 from django.utils import timezone
+from pymongo import ASCENDING, IndexModel
 
 from app.database.mongodb import get_collection
 
+MANAGED_INDEXES_COLLECTION = "managed_indexes"
+INDEX_OPTIONS = ("unique", "sparse", "expireAfterSeconds", "partialFilterExpression")
+STAND_IN_FIELD = "_stand_in"
+STAND_IN_SUFFIX = "_stand_in"
+
+
+def index_spec(document: dict) -> tuple[list, dict]:
+    """Key and options of an IndexModel document or an index_information entry, in a comparable form."""
+    key = document["key"].items() if isinstance(document["key"], dict) else document["key"]
+    fields = [(field, int(direction) if isinstance(direction, float) else direction) for field, direction in key]
+    options = {option: document[option] for option in INDEX_OPTIONS if document.get(option) not in (None, False)}
+
+    return fields, options
+
+
+def ttl_changed_only(declared: dict, existing: dict) -> bool:
+    declared_key, declared_options = index_spec(declared)
+    existing_key, existing_options = index_spec(existing)
+
+    if declared_key != existing_key or "expireAfterSeconds" not in declared_options.keys() & existing_options.keys():
+        return False
+
+    return {**declared_options, "expireAfterSeconds": None} == {**existing_options, "expireAfterSeconds": None}
+
+
+def stand_in(index: IndexModel) -> IndexModel:
+    """Copy of a redefined index that serves the same queries while the old definition is replaced.
+
+    The extra field exists on no document, so the copy has its own key pattern and name but matches the same
+    documents in the same order and keeps the same uniqueness.
+    """
+    key, options = index_spec(index.document)
+    options.pop("expireAfterSeconds", None)
+
+    return IndexModel([*key, (STAND_IN_FIELD, ASCENDING)], name=f"{index.document['name']}{STAND_IN_SUFFIX}", **options)
+
 
 class BaseDocument:
     collection_name: ClassVar[str]
     indexes: ClassVar[list] = []
+    # Indexes created before the registry existed, dropped once the indexes replacing them are built.
+    retired_indexes: ClassVar[list[str]] = []
 
     @classmethod
     def collection(cls):
         return get_collection(cls.collection_name)
 
     @classmethod
-    def ensure_indexes(cls):
-        if cls.indexes:
-            cls.collection().create_indexes(cls.indexes)
+    def ensure_indexes(cls) -> dict[str, list[str]]:
+        if not cls.indexes:
+            return {"created": [], "updated": [], "dropped": []}
+
+        collection = cls.collection()
+        registry = get_collection(MANAGED_INDEXES_COLLECTION)
+        record = registry.find_one({"_id": cls.collection_name})
+        existing = collection.index_information()
+        declared = {index.document["name"] for index in cls.indexes}
+        missing = [index for index in cls.indexes if index.document["name"] not in existing]
+        changed = [
+            index
+            for index in cls.indexes
+            if index.document["name"] in existing
+            and index_spec(index.document) != index_spec(existing[index.document["name"]])
+        ]
+
+        # The replacement for a renamed index is built before the stale one is dropped, so queries always
+        # have an index to run on.
+        if missing:
+            collection.create_indexes(missing)
+
+        for index in changed:
+            name = index.document["name"]
+
+            if ttl_changed_only(index.document, existing[name]):
+                collection.database.command(
+                    "collMod",
+                    cls.collection_name,
+                    index={"name": name, "expireAfterSeconds": index.document["expireAfterSeconds"]},
+                )
+            else:
+                # The stand-in covers the queries between dropping the old definition and building the new one.
+                replacement = stand_in(index)
+                collection.create_indexes([replacement])
+                collection.drop_index(name)
+                collection.create_indexes([index])
+                collection.drop_index(replacement.document["name"])
+
+        # Only indexes this method created, retired on purpose or left as stand-ins by an interrupted run are
+        # dropped; indexes added by hand are left alone.
+        current = collection.index_information()
+        managed = set(record["names"]) if record else set()
+        managed |= {*cls.retired_indexes, *(f"{name}{STAND_IN_SUFFIX}" for name in declared)}
+        stale = sorted(name for name in managed if name in current and name not in declared)
+
+        for name in stale:
+            collection.drop_index(name)
+
+        registry.update_one(
+            {"_id": cls.collection_name},
+            {"$set": {"names": sorted(declared), "updated_at": timezone.now()}},
+            upsert=True,
+        )
+
+        return {
+            "created": [index.document["name"] for index in missing],
+            "updated": [index.document["name"] for index in changed],
+            "dropped": stale,
+        }
 
     @classmethod
     def create(cls, data: dict) -> dict:
@@ -29,6 +125,19 @@ class BaseDocument:
 
         return data
 
+    @classmethod
+    def insert_many(cls, documents: list[dict]) -> list[dict]:
+        now = timezone.now()
+
+        for document in documents:
+            document.setdefault("created_at", now)
+            document.setdefault("updated_at", now)
+
+        if documents:
+            cls.collection().insert_many(documents, ordered=True)
+
+        return documents
+
     @classmethod
     def find(cls, document_id: str) -> dict | None:
         return cls.collection().find_one({"_id": ObjectId(document_id)})
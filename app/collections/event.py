@@ -1,25 +1,655 @@
+import random
+from collections import defaultdict, deque
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
 from typing import ClassVar
 
-from pymongo import ASCENDING, DESCENDING, IndexModel
+from bson import ObjectId
+from django.conf import settings
+from django.utils import timezone
+from pymongo import ASCENDING, DESCENDING, IndexModel, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 
 from app.collections.base import BaseDocument
+from app.collections.event_archive import EventArchive
+from app.collections.event_counter import Changes, EventCounter
+from app.collections.event_dead_letter import EventDeadLetter
+from app.collections.event_idempotency_key import EventIdempotencyKey
+from app.collections.event_sequence import EventSequence
+from app.collections.event_signal import EventSignal
+from app.enums import EventFailureReason, EventKey, EventStatus
+
+ACTIVE_FILTER = {"status": {"$in": [EventStatus.PENDING, EventStatus.DELIVERED]}}
+TERMINAL_FILTER = {"status": {"$in": [EventStatus.PROCESSED, EventStatus.FAILED]}}
+EXPIRABLE_FILTER = {"status": {"$in": [EventStatus.SCHEDULED, EventStatus.PENDING, EventStatus.DELIVERED]}}
+HISTORY_SORT = [("created_at", DESCENDING), ("_id", DESCENDING)]
+SEQUENCE_FILTER = {"seq": {"$exists": True}}
+ARCHIVE_BATCH_SIZE = 1000
+DUPLICATE_KEY_ERROR = 11000
+CLAIM_SORT = [("priority", DESCENDING), ("created_at", ASCENDING)]
+CLAIM_PROJECTION = {"_id": 1, "account_id": 1, "key": 1, "status": 1, "attempts": 1, "priority": 1, "created_at": 1}
+EXPIRE_BATCH_SIZE = 1000
+MAX_CLAIM_ROUNDS = 3
+MAX_QUEUE_BRANCHES = 50
+
+
+def interleave(heads: dict[int, list[dict]]) -> list[dict]:
+    """Take one event per account per round, serving accounts in the delivery order of their next event."""
+    queues = [deque(documents) for documents in heads.values() if documents]
+    ordered: list[dict] = []
+
+    while queues:
+        queues.sort(key=lambda queue: (-(queue[0].get("priority") or 0), queue[0]["created_at"]))
+        ordered.extend(queue.popleft() for queue in queues)
+        queues = [queue for queue in queues if queue]
+
+    return ordered
 
 
 class Event(BaseDocument):
     collection_name = "events"
     indexes: ClassVar[list] = [
         IndexModel(
-            [("account_id", ASCENDING), ("status", ASCENDING), ("created_at", DESCENDING)],
-            name="account_status_created",
+            [("account_id", ASCENDING), ("status", ASCENDING), ("priority", DESCENDING), ("created_at", ASCENDING)],
+            name="queue_account_status_priority_created",
+            partialFilterExpression=ACTIVE_FILTER,
+        ),
+        IndexModel(
+            [
+                ("account_id", ASCENDING),
+                ("status", ASCENDING),
+                ("symbol", ASCENDING),
+                ("priority", DESCENDING),
+                ("created_at", ASCENDING),
+            ],
+            name="queue_account_status_symbol_priority_created",
+            partialFilterExpression=ACTIVE_FILTER,
+        ),
+        IndexModel(
+            [
+                ("account_id", ASCENDING),
+                ("status", ASCENDING),
+                ("strategy", ASCENDING),
+                ("priority", DESCENDING),
+                ("created_at", ASCENDING),
+            ],
+            name="queue_account_status_strategy_priority_created",
+            partialFilterExpression=ACTIVE_FILTER,
+        ),
+        IndexModel(
+            [("account_id", ASCENDING), ("status", ASCENDING), ("lease_expires_at", ASCENDING)],
+            name="queue_account_status_lease",
+            partialFilterExpression=ACTIVE_FILTER,
+        ),
+        IndexModel(
+            [("account_id", ASCENDING), ("not_before", ASCENDING)],
+            name="scheduled_account_not_before",
+            partialFilterExpression={"status": EventStatus.SCHEDULED},
+        ),
+        IndexModel(
+            [("expires_at", ASCENDING)],
+            name="queue_expires",
+            partialFilterExpression={**EXPIRABLE_FILTER, "expires_at": {"$type": "date"}},
+        ),
+        IndexModel(
+            [("account_id", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+            name="history_account_created",
         ),
         IndexModel(
-            [("account_id", ASCENDING), ("status", ASCENDING), ("symbol", ASCENDING), ("created_at", ASCENDING)],
-            name="account_status_symbol_created",
-            sparse=True,
+            [("account_id", ASCENDING), ("status", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+            name="history_account_status_created",
         ),
         IndexModel(
-            [("account_id", ASCENDING), ("status", ASCENDING), ("strategy", ASCENDING), ("created_at", ASCENDING)],
-            name="account_status_strategy_created",
-            sparse=True,
+            [("account_id", ASCENDING), ("seq", ASCENDING)],
+            name="history_account_seq",
+            unique=True,
+            partialFilterExpression=SEQUENCE_FILTER,
         ),
+        IndexModel(
+            [("broadcast_id", ASCENDING)],
+            name="broadcast",
+            partialFilterExpression={"broadcast_id": {"$exists": True}},
+        ),
+        IndexModel(
+            [("updated_at", ASCENDING)],
+            name="archive_updated",
+            partialFilterExpression=TERMINAL_FILTER,
+        ),
+        IndexModel(
+            [("processed_at", ASCENDING)],
+            name="latency_processed",
+            partialFilterExpression={"status": EventStatus.PROCESSED},
+        ),
+    ]
+    retired_indexes: ClassVar[list[str]] = [
+        "account_status_created",
+        "account_status_symbol_created",
+        "account_status_strategy_created",
     ]
+
+    @staticmethod
+    def build(account_id: int, user_id: str, validated: dict) -> dict:
+        payload = validated["payload"]
+        now = timezone.now()
+        not_before = validated.get("not_before")
+        scheduled = not_before is not None and not_before > now
+        available_at = not_before if scheduled else now
+        event_key = EventKey(validated["key"])
+        ttl_seconds = validated.get("ttl_seconds") or event_key.ttl_seconds()
+
+        return {
+            "account_id": account_id,
+            "user_id": user_id,
+            "consumer_id": None,
+            "key": str(validated["key"]),
+            "symbol": payload.get("symbol"),
+            "strategy": payload.get("strategy"),
+            "payload": payload,
+            "priority": validated.get("priority", event_key.priority()),
+            "response": None,
+            "status": EventStatus.SCHEDULED if scheduled else EventStatus.PENDING,
+            "not_before": not_before,
+            "delivered_at": None,
+            "lease_expires_at": None,
+            "processed_at": None,
+            "expires_at": available_at + timedelta(seconds=ttl_seconds) if ttl_seconds else None,
+            "attempts": 0,
+            "created_at": now,
+            "updated_at": now,
+        }
+
+    @classmethod
+    def create(cls, data: dict) -> dict:
+        if "seq" in data:
+            event = super().create(data)
+
+        else:
+            data["seq"] = EventSequence.reserve(data["account_id"])
+
+            try:
+                event = super().create(data)
+
+            finally:
+                EventSequence.release(data["account_id"], data["seq"])
+
+        EventCounter.added([event])
+
+        return event
+
+    @classmethod
+    def insert_many(cls, documents: list[dict]) -> list[dict]:
+        accounts: dict[int, list[dict]] = {}
+
+        for document in documents:
+            if "seq" not in document:
+                accounts.setdefault(document["account_id"], []).append(document)
+
+        reserved: dict[int, int] = {}
+
+        # One reservation per account keeps the numbers of a batch consecutive and in push order.
+        for account_id, pending in accounts.items():
+            reserved[account_id] = EventSequence.reserve(account_id, len(pending))
+
+            for offset, document in enumerate(pending):
+                document["seq"] = reserved[account_id] + offset
+
+        try:
+            super().insert_many(documents)
+
+        finally:
+            for account_id, first in reserved.items():
+                EventSequence.release(account_id, first)
+
+        EventCounter.added(documents)
+
+        return documents
+
+    @staticmethod
+    def claimable(now) -> dict:
+        return {
+            "$or": [
+                {"status": EventStatus.PENDING},
+                {"status": EventStatus.DELIVERED, "lease_expires_at": {"$lte": now}},
+            ],
+            "expires_at": {"$not": {"$lte": now}},
+        }
+
+    @staticmethod
+    def expired(now) -> dict:
+        return {
+            "$or": [
+                {"status": {"$in": [EventStatus.SCHEDULED, EventStatus.PENDING]}},
+                {"status": EventStatus.DELIVERED, "lease_expires_at": {"$lte": now}},
+            ],
+            "expires_at": {"$lte": now},
+        }
+
+    @staticmethod
+    def max_attempts(key: str) -> int:
+        try:
+            return EventKey(key).max_attempts()
+
+        except ValueError:
+            return settings.EVENT_DEFAULT_MAX_ATTEMPTS
+
+    @classmethod
+    def is_exhausted(cls, document: dict) -> bool:
+        return document["status"] == EventStatus.DELIVERED and document.get("attempts", 0) >= cls.max_attempts(
+            document["key"]
+        )
+
+    @classmethod
+    def find_idempotent(cls, account_id: int, idempotency_key: str) -> dict | None:
+        binding = EventIdempotencyKey.find_one({"account_id": account_id, "idempotency_key": idempotency_key})
+
+        if binding is None:
+            return None
+
+        query = {"_id": binding["event_id"], "account_id": account_id}
+
+        return cls.find_with_archive(query) or EventDeadLetter.find_one(query)
+
+    @classmethod
+    def create_idempotent(cls, data: dict, idempotency_key: str) -> tuple[dict, bool]:
+        event_id = ObjectId()
+        binding = EventIdempotencyKey.reserve(data["account_id"], idempotency_key, event_id)
+        query = {"_id": binding["event_id"], "account_id": data["account_id"]}
+
+        if binding["event_id"] != event_id:
+            event = cls.find_with_archive(query) or EventDeadLetter.find_one(query)
+
+            if event is not None:
+                return event, False
+
+        # The push holding the key may have failed before inserting its event, so any retry inserts it
+        # under the reserved id and the _id index keeps it to a single event.
+        try:
+            return cls.create({**data, "_id": binding["event_id"], "idempotency_key": idempotency_key}), True
+
+        except DuplicateKeyError:
+            return cls.find_with_archive(query), False
+
+    @classmethod
+    def backfill_leases(cls) -> int:
+        """Give events delivered before leases existed a lease from their delivery time, so they can be redelivered."""
+        lease_ms = settings.EVENT_LEASE_SECONDS * 1000
+        result = cls.collection().update_many(
+            {"status": EventStatus.DELIVERED, "lease_expires_at": None},
+            [
+                {
+                    "$set": {
+                        "lease_expires_at": {
+                            "$add": [{"$ifNull": ["$delivered_at", "$updated_at"]}, lease_ms],
+                        },
+                    }
+                }
+            ],
+        )
+
+        return result.modified_count
+
+    @classmethod
+    def backfill_priorities(cls) -> int:
+        """Give queued events stored before priorities existed their key's priority so new pushes do not starve them."""
+        query = {**EXPIRABLE_FILTER, "priority": {"$exists": False}}
+        updated = 0
+
+        for event_key in EventKey:
+            result = cls.collection().update_many(
+                {**query, "key": event_key.value}, {"$set": {"priority": event_key.priority()}}
+            )
+            updated += result.modified_count
+
+        # Keys no longer declared fall back to the default priority.
+        return updated + cls.collection().update_many(query, {"$set": {"priority": 0}}).modified_count
+
+    @classmethod
+    def promote(cls, account_id, now) -> int:
+        due = cls.where(
+            {"account_id": account_id, "status": EventStatus.SCHEDULED, "not_before": {"$lte": now}},
+            projection={"_id": 1},
+        )
+        event_ids = [document["_id"] for document in due]
+
+        if not event_ids:
+            return 0
+
+        # Both lookups go by _id; the promote_id tells this call's events apart from a concurrent promotion's.
+        promote_id = ObjectId()
+        result = cls.collection().update_many(
+            {"_id": {"$in": event_ids}, "status": EventStatus.SCHEDULED},
+            {"$set": {"status": EventStatus.PENDING, "promote_id": promote_id, "updated_at": now}},
+        )
+
+        if result.modified_count:
+            promoted = list(
+                cls.where({"_id": {"$in": event_ids}, "promote_id": promote_id}, projection={"account_id": 1, "key": 1})
+            )
+            EventCounter.move(promoted, EventStatus.SCHEDULED, EventStatus.PENDING)
+
+        return result.modified_count
+
+    @classmethod
+    def next_scheduled(cls, account_id) -> datetime | None:
+        document = cls.collection().find_one(
+            {"account_id": account_id, "status": EventStatus.SCHEDULED},
+            projection={"not_before": 1},
+            sort=[("not_before", ASCENDING)],
+        )
+
+        if document is None:
+            return None
+
+        return document["not_before"].replace(tzinfo=UTC)
+
+    @classmethod
+    def claim(cls, query: dict, limit: int, consumer_id: str) -> list[dict]:
+        claim_id = ObjectId()
+        now = timezone.now()
+        # Scheduled events sit outside the queue indexes until they are due, so polls never scan them.
+        cls.promote(query["account_id"], now)
+        lease_expires_at = now + timedelta(seconds=settings.EVENT_LEASE_SECONDS)
+        candidate_ids: list[ObjectId] = []
+        claimed = 0
+
+        if isinstance(query["account_id"], dict):
+            account_ids = EventCounter.queued_accounts(query)
+
+            if not account_ids:
+                return []
+
+            select = cls._fair_share_selector(query, account_ids)
+        else:
+            select = cls._queue_head_selector(query)
+
+        for _ in range(MAX_CLAIM_ROUNDS):
+            documents, more = select(now, limit - claimed)
+
+            if not documents:
+                break
+
+            exhausted: list[ObjectId] = []
+            candidates: list[ObjectId] = []
+
+            for document in documents:
+                (exhausted if cls.is_exhausted(document) else candidates).append(document["_id"])
+
+            if exhausted:
+                cls.dead_letter(exhausted, now)
+
+            if candidates:
+                result = cls.collection().update_many(
+                    {"_id": {"$in": candidates}, **cls.claimable(now)},
+                    {
+                        "$set": {
+                            "status": EventStatus.DELIVERED,
+                            "consumer_id": consumer_id,
+                            "claim_id": claim_id,
+                            "delivered_at": now,
+                            "lease_expires_at": lease_expires_at,
+                            "updated_at": now,
+                        },
+                        "$inc": {"attempts": 1},
+                    },
+                )
+
+                candidate_ids.extend(candidates)
+                claimed += result.modified_count
+
+            if not more or claimed >= limit:
+                break
+
+        if not claimed:
+            return []
+
+        consumed = list(cls.where({"_id": {"$in": candidate_ids}, "claim_id": claim_id}, sort=CLAIM_SORT))
+        # Pending events have never been delivered, so their first claim is the one moving them out of pending.
+        EventCounter.move(
+            [event for event in consumed if event["attempts"] == 1], EventStatus.PENDING, EventStatus.DELIVERED
+        )
+
+        return consumed
+
+    @classmethod
+    def _queue_head_selector(cls, query: dict) -> Callable[[datetime, int], tuple[list[dict], bool]]:
+        def select(now: datetime, remaining: int) -> tuple[list[dict], bool]:
+            documents = list(
+                cls.where(
+                    {**query, **cls.claimable(now)},
+                    projection=CLAIM_PROJECTION,
+                    sort=CLAIM_SORT,
+                    limit=remaining,
+                )
+            )
+
+            return documents, len(documents) == remaining
+
+        return select
+
+    @classmethod
+    def _fair_share_selector(
+        cls, query: dict, account_ids: list[int]
+    ) -> Callable[[datetime, int], tuple[list[dict], bool]]:
+        # At most MAX_QUEUE_BRANCHES accounts are read per round; shuffling gives every account its turn across polls.
+        active = random.sample(account_ids, len(account_ids))
+
+        def select(now: datetime, remaining: int) -> tuple[list[dict], bool]:
+            nonlocal active
+            batch, waiting = active[:MAX_QUEUE_BRANCHES], active[MAX_QUEUE_BRANCHES:]
+            share = -(-remaining // len(batch))
+            heads = cls.queue_heads(query, batch, now, share)
+            # Accounts that filled their share may hold more, and get the capacity left by the others next round
+            # after the accounts not read yet.
+            active = [*waiting, *(account_id for account_id in batch if len(heads.get(account_id, ())) == share)]
+
+            return interleave(heads)[:remaining], bool(active)
+
+        return select
+
+    @classmethod
+    def queue_heads(cls, query: dict, account_ids: list[int], now, share: int) -> dict[int, list[dict]]:
+        """Fetch the next `share` claimable events of each account in one round trip, each branch on its own index."""
+        pipelines = [
+            [
+                {"$match": {**query, "account_id": account_id, **cls.claimable(now)}},
+                {"$sort": dict(CLAIM_SORT)},
+                {"$limit": share},
+                {"$project": CLAIM_PROJECTION},
+            ]
+            for account_id in account_ids
+        ]
+        pipeline = [
+            *pipelines[0],
+            *({"$unionWith": {"coll": cls.collection_name, "pipeline": branch}} for branch in pipelines[1:]),
+        ]
+        heads: dict[int, list[dict]] = {}
+
+        for document in cls.collection().aggregate(pipeline):
+            heads.setdefault(document["account_id"], []).append(document)
+
+        return heads
+
+    @classmethod
+    def expire(cls, now, batch_size: int = EXPIRE_BATCH_SIZE) -> int:
+        documents = cls.where(
+            {**EXPIRABLE_FILTER, "expires_at": {"$lte": now}},
+            projection={"_id": 1},
+            sort=[("expires_at", ASCENDING)],
+            limit=batch_size,
+        )
+        event_ids = [document["_id"] for document in documents]
+
+        if not event_ids:
+            return 0
+
+        return len(cls.dead_letter(event_ids, now, EventFailureReason.EXPIRED))
+
+    @classmethod
+    def dead_letter(
+        cls, event_ids: list[ObjectId], now, reason: EventFailureReason = EventFailureReason.MAX_ATTEMPTS
+    ) -> list[dict]:
+        dead_letter_id = ObjectId()
+
+        if reason == EventFailureReason.EXPIRED:
+            guard = cls.expired(now)
+        else:
+            guard = {"status": EventStatus.DELIVERED, "lease_expires_at": {"$lte": now}}
+
+        # The status each event leaves is kept aside for the counters and dropped before the copy is written.
+        cls.collection().update_many(
+            {"_id": {"$in": event_ids}, **guard},
+            [
+                {
+                    "$set": {
+                        "dead_lettered_from": "$status",
+                        "status": EventStatus.FAILED,
+                        "dead_letter_id": dead_letter_id,
+                        "failure_reason": reason,
+                        "lease_expires_at": None,
+                        "failed_at": now,
+                        "updated_at": now,
+                    }
+                }
+            ],
+        )
+
+        documents = list(cls.where({"_id": {"$in": event_ids}, "dead_letter_id": dead_letter_id}))
+
+        if not documents:
+            return []
+
+        changes: Changes = defaultdict(int)
+
+        for document in documents:
+            EventCounter.moves([document], document.pop("dead_lettered_from"), EventStatus.FAILED, changes)
+
+            if reason == EventFailureReason.EXPIRED:
+                document["last_error"] = (
+                    f"Expired before it was acknowledged after {document['attempts']} delivery attempts."
+                )
+            else:
+                document["last_error"] = (
+                    f"Lease expired without acknowledgement after {document['attempts']} delivery attempts "
+                    f"(consumer {document.get('consumer_id')})."
+                )
+
+        EventDeadLetter.insert_many(documents)
+        cls.delete_where({"_id": {"$in": [document["_id"] for document in documents]}})
+
+        EventCounter.apply(changes)
+
+        EventSignal.notify_many(EventStatus.FAILED, documents)
+
+        return documents
+
+    @classmethod
+    def acknowledge(cls, account_id: int, acks: list[dict]) -> dict:
+        ack_id = ObjectId()
+        now = timezone.now()
+        operations = []
+
+        for ack in acks:
+            update_fields = {
+                "status": EventStatus.PROCESSED,
+                "ack_id": ack_id,
+                "lease_expires_at": None,
+                "processed_at": now,
+                "updated_at": now,
+            }
+
+            if ack.get("response") is not None:
+                update_fields["response"] = ack["response"]
+
+            operations.append(
+                UpdateOne(
+                    {"_id": ack["event_id"], "account_id": account_id, "status": EventStatus.DELIVERED},
+                    {"$set": update_fields},
+                )
+            )
+
+        cls.collection().bulk_write(operations, ordered=False)
+
+        event_ids = [ack["event_id"] for ack in acks]
+        documents = {
+            document["_id"]: document for document in cls.where({"_id": {"$in": event_ids}, "account_id": account_id})
+        }
+
+        missing = [event_id for event_id in event_ids if event_id not in documents]
+
+        if missing:
+            documents.update(
+                {
+                    document["_id"]: document
+                    for document in EventArchive.where(
+                        {"_id": {"$in": missing}, "account_id": account_id}, projection={"_id": 1}
+                    )
+                }
+            )
+
+        result: dict = {"processed": [], "not_found": [], "invalid_status": []}
+
+        for event_id in event_ids:
+            document = documents.get(event_id)
+
+            if document is None:
+                result["not_found"].append(event_id)
+            elif document.get("ack_id") == ack_id:
+                result["processed"].append(document)
+            else:
+                result["invalid_status"].append(event_id)
+
+        EventCounter.move(result["processed"], EventStatus.DELIVERED, EventStatus.PROCESSED)
+
+        return result
+
+    @classmethod
+    def find_with_archive(cls, query: dict) -> dict | None:
+        event = cls.find_one(query)
+
+        if event is None:
+            event = EventArchive.find_one(query)
+
+        return event
+
+    @classmethod
+    def find_broadcast(cls, query: dict) -> list[dict]:
+        events = [
+            *cls.where(query),
+            *EventArchive.where(query),
+            *EventDeadLetter.where(query),
+        ]
+        events.sort(key=lambda event: event["account_id"])
+
+        return events
+
+    @classmethod
+    def history(cls, query: dict, limit: int, sort: list[tuple[str, int]] = HISTORY_SORT) -> list[dict]:
+        events = list(cls.where(query, sort=sort, limit=limit))
+        events.extend(EventArchive.where(query, sort=sort, limit=limit))
+        events.extend(EventDeadLetter.where(query, sort=sort, limit=limit))
+        events.sort(key=lambda event: tuple(event[field] for field, _ in sort), reverse=sort[0][1] == DESCENDING)
+
+        return events[:limit]
+
+    @classmethod
+    def archive(cls, before, batch_size: int = ARCHIVE_BATCH_SIZE) -> int:
+        documents = list(
+            cls.where(
+                {**TERMINAL_FILTER, "updated_at": {"$lte": before}}, sort=[("updated_at", ASCENDING)], limit=batch_size
+            )
+        )
+
+        if not documents:
+            return 0
+
+        try:
+            EventArchive.collection().insert_many(documents, ordered=False)
+
+        except BulkWriteError as error:
+            # A previous run may have copied these before failing to delete them from the hot collection.
+            if any(write_error["code"] != DUPLICATE_KEY_ERROR for write_error in error.details["writeErrors"]):
+                raise
+
+        result = cls.delete_where({"_id": {"$in": [document["_id"] for document in documents]}, **TERMINAL_FILTER})
+
+        return result.deleted_count
@@ -0,0 +1,49 @@
+from typing import ClassVar
+
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+from app.collections.base import BaseDocument
+from app.collections.event_counter import EventCounter
+from app.enums import EventStatus
+
+
+class EventArchive(BaseDocument):
+    collection_name = "events_archive"
+    indexes: ClassVar[list] = [
+        IndexModel(
+            [("account_id", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+            name="history_account_created",
+        ),
+        IndexModel(
+            [("account_id", ASCENDING), ("status", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+            name="history_account_status_created",
+        ),
+        IndexModel(
+            [("account_id", ASCENDING), ("seq", ASCENDING)],
+            name="history_account_seq",
+            partialFilterExpression={"seq": {"$exists": True}},
+        ),
+        IndexModel(
+            [("created_at", ASCENDING)],
+            name="created",
+        ),
+        IndexModel(
+            [("broadcast_id", ASCENDING)],
+            name="broadcast",
+            partialFilterExpression={"broadcast_id": {"$exists": True}},
+        ),
+        IndexModel(
+            [("processed_at", ASCENDING)],
+            name="latency_processed",
+            partialFilterExpression={"status": EventStatus.PROCESSED},
+        ),
+    ]
+
+    @classmethod
+    def purge(cls, before) -> int:
+        query = {"created_at": {"$lt": before}}
+        purged = EventCounter.tally(cls, query)
+        result = cls.delete_where(query)
+        EventCounter.apply({change: -count for change, count in purged.items()})
+
+        return result.deleted_count
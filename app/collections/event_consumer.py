@@ -0,0 +1,62 @@
+import hashlib
+from datetime import timedelta
+from typing import ClassVar
+
+from django.conf import settings
+from django.utils import timezone
+from pymongo import ASCENDING, IndexModel
+
+from app.collections.base import BaseDocument
+
+
+def rendezvous_owner(group: str, account_id: int, members: list[str]) -> str:
+    """Pick the member with the highest hash for the account, so a join or leave only moves that member's share."""
+    return max(
+        members,
+        key=lambda member: hashlib.blake2b(f"{group}:{member}:{account_id}".encode(), digest_size=8).digest(),
+    )
+
+
+class EventConsumer(BaseDocument):
+    """Live members of named consumer groups, kept alive by the lease each group consume renews."""
+
+    collection_name = "event_consumers"
+    indexes: ClassVar[list] = [
+        IndexModel([("group", ASCENDING), ("consumer", ASCENDING)], name="group_consumer", unique=True),
+        IndexModel([("lease_expires_at", ASCENDING)], name="lease_ttl", expireAfterSeconds=0),
+    ]
+
+    @classmethod
+    def join(cls, group: str, consumer: str, user_id: str) -> None:
+        now = timezone.now()
+
+        cls.collection().update_one(
+            {"group": group, "consumer": consumer},
+            {
+                "$set": {
+                    "user_id": user_id,
+                    "lease_expires_at": now + timedelta(seconds=settings.EVENT_CONSUMER_LEASE_SECONDS),
+                    "updated_at": now,
+                },
+                "$setOnInsert": {"created_at": now},
+            },
+            upsert=True,
+        )
+
+    @classmethod
+    def members(cls, group: str) -> list[str]:
+        documents = cls.where(
+            {"group": group, "lease_expires_at": {"$gt": timezone.now()}},
+            projection={"consumer": 1},
+        )
+
+        return sorted(document["consumer"] for document in documents)
+
+    @classmethod
+    def assign(cls, group: str, consumer: str, account_ids: list[int]) -> tuple[list[int], list[str]]:
+        members = cls.members(group)
+        assigned = [
+            account_id for account_id in account_ids if rendezvous_owner(group, account_id, members) == consumer
+        ]
+
+        return assigned, members
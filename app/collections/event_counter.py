@@ -0,0 +1,221 @@
+from collections import defaultdict
+from datetime import UTC, datetime
+from typing import ClassVar
+
+from django.conf import settings
+from django.utils import timezone
+from pymongo import ASCENDING, IndexModel, UpdateOne
+
+from app.collections.base import BaseDocument
+from app.enums import EventStatus
+
+COUNTED_STATUSES = tuple(event_status.value for event_status in EventStatus)
+QUEUED_STATUSES = (EventStatus.SCHEDULED, EventStatus.PENDING)
+
+Changes = dict[tuple[int, str, str], int]
+
+
+def zero_counts() -> dict[str, int]:
+    return dict.fromkeys(COUNTED_STATUSES, 0)
+
+
+class EventCounter(BaseDocument):
+    """Number of events per account, key and status, moved with $inc on every status transition.
+
+    Events count as `processed` until they are purged from the archive and as `failed` while they sit
+    in the dead-letter queue. `rebuild_event_counters` recounts everything if the counters ever drift.
+    """
+
+    collection_name = "event_counters"
+    indexes: ClassVar[list] = [
+        IndexModel([("account_id", ASCENDING), ("key", ASCENDING)], name="account_key", unique=True),
+    ]
+
+    @staticmethod
+    def moves(documents: list[dict], source: str | None, target: str | None, changes: Changes | None = None) -> Changes:
+        changes = defaultdict(int) if changes is None else changes
+
+        for document in documents:
+            if source is not None:
+                changes[(document["account_id"], document["key"], source)] -= 1
+
+            if target is not None:
+                changes[(document["account_id"], document["key"], target)] += 1
+
+        return changes
+
+    @classmethod
+    def apply(cls, changes: Changes, pushed_at: datetime | None = None) -> None:
+        rows: dict[tuple[int, str], dict[str, int]] = {}
+
+        for (account_id, key, event_status), delta in changes.items():
+            if delta:
+                rows.setdefault((account_id, key), {})[str(event_status)] = delta
+
+        if not rows:
+            return
+
+        now = timezone.now()
+        update: dict = {"$set": {"updated_at": now}}
+
+        if pushed_at is not None:
+            update["$max"] = {"last_pushed_at": pushed_at}
+
+        cls.collection().bulk_write(
+            [
+                UpdateOne({"account_id": account_id, "key": key}, {**update, "$inc": increments}, upsert=True)
+                for (account_id, key), increments in rows.items()
+            ],
+            ordered=False,
+        )
+
+    @staticmethod
+    def tally(document: type[BaseDocument], query: dict) -> Changes:
+        groups = document.collection().aggregate(
+            [
+                {"$match": query},
+                {
+                    "$group": {
+                        "_id": {"account_id": "$account_id", "key": "$key", "status": "$status"},
+                        "count": {"$sum": 1},
+                    }
+                },
+            ]
+        )
+
+        return {
+            (group["_id"]["account_id"], group["_id"]["key"], group["_id"]["status"]): group["count"]
+            for group in groups
+        }
+
+    @classmethod
+    def rebuild(cls, documents: tuple[type[BaseDocument], ...]) -> int:
+        """Recount every counter from the given collections and drop the counters nothing was counted for."""
+        started_at = timezone.now()
+        rows: dict[tuple[int, str], dict[str, int]] = {}
+
+        for document in documents:
+            for (account_id, key, event_status), count in cls.tally(document, {}).items():
+                rows.setdefault((account_id, key), zero_counts())[event_status] += count
+
+        if rows:
+            cls.collection().bulk_write(
+                [
+                    UpdateOne(
+                        {"account_id": account_id, "key": key},
+                        {"$set": {**counts, "updated_at": timezone.now()}},
+                        upsert=True,
+                    )
+                    for (account_id, key), counts in rows.items()
+                ],
+                ordered=False,
+            )
+
+        # Counters moved by live traffic during the rebuild carry a newer updated_at and are kept.
+        cls.delete_where({"updated_at": {"$lt": started_at}})
+
+        return len(rows)
+
+    @classmethod
+    def move(cls, documents: list[dict], source: str | None, target: str | None) -> None:
+        cls.apply(cls.moves(documents, source, target))
+
+    @classmethod
+    def added(cls, documents: list[dict]) -> None:
+        changes: Changes = defaultdict(int)
+
+        for document in documents:
+            changes[(document["account_id"], document["key"], document["status"])] += 1
+
+        cls.apply(changes, pushed_at=timezone.now())
+
+    @classmethod
+    def backlog(cls, query: dict) -> dict:
+        """Pending and scheduled totals and the latest push of the counters matching a consume query.
+
+        Only the `account_id` and `key` filters narrow the read; events whose lease ran out are not counted.
+        """
+        backlog: dict = {EventStatus.PENDING: 0, EventStatus.SCHEDULED: 0, "last_pushed_at": None}
+
+        for counter in cls.where({field: query[field] for field in ("account_id", "key") if field in query}):
+            for event_status in QUEUED_STATUSES:
+                backlog[event_status] += counter.get(event_status, 0)
+
+            if counter.get("last_pushed_at") is not None:
+                pushed_at = counter["last_pushed_at"].replace(tzinfo=UTC)
+                backlog["last_pushed_at"] = max(backlog["last_pushed_at"] or pushed_at, pushed_at)
+
+        for event_status in QUEUED_STATUSES:
+            backlog[event_status] = max(backlog[event_status], 0)
+
+        return backlog
+
+    @classmethod
+    def queued_accounts(cls, query: dict) -> list[int]:
+        """Accounts of a consume query whose counters show events waiting for delivery or out on a lease."""
+        counters = cls.where({field: query[field] for field in ("account_id", "key") if field in query})
+        statuses = (*QUEUED_STATUSES, EventStatus.DELIVERED)
+
+        return sorted(
+            {
+                counter["account_id"]
+                for counter in counters
+                if any(counter.get(event_status, 0) > 0 for event_status in statuses)
+            }
+        )
+
+    @classmethod
+    def overflow(cls, account_ids: list[int], incoming: int = 1) -> dict[int, int]:
+        """Map the accounts whose waiting events plus `incoming` would exceed EVENT_MAX_PENDING to the excess."""
+        if not settings.EVENT_MAX_PENDING:
+            return {}
+
+        queued = dict.fromkeys(account_ids, 0)
+
+        for counter in cls.where({"account_id": {"$in": account_ids}}):
+            queued[counter["account_id"]] += sum(counter.get(event_status, 0) for event_status in QUEUED_STATUSES)
+
+        return {
+            account_id: count + incoming - settings.EVENT_MAX_PENDING
+            for account_id, count in queued.items()
+            if count + incoming > settings.EVENT_MAX_PENDING
+        }
+
+    @classmethod
+    def for_account(cls, account_id: int) -> dict:
+        totals = zero_counts()
+        keys = []
+
+        for counter in cls.where({"account_id": account_id}, sort=[("key", ASCENDING)]):
+            counts = {event_status: counter.get(event_status, 0) for event_status in COUNTED_STATUSES}
+            keys.append({"key": counter["key"], **counts})
+
+            for event_status, count in counts.items():
+                totals[event_status] += count
+
+        return {"account_id": account_id, "totals": totals, "keys": keys}
+
+    @classmethod
+    def fleet(cls) -> dict:
+        totals = zero_counts()
+        accounts = list(
+            cls.collection().aggregate(
+                [
+                    {
+                        "$group": {
+                            "_id": "$account_id",
+                            **{event_status: {"$sum": f"${event_status}"} for event_status in COUNTED_STATUSES},
+                        }
+                    },
+                    {"$sort": {"_id": ASCENDING}},
+                ]
+            )
+        )
+
+        for account in accounts:
+            account["account_id"] = account.pop("_id")
+
+            for event_status in COUNTED_STATUSES:
+                totals[event_status] += account[event_status]
+
+        return {"totals": totals, "accounts": accounts}
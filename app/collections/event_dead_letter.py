@@ -0,0 +1,37 @@
+from typing import ClassVar
+
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+from app.collections.base import BaseDocument
+from app.collections.event_counter import EventCounter
+
+
+class EventDeadLetter(BaseDocument):
+    collection_name = "events_dead_letter"
+    indexes: ClassVar[list] = [
+        IndexModel([("account_id", ASCENDING), ("_id", DESCENDING)], name="account_id"),
+        IndexModel(
+            [("account_id", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+            name="history_account_created",
+        ),
+        IndexModel(
+            [("account_id", ASCENDING), ("seq", ASCENDING)],
+            name="history_account_seq",
+            partialFilterExpression={"seq": {"$exists": True}},
+        ),
+        IndexModel(
+            [("broadcast_id", ASCENDING)],
+            name="broadcast",
+            partialFilterExpression={"broadcast_id": {"$exists": True}},
+        ),
+        IndexModel([("failed_at", ASCENDING)], name="failed"),
+    ]
+
+    @classmethod
+    def purge(cls, before) -> int:
+        query = {"failed_at": {"$lt": before}}
+        purged = EventCounter.tally(cls, query)
+        result = cls.delete_where(query)
+        EventCounter.apply({change: -count for change, count in purged.items()})
+
+        return result.deleted_count
@@ -0,0 +1,40 @@
+from typing import ClassVar
+
+from django.conf import settings
+from django.utils import timezone
+from pymongo import ASCENDING, IndexModel, ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from app.collections.base import BaseDocument
+
+HAS_IDEMPOTENCY_KEY = {"idempotency_key": {"$type": "string"}}
+
+
+class EventIdempotencyKey(BaseDocument):
+    collection_name = "events_idempotency_keys"
+    indexes: ClassVar[list] = [
+        IndexModel(
+            [("account_id", ASCENDING), ("idempotency_key", ASCENDING)],
+            name="account_idempotency_key",
+            unique=True,
+            partialFilterExpression=HAS_IDEMPOTENCY_KEY,
+        ),
+        IndexModel(
+            [("created_at", ASCENDING)],
+            name="created_ttl",
+            expireAfterSeconds=settings.EVENT_IDEMPOTENCY_TTL_SECONDS,
+        ),
+    ]
+
+    @classmethod
+    def reserve(cls, account_id: int, idempotency_key: str, event_id) -> dict:
+        """Bind the key to event_id unless an earlier push already holds it, and return the binding that won."""
+        query = {"account_id": account_id, "idempotency_key": idempotency_key}
+        update = {"$setOnInsert": {"event_id": event_id, "created_at": timezone.now()}}
+
+        try:
+            return cls.find_one_and_update(query, update, upsert=True, return_document=ReturnDocument.AFTER)
+
+        except DuplicateKeyError:
+            # A concurrent retry inserted the same key between our lookup and upsert.
+            return cls.find_one(query)
@@ -0,0 +1,166 @@
+from collections import defaultdict
+from datetime import UTC, datetime, timedelta
+from typing import ClassVar
+
+from django.utils import timezone
+from pymongo import ASCENDING, IndexModel, UpdateOne
+
+from app.collections.base import BaseDocument
+from app.collections.event import Event
+from app.collections.event_archive import EventArchive
+from app.collections.rollup_watermark import RollupWatermark
+from app.enums import EventStatus
+
+LATENCY_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000, 300000)
+OVERFLOW_BUCKET = "inf"
+BUCKET_LABELS = (*(str(bound) for bound in LATENCY_BUCKETS_MS), OVERFLOW_BUCKET)
+LATENCY_METRICS = ("queue_wait", "processing", "round_trip")
+PERCENTILES = (50, 95, 99)
+LATENCY_PROJECTION = {"account_id": 1, "key": 1, "created_at": 1, "not_before": 1, "delivered_at": 1, "processed_at": 1}
+LATENCY_RETENTION_DAYS = 90
+ROLLUP_WATERMARK = "event_latency"
+ROLLUP_WINDOW = timedelta(minutes=10)
+
+
+def bucket_label(milliseconds: float) -> str:
+    for bound in LATENCY_BUCKETS_MS:
+        if milliseconds <= bound:
+            return str(bound)
+
+    return OVERFLOW_BUCKET
+
+
+def percentile(histogram: dict[str, int], rank: int) -> int | None:
+    """Upper bound of the bucket holding the `rank`th percentile, None when it falls past the largest bucket."""
+    total = sum(histogram.values())
+    seen = 0
+
+    for label in BUCKET_LABELS:
+        seen += histogram.get(label, 0)
+
+        if total and seen * 100 >= total * rank:
+            return None if label == OVERFLOW_BUCKET else int(label)
+
+    return None
+
+
+def measure(document: dict) -> dict[str, float]:
+    created_at = document["created_at"].replace(tzinfo=UTC)
+    not_before = document.get("not_before")
+    available_at = max(created_at, not_before.replace(tzinfo=UTC)) if not_before is not None else created_at
+    delivered_at = document["delivered_at"].replace(tzinfo=UTC)
+    processed_at = document["processed_at"].replace(tzinfo=UTC)
+
+    return {
+        "queue_wait": max((delivered_at - available_at).total_seconds() * 1000, 0),
+        "processing": max((processed_at - delivered_at).total_seconds() * 1000, 0),
+        "round_trip": max((processed_at - available_at).total_seconds() * 1000, 0),
+    }
+
+
+def summarize(entry: dict | None) -> dict:
+    histograms = entry["histograms"] if entry else {}
+    summary: dict = {"count": entry["count"] if entry else 0}
+
+    for metric in LATENCY_METRICS:
+        histogram = histograms.get(metric, {})
+        summary[metric] = {
+            **{f"p{rank}": percentile(histogram, rank) for rank in PERCENTILES},
+            "buckets": {label: histogram.get(label, 0) for label in BUCKET_LABELS},
+        }
+
+    return summary
+
+
+class EventLatency(BaseDocument):
+    """Hourly histograms of push-to-delivery, delivery-to-ack and push-to-ack times per account and key.
+
+    Every bucket is labelled with its upper bound in milliseconds; `inf` holds everything above the largest one.
+    """
+
+    collection_name = "event_latencies"
+    indexes: ClassVar[list] = [
+        IndexModel(
+            [("account_id", ASCENDING), ("key", ASCENDING), ("hour", ASCENDING)], name="account_key_hour", unique=True
+        ),
+        IndexModel([("hour", ASCENDING)], name="hour_ttl", expireAfterSeconds=LATENCY_RETENTION_DAYS * 86400),
+    ]
+
+    @classmethod
+    def record(cls, documents: list[dict]) -> None:
+        increments: dict[tuple[int, str, datetime], dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+        for document in documents:
+            hour = document["processed_at"].replace(minute=0, second=0, microsecond=0, tzinfo=UTC)
+            row = increments[(document["account_id"], document["key"], hour)]
+            row["count"] += 1
+
+            for metric, milliseconds in measure(document).items():
+                row[f"{metric}.{bucket_label(milliseconds)}"] += 1
+
+        if not increments:
+            return
+
+        cls.collection().bulk_write(
+            [
+                UpdateOne(
+                    {"account_id": account_id, "key": key, "hour": hour},
+                    {"$inc": dict(row), "$set": {"updated_at": timezone.now()}},
+                    upsert=True,
+                )
+                for (account_id, key, hour), row in increments.items()
+            ],
+            ordered=False,
+        )
+
+    @classmethod
+    def rollup(cls, until: datetime) -> int:
+        """Record every event acked since the watermark, one window at a time, and move the watermark to `until`.
+
+        Events are read from the live queue first and the archive second, so one archived in between is still
+        seen once. A crash between recording a window and advancing the watermark counts that window twice.
+        """
+        start = RollupWatermark.get(ROLLUP_WATERMARK) or until - ROLLUP_WINDOW
+        recorded = 0
+
+        while start < until:
+            end = min(start + ROLLUP_WINDOW, until)
+            query = {"status": EventStatus.PROCESSED, "processed_at": {"$gt": start, "$lte": end}}
+            documents: dict = {}
+
+            for source in (Event, EventArchive):
+                for document in source.where(query, projection=LATENCY_PROJECTION):
+                    if document.get("delivered_at") is not None:
+                        documents.setdefault(document["_id"], document)
+
+            cls.record(list(documents.values()))
+            RollupWatermark.advance(ROLLUP_WATERMARK, end)
+            recorded += len(documents)
+            start = end
+
+        return recorded
+
+    @classmethod
+    def summary(cls, query: dict, since: datetime) -> dict:
+        groups: dict[str, dict] = {"totals": {}, "keys": {}, "accounts": {}}
+
+        for row in cls.where({**query, "hour": {"$gte": since}}):
+            for group, name in (("totals", None), ("keys", row["key"]), ("accounts", row["account_id"])):
+                entry = groups[group].setdefault(
+                    name, {"count": 0, "histograms": defaultdict(lambda: defaultdict(int))}
+                )
+                entry["count"] += row.get("count", 0)
+
+                for metric in LATENCY_METRICS:
+                    for label, count in row.get(metric, {}).items():
+                        entry["histograms"][metric][label] += count
+
+        return {
+            "since": since,
+            "totals": summarize(groups["totals"].get(None)),
+            "keys": [{"key": key, **summarize(entry)} for key, entry in sorted(groups["keys"].items())],
+            "accounts": [
+                {"account_id": account_id, **summarize(entry)}
+                for account_id, entry in sorted(groups["accounts"].items())
+            ],
+        }
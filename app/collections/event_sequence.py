@@ -0,0 +1,63 @@
+from datetime import UTC, timedelta
+
+from django.utils import timezone
+from pymongo import ReturnDocument
+
+from app.collections.base import BaseDocument
+
+CLAIM_TIMEOUT = timedelta(seconds=30)
+
+
+class EventSequence(BaseDocument):
+    """Per-account counter handing out the `seq` of each pushed event, one document per account.
+
+    Every reservation is kept in `inflight` until the push that made it has written its events, so readers can stop
+    below the lowest number still being written. A claim older than CLAIM_TIMEOUT belongs to a push that died and
+    is ignored.
+    """
+
+    collection_name = "event_sequences"
+
+    @classmethod
+    def reserve(cls, account_id: int, count: int = 1) -> int:
+        """Atomically reserve `count` consecutive numbers for the account and return the first one."""
+        now = timezone.now()
+        document = cls.collection().find_one_and_update(
+            {"_id": account_id},
+            [
+                {"$set": {"seq": {"$add": [{"$ifNull": ["$seq", 0]}, count]}}},
+                {
+                    "$set": {
+                        "inflight": {
+                            "$concatArrays": [
+                                {
+                                    "$filter": {
+                                        "input": {"$ifNull": ["$inflight", []]},
+                                        "cond": {"$gt": ["$$this.at", now - CLAIM_TIMEOUT]},
+                                    }
+                                },
+                                [{"first": {"$subtract": ["$seq", count - 1]}, "at": now}],
+                            ]
+                        }
+                    }
+                },
+            ],
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+
+        return document["seq"] - count + 1
+
+    @classmethod
+    def release(cls, account_id: int, first: int) -> None:
+        """Mark the reservation starting at `first` as written, whether or not the insert succeeded."""
+        cls.collection().update_one({"_id": account_id}, {"$pull": {"inflight": {"first": first}}})
+
+    @classmethod
+    def horizon(cls, account_id: int) -> int | None:
+        """Lowest number still being written for the account, None when every reserved number is readable."""
+        document = cls.find_one({"_id": account_id}) or {}
+        cutoff = timezone.now() - CLAIM_TIMEOUT
+        pending = [claim["first"] for claim in document.get("inflight", []) if claim["at"].replace(tzinfo=UTC) > cutoff]
+
+        return min(pending, default=None)
@@ -0,0 +1,193 @@
+import asyncio
+import contextlib
+import threading
+import time
+from datetime import timedelta
+from typing import ClassVar
+
+import structlog
+from bson import ObjectId
+from django.utils import timezone
+from pymongo import CursorType
+from pymongo.cursor import Cursor
+from pymongo.errors import CollectionInvalid, PyMongoError
+
+from app.collections.base import BaseDocument
+
+# Listeners only read signals from the last couple of seconds, and every new tailable cursor scans the
+# whole collection in natural order before it reaches them, so the collection is kept small.
+SIGNAL_COLLECTION_SIZE = 1024 * 1024
+SIGNAL_COLLECTION_MAX = 5000
+SIGNAL_LOOKBACK = timedelta(seconds=2)
+SIGNAL_AWAIT_MS = 1000
+NOTIFIER_QUEUE_SIZE = 1000
+NOTIFIER_RETRY_SECONDS = 1
+
+logger = structlog.get_logger("stream")
+
+
+class EventSignal(BaseDocument):
+    """Capped collection used as a cross-process wake-up channel for event waiters."""
+
+    collection_name = "event_signals"
+    ready: ClassVar[bool] = False
+
+    @classmethod
+    def ensure_collection(cls) -> None:
+        collection = cls.collection()
+        options = collection.options()
+
+        if options.get("capped"):
+            if options.get("size") != SIGNAL_COLLECTION_SIZE or options.get("max") != SIGNAL_COLLECTION_MAX:
+                collection.database.command(
+                    "collMod", cls.collection_name, cappedSize=SIGNAL_COLLECTION_SIZE, cappedMax=SIGNAL_COLLECTION_MAX
+                )
+
+            cls.ready = True
+            return
+
+        if options:
+            # convertToCapped takes no document limit, so it is set separately.
+            collection.database.command("convertToCapped", cls.collection_name, size=SIGNAL_COLLECTION_SIZE)
+            collection.database.command("collMod", cls.collection_name, cappedMax=SIGNAL_COLLECTION_MAX)
+        else:
+            with contextlib.suppress(CollectionInvalid):
+                collection.database.create_collection(
+                    cls.collection_name, capped=True, size=SIGNAL_COLLECTION_SIZE, max=SIGNAL_COLLECTION_MAX
+                )
+
+        # Tailable cursors die immediately on an empty capped collection.
+        collection.insert_one({"account_id": None, "created_at": timezone.now()})
+        cls.ready = True
+
+    @classmethod
+    def notify(cls, account_id: int, status: str, event_ids: list[ObjectId]) -> None:
+        if not cls.ready:
+            cls.ensure_collection()
+
+        cls.collection().insert_one(
+            {
+                "account_id": account_id,
+                "status": status,
+                "event_ids": event_ids,
+                "created_at": timezone.now(),
+            }
+        )
+
+    @classmethod
+    def notify_many(cls, status: str, events: list[dict]) -> None:
+        if not events:
+            return
+
+        if not cls.ready:
+            cls.ensure_collection()
+
+        accounts: dict[int, list[ObjectId]] = {}
+
+        for event in events:
+            accounts.setdefault(event["account_id"], []).append(event["_id"])
+
+        now = timezone.now()
+
+        cls.collection().insert_many(
+            [
+                {"account_id": account_id, "status": status, "event_ids": event_ids, "created_at": now}
+                for account_id, event_ids in accounts.items()
+            ]
+        )
+
+    @classmethod
+    def listen(cls, query: dict) -> Cursor:
+        if not cls.ready:
+            cls.ensure_collection()
+
+        floor = ObjectId.from_datetime(timezone.now() - SIGNAL_LOOKBACK)
+
+        return (
+            cls.collection()
+            .find(
+                {**query, "_id": {"$gt": floor}},
+                cursor_type=CursorType.TAILABLE_AWAIT,
+            )
+            .max_await_time_ms(SIGNAL_AWAIT_MS)
+        )
+
+    @staticmethod
+    def wait(cursor: Cursor, deadline: float) -> dict | None:
+        while cursor.alive and time.monotonic() < deadline:
+            for signal in cursor:
+                return signal
+
+        return None
+
+
+class EventNotifier:
+    """Fans event signals out to per-account asyncio queues from a single tailing cursor per process.
+
+    The cursor runs in a daemon thread that starts with the first subscriber and stops once the last one
+    leaves. Signals are wake-up hints: a subscriber whose queue is full misses them rather than blocking
+    the others.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.subscribers: dict[int, list[tuple[asyncio.AbstractEventLoop, asyncio.Queue]]] = {}
+        self.thread: threading.Thread | None = None
+
+    def subscribe(self, account_id: int) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=NOTIFIER_QUEUE_SIZE)
+
+        with self.lock:
+            self.subscribers.setdefault(account_id, []).append((asyncio.get_running_loop(), queue))
+
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, name="event-notifier", daemon=True)
+                self.thread.start()
+
+        return queue
+
+    def unsubscribe(self, account_id: int, queue: asyncio.Queue) -> None:
+        with self.lock:
+            remaining = [entry for entry in self.subscribers.get(account_id, []) if entry[1] is not queue]
+
+            if remaining:
+                self.subscribers[account_id] = remaining
+            else:
+                self.subscribers.pop(account_id, None)
+
+    def run(self) -> None:
+        while self.active():
+            try:
+                with EventSignal.listen({"account_id": {"$ne": None}}) as cursor:
+                    while cursor.alive and self.active():
+                        for signal in cursor:
+                            self.dispatch(signal)
+
+            except PyMongoError as error:
+                logger.warning("notifier_cursor_failed", error=str(error))
+                time.sleep(NOTIFIER_RETRY_SECONDS)
+
+    def active(self) -> bool:
+        with self.lock:
+            if self.subscribers:
+                return True
+
+            self.thread = None
+
+            return False
+
+    def dispatch(self, signal: dict) -> None:
+        with self.lock:
+            subscribers = list(self.subscribers.get(signal["account_id"], []))
+
+        for loop, queue in subscribers:
+            with contextlib.suppress(RuntimeError):
+                loop.call_soon_threadsafe(self.deliver, queue, signal)
+
+    @staticmethod
+    def deliver(queue: asyncio.Queue, signal: dict) -> None:
+        with contextlib.suppress(asyncio.QueueFull):
+            queue.put_nowait(signal)
+
+
+event_notifier = EventNotifier()
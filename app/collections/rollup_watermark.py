@@ -0,0 +1,28 @@
+from datetime import UTC, datetime
+
+from django.utils import timezone
+
+from app.collections.base import BaseDocument
+
+
+class RollupWatermark(BaseDocument):
+    """Point in time up to which a named rollup job has already aggregated its source events."""
+
+    collection_name = "rollup_watermarks"
+
+    @classmethod
+    def get(cls, name: str) -> datetime | None:
+        document = cls.find_one({"_id": name})
+
+        if document is None:
+            return None
+
+        return document["value"].replace(tzinfo=UTC)
+
+    @classmethod
+    def advance(cls, name: str, value: datetime) -> None:
+        cls.collection().update_one(
+            {"_id": name},
+            {"$set": {"value": value, "updated_at": timezone.now()}},
+            upsert=True,
+        )
@@ -1,5 +1,6 @@
 from app.enums.account_status import AccountStatus
 from app.enums.close_reason import CloseReason
+from app.enums.event_failure_reason import EventFailureReason
 from app.enums.event_key import EventKey
 from app.enums.event_status import EventStatus
 from app.enums.exception_mapping import ExceptionMapping
@@ -12,6 +13,7 @@ from app.enums.system_role import SystemRole
 __all__ = [
     "AccountStatus",
     "CloseReason",
+    "EventFailureReason",
     "EventKey",
     "EventStatus",
     "ExceptionMapping",
@@ -0,0 +1,6 @@
+from enum import StrEnum
+
+
+class EventFailureReason(StrEnum):
+    MAX_ATTEMPTS = "max_attempts"
+    EXPIRED = "expired"
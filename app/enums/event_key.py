@@ -1,6 +1,6 @@
 from enum import Enum
 
-from rest_framework import serializers
+from django.conf import settings
 
 
 class EventKey(Enum):
@@ -16,108 +16,101 @@ class EventKey(Enum):
     PATCH_ACCOUNT_ENABLE = "patch.account.enable"
 
     def schema(self) -> dict:
-        schemas = {
-            EventKey.POST_ORDER: {
-                "symbol": {"type": "string", "required": True},
-                "strategy": {"type": "integer", "required": True},
-                "type": {"type": "string", "required": True, "choices": ["buy", "sell"]},
-                "volume": {"type": "float", "required": True, "min_value": 0.01},
-                "price": {"type": "float", "required": False},
-                "stop_loss": {"type": "float", "required": False},
-                "take_profit": {"type": "float", "required": False},
-                "comment": {"type": "string", "required": False, "max_length": 255},
-            },
-            EventKey.GET_ORDER: {
-                "id": {"type": "string", "required": True},
-            },
-            EventKey.PUT_ORDER: {
-                "id": {"type": "string", "required": True},
-                "strategy": {"type": "integer", "required": True},
-                "stop_loss": {"type": "float", "required": False},
-                "take_profit": {"type": "float", "required": False},
-            },
-            EventKey.DELETE_ORDER: {
-                "id": {"type": "string", "required": True},
-                "strategy": {"type": "integer", "required": True},
-            },
-            EventKey.GET_ORDERS: {
-                "strategy": {"type": "integer", "required": False},
-                "symbol": {"type": "string", "required": False, "max_length": 50},
-                "side": {
-                    "type": "string",
-                    "required": False,
-                    "choices": ["buy", "sell"],
-                },
-                "status": {
-                    "type": "string",
-                    "required": False,
-                    "choices": ["pending", "open", "closing", "closed", "cancelled"],
-                },
-            },
-            EventKey.GET_ACCOUNT_INFO: {},
-            EventKey.GET_KLINES: {
-                "symbol": {"type": "string", "required": True},
-                "timeframe": {
-                    "type": "string",
-                    "required": True,
-                    "choices": ["M1", "M5", "M15", "M30", "H1", "H4", "D1", "W1", "MN1"],
-                },
-                "from_date": {"type": "string", "required": True},
-                "to_date": {"type": "string", "required": True},
-            },
-            EventKey.GET_TICKER: {
-                "symbols": {"type": "string", "required": True},
-            },
-            EventKey.PATCH_ACCOUNT_DISABLE: {},
-            EventKey.PATCH_ACCOUNT_ENABLE: {},
-        }
-        return schemas[self]
-
-    def serializer(self) -> type[serializers.Serializer]:
-        fields = {}
-        schema = self.schema()
-
-        if not schema:
-            return _build_empty_serializer(self.value)
-
-        field_type_map = {
-            "string": serializers.CharField,
-            "float": serializers.FloatField,
-            "integer": serializers.IntegerField,
-        }
-
-        for field_name, definition in schema.items():
-            field_class = field_type_map[definition["type"]]
-            kwargs = {"required": definition.get("required", False)}
-
-            if not kwargs["required"]:
-                kwargs["default"] = definition.get("default", None)
-                if kwargs["default"] is None:
-                    kwargs["allow_null"] = True
-
-            if "choices" in definition:
-                field_class = serializers.ChoiceField
-                kwargs["choices"] = [(choice, choice) for choice in definition["choices"]]
-
-            if "min_value" in definition:
-                kwargs["min_value"] = definition["min_value"]
-
-            if "max_value" in definition:
-                kwargs["max_value"] = definition["max_value"]
-
-            if "max_length" in definition:
-                kwargs["max_length"] = definition["max_length"]
-
-            fields[field_name] = field_class(**kwargs)
-
-        return type(f"{self.value}PayloadSerializer", (serializers.Serializer,), fields)
-
-
-def _build_empty_serializer(name: str) -> type[serializers.Serializer]:
-    def validate(_self, attrs):
-        if attrs:
-            raise serializers.ValidationError("This event key does not accept any payload fields.")
-
-        return attrs
-
-    return type(f"{name}PayloadSerializer", (serializers.Serializer,), {"validate": validate})
+        return SCHEMAS[self]
+
+    def max_attempts(self) -> int:
+        if self.value in settings.EVENT_MAX_ATTEMPTS:
+            return settings.EVENT_MAX_ATTEMPTS[self.value]
+
+        return MAX_ATTEMPTS.get(self, settings.EVENT_DEFAULT_MAX_ATTEMPTS)
+
+    def priority(self) -> int:
+        if self.value in settings.EVENT_PRIORITIES:
+            return settings.EVENT_PRIORITIES[self.value]
+
+        return PRIORITIES.get(self, DEFAULT_PRIORITY)
+
+    def ttl_seconds(self) -> int | None:
+        if self.value in settings.EVENT_TTL_SECONDS:
+            return settings.EVENT_TTL_SECONDS[self.value] or None
+
+        return TTL_SECONDS.get(self)
+
+
+DEFAULT_PRIORITY = 0
+MAX_PRIORITY = 9
+
+SCHEMAS: dict[EventKey, dict] = {
+    EventKey.POST_ORDER: {
+        "symbol": {"type": "string", "required": True},
+        "strategy": {"type": "integer", "required": True},
+        "type": {"type": "string", "required": True, "choices": ["buy", "sell"]},
+        "volume": {"type": "float", "required": True, "min_value": 0.01},
+        "price": {"type": "float", "required": False},
+        "stop_loss": {"type": "float", "required": False},
+        "take_profit": {"type": "float", "required": False},
+        "comment": {"type": "string", "required": False, "max_length": 255},
+    },
+    EventKey.GET_ORDER: {
+        "id": {"type": "string", "required": True},
+    },
+    EventKey.PUT_ORDER: {
+        "id": {"type": "string", "required": True},
+        "strategy": {"type": "integer", "required": True},
+        "stop_loss": {"type": "float", "required": False},
+        "take_profit": {"type": "float", "required": False},
+    },
+    EventKey.DELETE_ORDER: {
+        "id": {"type": "string", "required": True},
+        "strategy": {"type": "integer", "required": True},
+    },
+    EventKey.GET_ORDERS: {
+        "strategy": {"type": "integer", "required": False},
+        "symbol": {"type": "string", "required": False, "max_length": 50},
+        "side": {
+            "type": "string",
+            "required": False,
+            "choices": ["buy", "sell"],
+        },
+        "status": {
+            "type": "string",
+            "required": False,
+            "choices": ["pending", "open", "closing", "closed", "cancelled"],
+        },
+    },
+    EventKey.GET_ACCOUNT_INFO: {},
+    EventKey.GET_KLINES: {
+        "symbol": {"type": "string", "required": True},
+        "timeframe": {
+            "type": "string",
+            "required": True,
+            "choices": ["M1", "M5", "M15", "M30", "H1", "H4", "D1", "W1", "MN1"],
+        },
+        "from_date": {"type": "string", "required": True},
+        "to_date": {"type": "string", "required": True},
+    },
+    EventKey.GET_TICKER: {
+        "symbols": {"type": "string", "required": True},
+    },
+    EventKey.PATCH_ACCOUNT_DISABLE: {},
+    EventKey.PATCH_ACCOUNT_ENABLE: {},
+}
+
+MAX_ATTEMPTS: dict[EventKey, int] = {
+    EventKey.POST_ORDER: 3,
+    EventKey.PUT_ORDER: 3,
+    EventKey.DELETE_ORDER: 3,
+}
+
+TTL_SECONDS: dict[EventKey, int] = {
+    EventKey.POST_ORDER: 600,
+    EventKey.PUT_ORDER: 600,
+}
+
+PRIORITIES: dict[EventKey, int] = {
+    EventKey.PATCH_ACCOUNT_DISABLE: 9,
+    EventKey.DELETE_ORDER: 8,
+    EventKey.PUT_ORDER: 6,
+    EventKey.POST_ORDER: 5,
+    EventKey.PATCH_ACCOUNT_ENABLE: 5,
+}
@@ -2,6 +2,7 @@ from enum import StrEnum
 
 
 class EventStatus(StrEnum):
+    SCHEDULED = "scheduled"
     PENDING = "pending"
     DELIVERED = "delivered"
     PROCESSED = "processed"
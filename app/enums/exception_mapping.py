@@ -9,6 +9,8 @@ from rest_framework.exceptions import (
     ValidationError,
 )
 
+from app.http.exceptions.queue_full import QueueFull
+
 
 class ExceptionMapping(Enum):
     VALIDATION_FAILED = (ValidationError, http_status.HTTP_400_BAD_REQUEST, "Validation failed.")
@@ -20,6 +22,7 @@ class ExceptionMapping(Enum):
     AUTHENTICATION_FAILED = (AuthenticationFailed, http_status.HTTP_401_UNAUTHORIZED, "Authentication failed.")
     PERMISSION_DENIED = (PermissionDenied, http_status.HTTP_403_FORBIDDEN, "Permission denied.")
     THROTTLED = (Throttled, http_status.HTTP_429_TOO_MANY_REQUESTS, "Request was throttled.")
+    QUEUE_FULL = (QueueFull, http_status.HTTP_429_TOO_MANY_REQUESTS, "Event queue is full.")
     GENERIC_ERROR = (None, 0, "An error occurred.")
 
     def __init__(self, exception_class: type | None, status_code: int, message: str) -> None:
@@ -17,6 +17,7 @@ from app.http.response import build_response
 class BaseController(ViewSet):
     permissions: ClassVar[dict[str, list[type]]] = {}
     throttles: ClassVar[dict[str, list[type]]] = {}
+    renderers: ClassVar[dict[str, list[type]]] = {}
     default_permissions: ClassVar[list[type]] = [IsAuthenticated]
 
     def get_permissions(self) -> list:
@@ -29,6 +30,12 @@ class BaseController(ViewSet):
 
         return super().get_throttles()
 
+    def get_renderers(self) -> list:
+        if self.action in self.renderers:
+            return [renderer() for renderer in self.renderers[self.action]]
+
+        return super().get_renderers()
+
     def reply(
         self,
         message: str | None = None,
@@ -1,78 +1,250 @@
+import asyncio
+import hashlib
+import json
+import math
+import threading
+import time
+from collections.abc import AsyncIterator
+from datetime import timedelta
 from typing import Any, ClassVar
 
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
 from django.utils import timezone
+from django.utils.http import parse_etags
 from pymongo import ASCENDING, DESCENDING
 from rest_framework import serializers, status
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import JSONRenderer
 from rest_framework.request import Request
 from rest_framework.response import Response
-
-from app.collections.event import Event
-from app.enums import EventKey, EventStatus
+from rest_framework.utils.encoders import JSONEncoder
+
+from app.collections.event import HISTORY_SORT, Event
+from app.collections.event_consumer import EventConsumer
+from app.collections.event_counter import EventCounter
+from app.collections.event_dead_letter import EventDeadLetter
+from app.collections.event_latency import EventLatency
+from app.collections.event_sequence import EventSequence
+from app.collections.event_signal import EventSignal, event_notifier
+from app.enums import EventKey, EventStatus, ExceptionMapping
 from app.http.controllers.base import BaseController
-from app.http.permissions.event import CanAckEvents, CanConsumeEvents, CanPushEvents, CanReadHistory, CanReadResponses
+from app.http.exceptions.helpers import extract_validation_message
+from app.http.exceptions.queue_full import QueueFull
+from app.http.permissions.event import (
+    CanAckEvents,
+    CanConsumeEvents,
+    CanPushEvents,
+    CanReadHistory,
+    CanReadResponses,
+    CanStreamEvents,
+)
+from app.http.permissions.role import IsRoot
+from app.http.renderers import EventStreamRenderer
 from app.http.requests.event.ack_event import AckEventRequestSerializer
-from app.http.requests.event.consume_event import ConsumeEventRequestSerializer
+from app.http.requests.event.ack_event_batch import AckEventBatchRequestSerializer
+from app.http.requests.event.consume_event import (
+    MAX_CONSUME_LIMIT,
+    ConsumeAccountsEventRequestSerializer,
+    ConsumeAcksRequestSerializer,
+    ConsumeEventRequestSerializer,
+)
+from app.http.requests.event.event_latency import EventLatencyRequestSerializer
 from app.http.requests.event.event_response import EventResponseRequestSerializer
 from app.http.requests.event.history_event import HistoryEventRequestSerializer
 from app.http.requests.event.push_event import PushEventRequestSerializer
+from app.http.requests.event.push_event_batch import PushEventBatchRequestSerializer
+from app.http.requests.event.stream_event import StreamEventRequestSerializer
+from app.http.requests.validators import request_body_size
 from app.http.resources.event import EventResource
 from app.models import Account
 
+AWAITING_RESPONSE_STATUSES = (EventStatus.SCHEDULED, EventStatus.PENDING, EventStatus.DELIVERED)
+CLAIMABLE_SIGNAL_STATUSES = (EventStatus.PENDING, EventStatus.SCHEDULED)
+IDLE_BACKOFF_FACTOR = 10
+STREAM_HEARTBEAT_SECONDS = 15
+STREAM_MAX_SECONDS = 300
+STREAM_RETRY_MS = 3000
+EVENT_KEYS = [
+    {
+        "key": event_key.value,
+        "name": event_key.name,
+        "schema": event_key.schema(),
+    }
+    for event_key in EventKey
+]
+EVENT_KEYS_ETAG = f'"{hashlib.sha256(json.dumps(EVENT_KEYS, sort_keys=True).encode()).hexdigest()[:32]}"'
+
+# Every long-poll holds a worker thread, so each process lets only this many wait at once.
+long_poll_slots = threading.BoundedSemaphore(settings.EVENT_MAX_WAITERS)
+
 
 class EventController(BaseController):
     permissions: ClassVar[dict] = {
         "keys": [IsAuthenticated],
         "push": [CanPushEvents],
+        "push_batch": [CanPushEvents],
         "consume": [CanConsumeEvents],
+        "consume_accounts": [CanConsumeEvents],
+        "stream": [CanStreamEvents],
         "ack": [CanAckEvents],
+        "ack_batch": [CanAckEvents],
         "history": [CanReadHistory],
         "response": [CanReadResponses],
+        "stats": [CanReadHistory],
+        "fleet_stats": [IsRoot],
+        "latency": [IsRoot],
+    }
+    renderers: ClassVar[dict] = {
+        "stream": [JSONRenderer, EventStreamRenderer],
     }
 
     @action(detail=False, methods=["get"], url_path="keys")
-    def keys(self, _request: Request) -> Response:
-        data = [
-            {
-                "key": event_key.value,
-                "name": event_key.name,
-                "schema": event_key.schema(),
-            }
-            for event_key in EventKey
-        ]
+    def keys(self, request: Request) -> Response:
+        if EVENT_KEYS_ETAG in parse_etags(request.headers.get("If-None-Match", "")):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": EVENT_KEYS_ETAG})
+
+        response = self.reply(data=EVENT_KEYS)
+        response["ETag"] = EVENT_KEYS_ETAG
 
-        return self.reply(data=data)
+        return response
 
     @action(detail=False, methods=["post"], url_path="")
     def push(self, request: Request, id: int) -> Response:
-        serializer = PushEventRequestSerializer(data=request.data, context={"account_id": id})
+        serializer = PushEventRequestSerializer(
+            data=request.data, context={"account_id": id, "body_size": request_body_size(request)}
+        )
         serializer.is_valid(raise_exception=True)
 
-        payload = serializer.validated_data["payload"]
+        idempotency_key = serializer.validated_data.get("idempotency_key")
 
-        event = Event.create(
-            {
-                "account_id": id,
-                "user_id": str(request.user.pk),
-                "consumer_id": None,
-                "key": str(serializer.validated_data["key"]),
-                "symbol": payload.get("symbol"),
-                "strategy": payload.get("strategy"),
-                "payload": payload,
-                "response": None,
-                "status": EventStatus.PENDING,
-                "delivered_at": None,
-                "processed_at": None,
-                "attempts": 0,
-            }
-        )
+        # A retry of a push that already went through gets its event back even once the queue is full.
+        if idempotency_key is not None:
+            event = Event.find_idempotent(id, idempotency_key)
+
+            if event is not None:
+                return self.reply(data=EventResource(event).data)
+
+        self._ensure_queue_capacity(id, 1)
+        event = Event.build(id, str(request.user.pk), serializer.validated_data)
+
+        if idempotency_key is None:
+            event = Event.create(event)
+        else:
+            event, created = Event.create_idempotent(event, idempotency_key)
+
+            if not created:
+                return self.reply(data=EventResource(event).data)
+
+        EventSignal.notify(id, event["status"], [event["_id"]])
 
         return self.reply(
             data=EventResource(event).data,
             status_code=status.HTTP_201_CREATED,
         )
 
+    @action(detail=False, methods=["post"], url_path="batch")
+    def push_batch(self, request: Request, id: int) -> Response:
+        serializer = PushEventBatchRequestSerializer(
+            data=request.data, context={"account_id": id, "body_size": request_body_size(request)}
+        )
+        serializer.is_valid(raise_exception=True)
+
+        items = serializer.validated_data["events"]
+        user_id = str(request.user.pk)
+        pushed = self._find_retried(id, items)
+        fresh = [index for index, item in enumerate(items) if item["data"] is not None and index not in pushed]
+
+        if fresh:
+            self._ensure_queue_capacity(id, len(fresh))
+
+        events = self._write_batch(id, user_id, items, fresh, pushed)
+
+        for event_status in (EventStatus.PENDING, EventStatus.SCHEDULED):
+            event_ids = [event["_id"] for event in events if event["status"] == event_status]
+
+            if event_ids:
+                EventSignal.notify(id, event_status, event_ids)
+
+        results = []
+
+        for index, item in enumerate(items):
+            if item["data"] is None:
+                message = extract_validation_message(item["errors"], ExceptionMapping.VALIDATION_FAILED.message)
+                results.append({"index": index, "success": False, "message": message})
+            else:
+                results.append({"index": index, "success": True, "data": EventResource(pushed[index]).data})
+
+        meta = {"count": len(events), "failed": len(items) - len(pushed)}
+
+        if not pushed:
+            return self.reply(
+                message="No events were created.",
+                data=results,
+                status_code=status.HTTP_400_BAD_REQUEST,
+                meta=meta,
+            )
+
+        return self.reply(
+            data=results,
+            status_code=status.HTTP_201_CREATED if events else status.HTTP_200_OK,
+            meta=meta,
+        )
+
+    def _find_retried(self, account_id: int, items: list[dict]) -> dict[int, dict]:
+        """Map the items retried under a key that already created an event to that event; they take no queue room."""
+        retried: dict[int, dict] = {}
+
+        for index, item in enumerate(items):
+            if item["data"] is not None and item["data"].get("idempotency_key") is not None:
+                event = Event.find_idempotent(account_id, item["data"]["idempotency_key"])
+
+                if event is not None:
+                    retried[index] = event
+
+        return retried
+
+    def _write_batch(
+        self, account_id: int, user_id: str, items: list[dict], fresh: list[int], pushed: dict[int, dict]
+    ) -> list[dict]:
+        """Write the `fresh` items, record each item's event in `pushed` and return the events actually created."""
+        built = {index: Event.build(account_id, user_id, items[index]["data"]) for index in fresh}
+
+        if all(items[index]["data"].get("idempotency_key") is None for index in fresh):
+            events = Event.insert_many(list(built.values()))
+            pushed.update(zip(fresh, events, strict=True))
+
+            return events
+
+        # Keyed items need their own reservation, so the batch is written one event at a time in item order.
+        events = []
+
+        for index in fresh:
+            idempotency_key = items[index]["data"].get("idempotency_key")
+
+            if idempotency_key is None:
+                pushed[index], created = Event.create(built[index]), True
+            else:
+                pushed[index], created = Event.create_idempotent(built[index], idempotency_key)
+
+            if created:
+                events.append(pushed[index])
+
+        return events
+
+    def _ensure_queue_capacity(self, account_id: int, incoming: int) -> None:
+        excess = EventCounter.overflow([account_id], incoming).get(account_id)
+
+        if excess is None:
+            return
+
+        # Time for a terminal draining full consume pages at the fastest poll interval to clear the excess.
+        drain_seconds = math.ceil(excess / MAX_CONSUME_LIMIT) * settings.EVENT_POLL_MIN_MS / 1000
+        raise QueueFull(wait=min(max(drain_seconds, 1), settings.EVENT_POLL_MAX_MS / 1000))
+
     def _validate_account(self, account_id: int) -> None:
         if not Account.objects.filter(id=account_id).exists():
             raise serializers.ValidationError({"detail": "Account not found."})
@@ -84,57 +256,236 @@ class EventController(BaseController):
         serializer = ConsumeEventRequestSerializer(data=request.query_params)
         serializer.is_valid(raise_exception=True)
 
-        limit = serializer.validated_data["limit"]
-        consumer_id = str(request.user.pk)
-        now = timezone.now()
-        consumed: list[dict] = []
+        acks_serializer = ConsumeAcksRequestSerializer(
+            data=request.data, context={"body_size": request_body_size(request)}
+        )
+        acks_serializer.is_valid(raise_exception=True)
 
-        query: dict[str, Any] = {"account_id": id, "status": EventStatus.PENDING}
+        validated = serializer.validated_data
+        meta: dict[str, Any] = {}
 
-        if "key" in serializer.validated_data:
-            keys = serializer.validated_data["key"]
-            query["key"] = keys[0] if len(keys) == 1 else {"$in": keys}
+        # Acks go first so a terminal's previous batch is settled before its next one is claimed.
+        if acks_serializer.validated_data.get("acks"):
+            result = Event.acknowledge(id, acks_serializer.validated_data["acks"])
 
-        if "symbol" in serializer.validated_data:
-            query["symbol"] = serializer.validated_data["symbol"]
+            if result["processed"]:
+                EventSignal.notify(id, EventStatus.PROCESSED, [event["_id"] for event in result["processed"]])
 
-        if "strategy" in serializer.validated_data:
-            query["strategy"] = serializer.validated_data["strategy"]
+            meta["acks"] = {
+                "processed": [str(event["_id"]) for event in result["processed"]],
+                "not_found": [str(event_id) for event_id in result["not_found"]],
+                "invalid_status": [str(event_id) for event_id in result["invalid_status"]],
+            }
 
-        cursor = Event.where(
-            query,
-            sort=[("created_at", ASCENDING)],
+        query = self._consume_query(id, validated)
+        consumed = self._claim(query, validated["limit"], str(request.user.pk), validated["wait"])
+
+        return self.reply(
+            data=EventResource(consumed, many=True).data,
+            meta={"count": len(consumed), **self._poll_hint(query, len(consumed) < validated["limit"]), **meta},
         )
 
-        for event in cursor:
-            if len(consumed) >= limit:
-                break
-
-            result = Event.find_one_and_update(
-                {"_id": event["_id"], "status": EventStatus.PENDING},
-                {
-                    "$set": {
-                        "status": EventStatus.DELIVERED,
-                        "consumer_id": consumer_id,
-                        "delivered_at": now,
-                        "updated_at": now,
-                    },
-                    "$inc": {"attempts": 1},
-                },
-                return_document=True,
+    @action(detail=False, methods=["post"], url_path="consume")
+    def consume_accounts(self, request: Request) -> Response:
+        serializer = ConsumeAccountsEventRequestSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        validated = serializer.validated_data
+        meta: dict[str, Any] = {}
+
+        if "group" in validated:
+            EventConsumer.join(validated["group"], validated["consumer"], str(request.user.pk))
+            account_ids, members = EventConsumer.assign(
+                validated["group"],
+                validated["consumer"],
+                list(Account.objects.order_by("id").values_list("id", flat=True)),
             )
+            meta["members"] = len(members)
+        elif "accounts" in validated:
+            account_ids = validated["accounts"]
+            known = set(Account.objects.filter(id__in=account_ids).values_list("id", flat=True))
+            unknown = [str(account_id) for account_id in account_ids if account_id not in known]
 
-            if result:
-                consumed.append(result)
+            if unknown:
+                raise serializers.ValidationError({"detail": f"Account(s) not found: {', '.join(unknown)}."})
+        else:
+            account_ids = list(Account.objects.filter(user=request.user).order_by("id").values_list("id", flat=True))
+
+        consumed: list[dict] = []
+
+        if account_ids:
+            query = self._consume_query({"$in": account_ids}, validated)
+            consumed = self._claim(query, validated["limit"], str(request.user.pk), validated["wait"])
+            meta.update(self._poll_hint(query, len(consumed) < validated["limit"]))
+        else:
+            # No accounts to serve: answer at once and let the poll hint keep the caller from spinning.
+            meta.update({"remaining": 0, "next_poll_ms": settings.EVENT_POLL_MAX_MS})
 
         return self.reply(
             data=EventResource(consumed, many=True).data,
-            meta={"count": len(consumed)},
+            meta={"count": len(consumed), "accounts": account_ids, **meta},
+        )
+
+    def _consume_query(self, account_id: int | dict, validated: dict) -> dict[str, Any]:
+        query: dict[str, Any] = {"account_id": account_id}
+
+        if "key" in validated:
+            keys = validated["key"]
+            query["key"] = keys[0] if len(keys) == 1 else {"$in": keys}
+
+        if "symbol" in validated:
+            query["symbol"] = validated["symbol"]
+
+        if "strategy" in validated:
+            query["strategy"] = validated["strategy"]
+
+        return query
+
+    def _poll_hint(self, query: dict[str, Any], drained: bool) -> dict[str, int]:
+        """Suggest when to poll again: right away while work is left, later the longer the accounts sat idle.
+
+        A claim that came back short of its limit found nothing else claimable, whatever the counters say; they
+        also hold events only other `symbol` or `strategy` filters match.
+        """
+        now = timezone.now()
+        backlog = EventCounter.backlog(query)
+
+        if backlog[EventStatus.PENDING] and not drained:
+            return {"remaining": backlog[EventStatus.PENDING], "next_poll_ms": 0}
+
+        next_poll_ms = settings.EVENT_POLL_MAX_MS
+
+        if backlog["last_pushed_at"] is not None:
+            idle_ms = (now - backlog["last_pushed_at"]).total_seconds() * 1000
+            next_poll_ms = min(max(idle_ms / IDLE_BACKOFF_FACTOR, settings.EVENT_POLL_MIN_MS), next_poll_ms)
+
+        not_before = Event.next_scheduled(query["account_id"]) if backlog[EventStatus.SCHEDULED] else None
+
+        if not_before is not None:
+            next_poll_ms = min(next_poll_ms, max((not_before - now).total_seconds() * 1000, 0))
+
+        return {"remaining": 0, "next_poll_ms": int(next_poll_ms)}
+
+    def _claim(self, query: dict[str, Any], limit: int, consumer_id: str, wait: int) -> list[dict]:
+        consumed = Event.claim(query, limit, consumer_id)
+
+        if consumed or not wait:
+            return consumed
+
+        # Once every slot is taken the poll answers at once, leaving the other threads to pushes and acks.
+        if not long_poll_slots.acquire(blocking=False):
+            return consumed
+
+        try:
+            return self._wait_and_claim(query, limit, consumer_id, wait)
+
+        finally:
+            long_poll_slots.release()
+
+    def _wait_and_claim(self, query: dict[str, Any], limit: int, consumer_id: str, wait: int) -> list[dict]:
+        deadline = time.monotonic() + wait
+        signal_query = {
+            "account_id": query["account_id"],
+            "status": {"$in": list(CLAIMABLE_SIGNAL_STATUSES)},
+        }
+
+        with EventSignal.listen(signal_query) as cursor:
+            consumed = Event.claim(query, limit, consumer_id)
+
+            while not consumed:
+                wake_at = self._next_due(query["account_id"], deadline)
+
+                if not EventSignal.wait(cursor, wake_at) and (wake_at >= deadline or not cursor.alive):
+                    break
+
+                consumed = Event.claim(query, limit, consumer_id)
+
+        return consumed
+
+    def _next_due(self, account_id: int | dict, deadline: float) -> float:
+        not_before = Event.next_scheduled(account_id)
+
+        if not_before is None:
+            return deadline
+
+        return min(deadline, time.monotonic() + max((not_before - timezone.now()).total_seconds(), 0))
+
+    @action(detail=False, methods=["get"], url_path="stream")
+    def stream(self, request: Request, id: int) -> Response | StreamingHttpResponse:
+        self._validate_account(id)
+
+        serializer = StreamEventRequestSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        if not isinstance(request._request, ASGIRequest):
+            return self.reply(
+                message="Event streams are only served by the ASGI server.",
+                status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            )
+
+        validated = serializer.validated_data
+        consumer_id = str(request.user.pk) if validated["claim"] else None
+        response = StreamingHttpResponse(
+            self._stream(self._consume_query(id, validated), validated["limit"], consumer_id),
+            content_type="text/event-stream",
         )
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+
+        return response
+
+    async def _stream(self, query: dict[str, Any], limit: int, consumer_id: str | None) -> AsyncIterator[str]:
+        """Emit claimed events and the account's signals as Server-Sent Events until the stream times out.
+
+        Without a consumer the stream only relays state transitions. Claims are retried on every
+        heartbeat too, so expired leases and scheduled events due in between are still picked up.
+        """
+        account_id = query["account_id"]
+        deadline = time.monotonic() + STREAM_MAX_SECONDS
+        signals = event_notifier.subscribe(account_id)
+        claim = sync_to_async(Event.claim, thread_sensitive=False)
+        next_due = sync_to_async(self._next_due, thread_sensitive=False)
+        pending = consumer_id is not None
+
+        try:
+            yield f"retry: {STREAM_RETRY_MS}\n\n"
+
+            while time.monotonic() < deadline:
+                while pending:
+                    consumed = await claim(query, limit, consumer_id)
+
+                    for event in EventResource(consumed, many=True).data:
+                        yield _server_sent_event("event", event, event["id"])
+
+                    pending = len(consumed) == limit
+
+                wake_at = min(time.monotonic() + STREAM_HEARTBEAT_SECONDS, deadline)
+
+                if consumer_id is not None:
+                    wake_at = await next_due(account_id, wake_at)
+
+                try:
+                    signal = await asyncio.wait_for(signals.get(), timeout=max(wake_at - time.monotonic(), 0))
+
+                except TimeoutError:
+                    yield ": keep-alive\n\n"
+                    pending = consumer_id is not None
+                    continue
+
+                yield _server_sent_event(
+                    "status",
+                    {"status": signal["status"], "event_ids": [str(event_id) for event_id in signal["event_ids"]]},
+                )
+                pending = consumer_id is not None and signal["status"] in CLAIMABLE_SIGNAL_STATUSES
+
+        finally:
+            event_notifier.unsubscribe(account_id, signals)
 
     @action(detail=True, methods=["patch"], url_path="ack")
     def ack(self, request: Request, id: int, event_id: str) -> Response:
-        serializer = AckEventRequestSerializer(data={**request.data, "event_id": event_id})
+        serializer = AckEventRequestSerializer(
+            data={**request.data, "event_id": event_id}, context={"body_size": request_body_size(request)}
+        )
         serializer.is_valid(raise_exception=True)
 
         response_data = serializer.validated_data.get("response")
@@ -143,6 +494,7 @@ class EventController(BaseController):
 
         update_fields = {
             "status": EventStatus.PROCESSED,
+            "lease_expires_at": None,
             "processed_at": now,
             "updated_at": now,
         }
@@ -166,10 +518,38 @@ class EventController(BaseController):
                 status_code=status.HTTP_404_NOT_FOUND,
             )
 
+        EventCounter.move([event], EventStatus.DELIVERED, EventStatus.PROCESSED)
+        EventSignal.notify(id, EventStatus.PROCESSED, [event_id])
+
         return self.reply(
             data=EventResource(event).data,
         )
 
+    @action(detail=False, methods=["patch"], url_path="ack")
+    def ack_batch(self, request: Request, id: int) -> Response:
+        serializer = AckEventBatchRequestSerializer(
+            data=request.data, context={"body_size": request_body_size(request)}
+        )
+        serializer.is_valid(raise_exception=True)
+
+        result = Event.acknowledge(id, serializer.validated_data["events"])
+        processed = result["processed"]
+
+        if processed:
+            EventSignal.notify(id, EventStatus.PROCESSED, [event["_id"] for event in processed])
+
+        return self.reply(
+            data={
+                "processed": EventResource(processed, many=True).data,
+                "not_found": [str(event_id) for event_id in result["not_found"]],
+                "invalid_status": [str(event_id) for event_id in result["invalid_status"]],
+            },
+            meta={
+                "count": len(processed),
+                "failed": len(result["not_found"]) + len(result["invalid_status"]),
+            },
+        )
+
     @action(detail=False, methods=["get"], url_path="history")
     def history(self, request: Request, id: int) -> Response:
         self._validate_account(id)
@@ -177,36 +557,79 @@ class EventController(BaseController):
         serializer = HistoryEventRequestSerializer(data=request.query_params)
         serializer.is_valid(raise_exception=True)
 
-        limit = serializer.validated_data["limit"]
+        validated = serializer.validated_data
         query: dict[str, Any] = {"account_id": id}
+        sort = HISTORY_SORT
+
+        if "status" in validated:
+            query["status"] = validated["status"]
+
+        if "key" in validated:
+            query["key"] = validated["key"]
+
+        if "broadcast_id" in validated:
+            query["broadcast_id"] = validated["broadcast_id"]
+
+        if "after" in validated or "before" in validated:
+            query["seq"] = {}
+
+            if "after" in validated:
+                query["seq"]["$gt"] = validated["after"]
 
-        if "status" in serializer.validated_data:
-            query["status"] = serializer.validated_data["status"]
+            # Numbers still being written stay hidden, so resuming from `last_seq` never skips a late insert.
+            bounds = [bound for bound in (validated.get("before"), EventSequence.horizon(id)) if bound is not None]
 
-        if "key" in serializer.validated_data:
-            query["key"] = serializer.validated_data["key"]
+            if bounds:
+                query["seq"]["$lt"] = min(bounds)
 
-        events = list(Event.where(query).sort([("created_at", DESCENDING), ("_id", DESCENDING)]).limit(limit))
+            # Paging forward from `after` returns the oldest events first; paging back from `before` the newest.
+            sort = [("seq", ASCENDING if "after" in validated else DESCENDING)]
+
+        events = Event.history(query, validated["limit"], sort)
 
         return self.reply(
             data=EventResource(events, many=True).data,
+            meta={"count": len(events), "last_seq": events[-1].get("seq") if events else None},
         )
 
+    @action(detail=False, methods=["get"], url_path="stats")
+    def stats(self, _request: Request, id: int) -> Response:
+        self._validate_account(id)
+
+        return self.reply(data=EventCounter.for_account(id))
+
+    @action(detail=False, methods=["get"], url_path="stats")
+    def fleet_stats(self, _request: Request) -> Response:
+        return self.reply(data=EventCounter.fleet())
+
+    @action(detail=False, methods=["get"], url_path="latency")
+    def latency(self, request: Request) -> Response:
+        serializer = EventLatencyRequestSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        validated = serializer.validated_data
+        query = {field: validated[field] for field in ("account_id", "key") if field in validated}
+        hour = timezone.now().replace(minute=0, second=0, microsecond=0)
+
+        return self.reply(data=EventLatency.summary(query, hour - timedelta(hours=validated["hours"] - 1)))
+
     @action(detail=True, methods=["get"], url_path="response")
-    def response(self, _request: Request, id: int, event_id: str) -> Response:
+    def response(self, request: Request, id: int, event_id: str) -> Response:
         self._validate_account(id)
 
-        serializer = EventResponseRequestSerializer(data={"event_id": event_id})
+        serializer = EventResponseRequestSerializer(data={**request.query_params.dict(), "event_id": event_id})
         serializer.is_valid(raise_exception=True)
 
         event_id = serializer.validated_data["event_id"]
+        query = {"_id": event_id, "account_id": id}
+        wait = serializer.validated_data["wait"]
+        event = Event.find_with_archive(query)
 
-        event = Event.find_one(
-            {
-                "_id": event_id,
-                "account_id": id,
-            }
-        )
+        if wait and event is not None and event["status"] in AWAITING_RESPONSE_STATUSES:
+            event = self._wait_for_response(query, wait)
+
+        if event is None:
+            event = Event.find_with_archive(query) or EventDeadLetter.find_one(query)
 
         if event is None:
             return self.reply(
@@ -214,12 +637,49 @@ class EventController(BaseController):
                 status_code=status.HTTP_404_NOT_FOUND,
             )
 
+        if event["status"] == EventStatus.FAILED:
+            return self.reply(
+                message="Event failed and was moved to the dead-letter queue.",
+                status_code=status.HTTP_404_NOT_FOUND,
+                meta={"status": event["status"]},
+            )
+
+        # The status tells a caller whether to keep waiting or stop: only awaiting events can still get a response.
         if event.get("response") is None:
             return self.reply(
                 message="No response available for this event.",
                 status_code=status.HTTP_404_NOT_FOUND,
+                meta={"status": event["status"]},
             )
 
         return self.reply(
             data={"response": event["response"]},
         )
+
+    def _wait_for_response(self, query: dict[str, Any], wait: int) -> dict | None:
+        deadline = time.monotonic() + wait
+        signal_query = {
+            "account_id": query["account_id"],
+            "event_ids": query["_id"],
+            "status": {"$in": [EventStatus.PROCESSED, EventStatus.FAILED]},
+        }
+
+        with EventSignal.listen(signal_query) as cursor:
+            event = Event.find_one(query)
+
+            while event is not None and event["status"] in AWAITING_RESPONSE_STATUSES:
+                if not EventSignal.wait(cursor, deadline):
+                    break
+
+                event = Event.find_one(query)
+
+        return event
+
+
+def _server_sent_event(name: str, data: Any, event_id: str | None = None) -> str:
+    lines = [f"event: {name}", f"data: {json.dumps(data, cls=JSONEncoder)}"]
+
+    if event_id is not None:
+        lines.insert(0, f"id: {event_id}")
+
+    return "\n".join(lines) + "\n\n"
@@ -0,0 +1,153 @@
+from collections import Counter
+from typing import ClassVar, cast
+
+from bson import ObjectId
+from rest_framework import serializers, status
+from rest_framework.decorators import action
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from app.collections.event import Event
+from app.collections.event_counter import EventCounter
+from app.collections.event_signal import EventSignal
+from app.enums import EventStatus, SystemRole
+from app.http.controllers.base import BaseController
+from app.http.permissions.role import IsProducerOrRoot
+from app.http.requests.event.broadcast_event import (
+    MAX_BROADCAST_ACCOUNTS,
+    BroadcastEventRequestSerializer,
+    ShowBroadcastRequestSerializer,
+)
+from app.http.requests.validators import request_body_size
+from app.models import Account, Strategy
+from app.models.user import User
+
+
+class EventBroadcastController(BaseController):
+    permissions: ClassVar[dict] = {
+        "store": [IsProducerOrRoot],
+        "show": [IsProducerOrRoot],
+    }
+
+    @action(detail=False, methods=["post"], url_path="")
+    def store(self, request: Request) -> Response:
+        serializer = BroadcastEventRequestSerializer(
+            data=request.data, context={"body_size": request_body_size(request)}
+        )
+        serializer.is_valid(raise_exception=True)
+
+        validated = serializer.validated_data
+        user = cast("User", request.user)
+        account_ids = self._resolve_accounts(user, validated)
+        skipped = self._accounts_without_strategy(account_ids, validated["payload"].get("strategy"))
+        full = set(EventCounter.overflow([account_id for account_id in account_ids if account_id not in skipped]))
+        broadcast_id = ObjectId()
+        events = []
+
+        for account_id in account_ids:
+            if account_id in skipped or account_id in full:
+                continue
+
+            event = Event.build(account_id, str(user.pk), validated)
+            event["broadcast_id"] = broadcast_id
+            events.append(event)
+
+        if not events:
+            return self.reply(
+                message="No accounts matched the broadcast.",
+                status_code=status.HTTP_400_BAD_REQUEST,
+                meta={"skipped": sorted(skipped), "full": sorted(full)},
+            )
+
+        Event.insert_many(events)
+
+        for event_status in (EventStatus.PENDING, EventStatus.SCHEDULED):
+            EventSignal.notify_many(event_status, [event for event in events if event["status"] == event_status])
+
+        return self.reply(
+            data={
+                "broadcast_id": str(broadcast_id),
+                "events": [{"account_id": event["account_id"], "id": str(event["_id"])} for event in events],
+            },
+            status_code=status.HTTP_201_CREATED,
+            meta={"count": len(events), "skipped": sorted(skipped), "full": sorted(full)},
+        )
+
+    @action(detail=True, methods=["get"], url_path="")
+    def show(self, request: Request, broadcast_id: str) -> Response:
+        serializer = ShowBroadcastRequestSerializer(data={"broadcast_id": broadcast_id})
+        serializer.is_valid(raise_exception=True)
+
+        user = cast("User", request.user)
+        query: dict = {"broadcast_id": serializer.validated_data["broadcast_id"]}
+
+        if user.role != SystemRole.ROOT:
+            query["user_id"] = str(user.pk)
+
+        events = Event.find_broadcast(query)
+
+        if not events:
+            return self.reply(
+                message="Broadcast not found.",
+                status_code=status.HTTP_404_NOT_FOUND,
+            )
+
+        return self.reply(
+            data={
+                "broadcast_id": broadcast_id,
+                "key": events[0]["key"],
+                "statuses": dict(Counter(event["status"] for event in events)),
+                "events": [
+                    {
+                        "account_id": event["account_id"],
+                        "id": str(event["_id"]),
+                        "status": event["status"],
+                        "response": event.get("response"),
+                        "failure_reason": event.get("failure_reason"),
+                    }
+                    for event in events
+                ],
+            },
+            meta={"count": len(events)},
+        )
+
+    def _resolve_accounts(self, user: User, validated: dict) -> list[int]:
+        accounts = Account.objects.all()
+
+        # Producers can only broadcast to the accounts they own.
+        if user.role != SystemRole.ROOT:
+            accounts = accounts.filter(user=user)
+
+        if "accounts" in validated:
+            requested = set(validated["accounts"])
+            account_ids = set(accounts.filter(id__in=requested).values_list("id", flat=True))
+            unknown = sorted(requested - account_ids)
+
+            if unknown:
+                raise serializers.ValidationError(
+                    {"detail": f"Account(s) not found: {', '.join(str(account_id) for account_id in unknown)}."}
+                )
+
+            return sorted(account_ids)
+
+        matched = accounts.filter(**validated["filter"]).order_by("id").values_list("id", flat=True)
+        account_ids = list(matched[: MAX_BROADCAST_ACCOUNTS + 1])
+
+        if len(account_ids) > MAX_BROADCAST_ACCOUNTS:
+            raise serializers.ValidationError(
+                {"filter": f"Filter matches more than {MAX_BROADCAST_ACCOUNTS} accounts; narrow it down."}
+            )
+
+        return account_ids
+
+    def _accounts_without_strategy(self, account_ids: list[int], magic_number: int | None) -> set[int]:
+        if magic_number is None:
+            return set()
+
+        with_strategy = set(
+            Strategy.objects.filter(account_id__in=account_ids, magic_number=magic_number).values_list(
+                "account_id", flat=True
+            )
+        )
+
+        return set(account_ids) - with_strategy
@@ -0,0 +1,98 @@
+from typing import Any, ClassVar
+
+from django.utils import timezone
+from pymongo import DESCENDING
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from app.collections.event import Event
+from app.collections.event_counter import EventCounter
+from app.collections.event_dead_letter import EventDeadLetter
+from app.collections.event_signal import EventSignal
+from app.enums import EventStatus
+from app.http.controllers.base import BaseController
+from app.http.permissions.role import IsRoot
+from app.http.requests.event.list_dead_letter import ListDeadLetterRequestSerializer
+from app.http.requests.event.replay_dead_letter import ReplayDeadLetterRequestSerializer
+from app.http.resources.event import EventDeadLetterResource, EventResource
+
+DEAD_LETTER_FIELDS = ("dead_letter_id", "failure_reason", "last_error", "failed_at", "claim_id")
+
+
+class EventDeadLetterController(BaseController):
+    permissions: ClassVar[dict] = {
+        "index": [IsRoot],
+        "replay": [IsRoot],
+    }
+
+    @action(detail=False, methods=["get"], url_path="")
+    def index(self, request: Request) -> Response:
+        serializer = ListDeadLetterRequestSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        validated = serializer.validated_data
+        limit = validated["limit"]
+        query: dict[str, Any] = {}
+
+        if "cursor" in validated:
+            query["_id"] = {"$lt": validated["cursor"]}
+
+        if "account_id" in validated:
+            query["account_id"] = validated["account_id"]
+
+        if "key" in validated:
+            query["key"] = validated["key"]
+
+        events = list(EventDeadLetter.where(query).sort("_id", DESCENDING).limit(limit))
+        next_cursor = str(events[-1]["_id"]) if len(events) == limit else None
+
+        return self.reply(
+            data=EventDeadLetterResource(events, many=True).data,
+            meta={"count": len(events), "next_cursor": next_cursor},
+        )
+
+    @action(detail=True, methods=["post"], url_path="replay")
+    def replay(self, _request: Request, event_id: str) -> Response:
+        serializer = ReplayDeadLetterRequestSerializer(data={"event_id": event_id})
+        serializer.is_valid(raise_exception=True)
+
+        event_id = serializer.validated_data["event_id"]
+        event = EventDeadLetter.find_one({"_id": event_id})
+
+        if event is None:
+            return self.reply(
+                message="Dead-lettered event not found.",
+                status_code=status.HTTP_404_NOT_FOUND,
+            )
+
+        for field in DEAD_LETTER_FIELDS:
+            event.pop(field, None)
+
+        event.update(
+            {
+                "consumer_id": None,
+                "response": None,
+                "status": EventStatus.PENDING,
+                "delivered_at": None,
+                "lease_expires_at": None,
+                "processed_at": None,
+                "expires_at": None,
+                "attempts": 0,
+                "updated_at": timezone.now(),
+            }
+        )
+
+        Event.collection().replace_one({"_id": event_id}, event, upsert=True)
+        result = EventDeadLetter.delete_where({"_id": event_id})
+
+        # A concurrent replay of the same event already moved its count.
+        if result.deleted_count:
+            EventCounter.move([event], EventStatus.FAILED, EventStatus.PENDING)
+
+        EventSignal.notify(event["account_id"], EventStatus.PENDING, [event_id])
+
+        return self.reply(
+            data=EventResource(event).data,
+        )
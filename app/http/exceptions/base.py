@@ -10,7 +10,7 @@ from app.http.response import build_response
 
 
 def exception_handler(exception: Exception, context: dict[str, Any]) -> Response | None:
-    _ = drf_exception_handler(exception, context)
+    handled = drf_exception_handler(exception, context)
 
     if not isinstance(exception, APIException):
         return None
@@ -26,16 +26,22 @@ def exception_handler(exception: Exception, context: dict[str, Any]) -> Response
 
     if isinstance(exception, Throttled):
         wait = getattr(exception, "wait", None)
-        message = ExceptionMapping.THROTTLED.message
+        mapping = ExceptionMapping.from_exception(type(exception)) or ExceptionMapping.THROTTLED
+        message = mapping.message
 
         if wait is not None:
             message = f"{message} Try again in {int(wait)} seconds."
 
-        return build_response(
+        response = build_response(
             message=message,
-            status_code=ExceptionMapping.THROTTLED.status_code,
+            status_code=mapping.status_code,
         )
 
+        if handled is not None and "Retry-After" in handled:
+            response["Retry-After"] = handled["Retry-After"]
+
+        return response
+
     mapping = ExceptionMapping.from_exception(type(exception))
 
     return build_response(
@@ -0,0 +1,8 @@
+from rest_framework.exceptions import Throttled
+
+
+class QueueFull(Throttled):
+    """An account already holds the maximum number of events waiting to be consumed."""
+
+    default_detail = "Event queue is full."
+    default_code = "queue_full"
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, cast
 
+from rest_framework import serializers
+
 from app.enums import SystemRole
 from app.http.permissions.base import BaseAppPermission
 
@@ -57,6 +59,22 @@ class CanReadHistory(BaseAppPermission):
         return self.is_account_owner(user, account_id)
 
 
+class CanStreamEvents(BaseAppPermission):
+    """Root or platform, or account owner when only watching (claim=false)."""
+
+    def has_authenticated_permission(self, request: Request, view: APIView) -> bool:
+        user = cast("User", request.user)
+
+        if user.role in (SystemRole.ROOT, SystemRole.PLATFORM):
+            return True
+
+        if request.query_params.get("claim") not in serializers.BooleanField.FALSE_VALUES:
+            return False
+
+        account_id = view.kwargs.get("id")
+        return self.is_account_owner(user, account_id)
+
+
 class CanReadResponses(BaseAppPermission):
     """Root (unrestricted) or producer who owns the target account."""
 
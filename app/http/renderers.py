@@ -0,0 +1,8 @@
+from rest_framework.renderers import JSONRenderer
+
+
+class EventStreamRenderer(JSONRenderer):
+    """Accepts `text/event-stream` requests; anything rendered before the stream opens is still JSON."""
+
+    media_type = "text/event-stream"
+    format = "event-stream"
@@ -12,4 +12,4 @@ class AckEventRequestSerializer(serializers.Serializer):
         if value is None:
             return value
 
-        return validate_dict_payload(value)
+        return validate_dict_payload(value, self.context.get("body_size"))
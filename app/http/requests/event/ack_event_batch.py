@@ -0,0 +1,21 @@
+from rest_framework import serializers
+
+from app.http.requests.event.ack_event import AckEventRequestSerializer
+
+MAX_BATCH_SIZE = 100
+
+
+def validate_unique_acks(value: list[dict]) -> list[dict]:
+    event_ids = [ack["event_id"] for ack in value]
+
+    if len(set(event_ids)) != len(event_ids):
+        raise serializers.ValidationError("Each event can only be acknowledged once per request.")
+
+    return value
+
+
+class AckEventBatchRequestSerializer(serializers.Serializer):
+    events = serializers.ListField(child=AckEventRequestSerializer(), min_length=1, max_length=MAX_BATCH_SIZE)
+
+    def validate_events(self, value: list[dict]) -> list[dict]:
+        return validate_unique_acks(value)
@@ -0,0 +1,30 @@
+from rest_framework import serializers
+
+from app.enums import AccountStatus
+from app.http.requests.event.push_event import EventPayloadSerializer
+from app.http.requests.fields import ObjectIdField
+
+MAX_BROADCAST_ACCOUNTS = 1000
+
+
+class BroadcastAccountFilterSerializer(serializers.Serializer):
+    status = serializers.ChoiceField(choices=AccountStatus.choices, required=False)
+    broker = serializers.CharField(required=False)
+    server = serializers.CharField(required=False)
+
+
+class BroadcastEventRequestSerializer(EventPayloadSerializer):
+    accounts = serializers.ListField(
+        child=serializers.IntegerField(), min_length=1, max_length=MAX_BROADCAST_ACCOUNTS, required=False
+    )
+    filter = BroadcastAccountFilterSerializer(required=False)
+
+    def validate(self, attrs):
+        if ("accounts" in attrs) == ("filter" in attrs):
+            raise serializers.ValidationError({"detail": "Provide either accounts or filter."})
+
+        return super().validate(attrs)
+
+
+class ShowBroadcastRequestSerializer(serializers.Serializer):
+    broadcast_id = ObjectIdField()
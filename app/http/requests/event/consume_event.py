@@ -1,15 +1,22 @@
 from rest_framework import serializers
 
 from app.enums import EventKey
+from app.http.requests.event.ack_event import AckEventRequestSerializer
+from app.http.requests.event.ack_event_batch import MAX_BATCH_SIZE, validate_unique_acks
+from app.http.requests.fields import WaitSecondsField
 
 VALID_EVENT_KEYS = {k.value for k in EventKey}
+NAME_PATTERN = r"^[A-Za-z0-9_.:-]+$"
+MAX_CONSUME_ACCOUNTS = 100
+MAX_CONSUME_LIMIT = 100
 
 
 class ConsumeEventRequestSerializer(serializers.Serializer):
-    limit = serializers.IntegerField(default=50, min_value=1, max_value=100)
+    limit = serializers.IntegerField(default=50, min_value=1, max_value=MAX_CONSUME_LIMIT)
     key = serializers.CharField(required=False)
     symbol = serializers.CharField(required=False)
     strategy = serializers.IntegerField(required=False)
+    wait = WaitSecondsField()
 
     def validate_key(self, value: str) -> list[str]:
         keys = [k.strip() for k in value.split(",") if k.strip()]
@@ -21,3 +28,40 @@ class ConsumeEventRequestSerializer(serializers.Serializer):
             )
 
         return keys
+
+
+class ConsumeAcksRequestSerializer(serializers.Serializer):
+    acks = serializers.ListField(child=AckEventRequestSerializer(), max_length=MAX_BATCH_SIZE, required=False)
+
+    def validate_acks(self, value: list[dict]) -> list[dict]:
+        return validate_unique_acks(value)
+
+
+class ConsumeAccountsEventRequestSerializer(ConsumeEventRequestSerializer):
+    accounts = serializers.CharField(required=False)
+    group = serializers.RegexField(regex=NAME_PATTERN, max_length=64, required=False)
+    consumer = serializers.RegexField(regex=NAME_PATTERN, max_length=64, required=False)
+
+    def validate_accounts(self, value: str) -> list[int]:
+        try:
+            accounts = sorted({int(account_id) for account_id in value.split(",") if account_id.strip()})
+
+        except ValueError as error:
+            raise serializers.ValidationError("Must be a comma-separated list of account IDs.") from error
+
+        if not accounts:
+            raise serializers.ValidationError("At least one account ID is required.")
+
+        if len(accounts) > MAX_CONSUME_ACCOUNTS:
+            raise serializers.ValidationError(f"Ensure this field has no more than {MAX_CONSUME_ACCOUNTS} accounts.")
+
+        return accounts
+
+    def validate(self, attrs):
+        if ("group" in attrs) != ("consumer" in attrs):
+            raise serializers.ValidationError({"detail": "group and consumer must be given together."})
+
+        if "group" in attrs and "accounts" in attrs:
+            raise serializers.ValidationError({"detail": "accounts cannot be combined with group."})
+
+        return attrs
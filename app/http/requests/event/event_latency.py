@@ -0,0 +1,14 @@
+from rest_framework import serializers
+
+from app.enums import EventKey
+
+MAX_LATENCY_HOURS = 90 * 24
+
+
+class EventLatencyRequestSerializer(serializers.Serializer):
+    hours = serializers.IntegerField(default=24, min_value=1, max_value=MAX_LATENCY_HOURS)
+    account_id = serializers.IntegerField(required=False)
+    key = serializers.ChoiceField(
+        choices=[(k.value, k.name) for k in EventKey],
+        required=False,
+    )
@@ -1,7 +1,8 @@
 from rest_framework import serializers
 
-from app.http.requests.fields import ObjectIdField
+from app.http.requests.fields import ObjectIdField, WaitSecondsField
 
 
 class EventResponseRequestSerializer(serializers.Serializer):
     event_id = ObjectIdField()
+    wait = WaitSecondsField()
@@ -1,6 +1,7 @@
 from rest_framework import serializers
 
 from app.enums import EventKey, EventStatus
+from app.http.requests.fields import ObjectIdField
 
 
 class HistoryEventRequestSerializer(serializers.Serializer):
@@ -13,3 +14,12 @@ class HistoryEventRequestSerializer(serializers.Serializer):
         choices=[(k.value, k.name) for k in EventKey],
         required=False,
     )
+    broadcast_id = ObjectIdField(required=False)
+    after = serializers.IntegerField(min_value=0, required=False)
+    before = serializers.IntegerField(min_value=1, required=False)
+
+    def validate(self, attrs):
+        if "after" in attrs and "before" in attrs and attrs["after"] >= attrs["before"]:
+            raise serializers.ValidationError({"detail": "before must be greater than after."})
+
+        return attrs
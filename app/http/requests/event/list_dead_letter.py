@@ -0,0 +1,14 @@
+from rest_framework import serializers
+
+from app.enums import EventKey
+from app.http.requests.fields import ObjectIdField
+
+
+class ListDeadLetterRequestSerializer(serializers.Serializer):
+    limit = serializers.IntegerField(default=50, min_value=1, max_value=100)
+    cursor = ObjectIdField(required=False)
+    account_id = serializers.IntegerField(required=False)
+    key = serializers.ChoiceField(
+        choices=[(k.value, k.name) for k in EventKey],
+        required=False,
+    )
@@ -0,0 +1,210 @@
+import math
+import re
+from collections.abc import Callable
+from typing import Any
+
+from rest_framework import serializers
+from rest_framework.exceptions import ErrorDetail
+
+from app.enums import EventKey
+
+MAX_STRING_LENGTH = 1000
+DECIMAL_SUFFIX = re.compile(r"\.0*\s*$")
+SURROGATE_FIRST = 0xD800
+SURROGATE_LAST = 0xDFFF
+
+MISSING = object()
+
+Check = Callable[[Any], ErrorDetail | None]
+
+
+def _fail(message: str, code: str) -> serializers.ValidationError:
+    return serializers.ValidationError(message, code=code)
+
+
+def _to_string(value: Any) -> str:
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        raise _fail("Not a valid string.", "invalid")
+
+    return str(value).strip()
+
+
+def _to_integer(value: Any) -> int:
+    if type(value) is int:
+        return value
+
+    if isinstance(value, str) and len(value) > MAX_STRING_LENGTH:
+        raise _fail("String value too large.", "max_string_length")
+
+    try:
+        return int(DECIMAL_SUFFIX.sub("", str(value)))
+
+    except (ValueError, TypeError) as error:
+        raise _fail("A valid integer is required.", "invalid") from error
+
+
+def _to_float(value: Any) -> float:
+    if type(value) is float and math.isfinite(value):
+        return value
+
+    if isinstance(value, str) and len(value) > MAX_STRING_LENGTH:
+        raise _fail("String value too large.", "max_string_length")
+
+    try:
+        number = float(value)
+
+    except (TypeError, ValueError) as error:
+        raise _fail("A valid number is required.", "invalid") from error
+
+    except OverflowError as error:
+        raise _fail("Integer value too large to convert to float", "overflow") from error
+
+    if not math.isfinite(number):
+        raise _fail("A valid number is required.", "invalid")
+
+    return number
+
+
+def _to_choice(choices: list[str]) -> Callable[[Any], str]:
+    values = {str(choice): choice for choice in choices}
+
+    def convert(value: Any) -> str:
+        try:
+            return values[str(value)]
+
+        except KeyError as error:
+            raise _fail(f'"{value}" is not a valid choice.', "invalid_choice") from error
+
+    return convert
+
+
+def _max_length(limit: int) -> Check:
+    message = ErrorDetail(f"Ensure this field has no more than {limit} characters.", code="max_length")
+
+    return lambda value: message if len(value) > limit else None
+
+
+def _max_value(limit: float) -> Check:
+    message = ErrorDetail(f"Ensure this value is less than or equal to {limit}.", code="max_value")
+
+    return lambda value: message if value > limit else None
+
+
+def _min_value(limit: float) -> Check:
+    message = ErrorDetail(f"Ensure this value is greater than or equal to {limit}.", code="min_value")
+
+    return lambda value: message if value < limit else None
+
+
+def _no_null_characters(value: str) -> ErrorDetail | None:
+    if "\x00" in value:
+        return ErrorDetail("Null characters are not allowed.", code="null_characters_not_allowed")
+
+    return None
+
+
+def _no_surrogate_characters(value: str) -> ErrorDetail | None:
+    if value.isascii():
+        return None
+
+    for character in value:
+        if SURROGATE_FIRST <= ord(character) <= SURROGATE_LAST:
+            return ErrorDetail(
+                f"Surrogate characters are not allowed: U+{ord(character):X}.",
+                code="surrogate_characters_not_allowed",
+            )
+
+    return None
+
+
+CONVERTERS: dict[str, Callable[[Any], Any]] = {
+    "string": _to_string,
+    "integer": _to_integer,
+    "float": _to_float,
+}
+
+
+class FieldValidator:
+    """Mirrors the DRF field the schema definition used to build, without instantiating it per request."""
+
+    __slots__ = ("allow_null", "checks", "convert", "default", "is_string", "required")
+
+    def __init__(self, definition: dict) -> None:
+        self.required = definition.get("required", False)
+        self.default = None if self.required else definition.get("default")
+        self.allow_null = not self.required and self.default is None
+        self.is_string = definition["type"] == "string" and "choices" not in definition
+        self.checks: list[Check] = []
+
+        if "choices" in definition:
+            self.convert = _to_choice(definition["choices"])
+        else:
+            self.convert = CONVERTERS[definition["type"]]
+
+        if "max_value" in definition:
+            self.checks.append(_max_value(definition["max_value"]))
+
+        if "min_value" in definition:
+            self.checks.append(_min_value(definition["min_value"]))
+
+        if "max_length" in definition:
+            self.checks.append(_max_length(definition["max_length"]))
+
+        if self.is_string:
+            self.checks.extend([_no_null_characters, _no_surrogate_characters])
+
+    def validate(self, value: Any) -> Any:
+        if self.is_string and value is not MISSING and (value == "" or str(value).strip() == ""):
+            raise _fail("This field may not be blank.", "blank")
+
+        if value is MISSING:
+            if self.required:
+                raise _fail("This field is required.", "required")
+
+            return self.default
+
+        if value is None:
+            if not self.allow_null:
+                raise _fail("This field may not be null.", "null")
+
+            return None
+
+        value = self.convert(value)
+        errors = [error for check in self.checks if (error := check(value)) is not None]
+
+        if errors:
+            raise serializers.ValidationError(errors)
+
+        return value
+
+
+class PayloadValidator:
+    __slots__ = ("fields",)
+
+    def __init__(self, schema: dict) -> None:
+        self.fields = tuple((name, FieldValidator(definition)) for name, definition in schema.items())
+
+    def validate(self, payload: dict) -> dict:
+        validated = {}
+        errors = {}
+
+        for name, field in self.fields:
+            try:
+                value = field.validate(payload.get(name, MISSING))
+
+            except serializers.ValidationError as error:
+                errors[name] = error.detail
+                continue
+
+            if value is not None:
+                validated[name] = value
+
+        if errors:
+            raise serializers.ValidationError(errors)
+
+        return validated
+
+
+PAYLOAD_VALIDATORS: dict[EventKey, PayloadValidator] = {
+    event_key: PayloadValidator(event_key.schema()) for event_key in EventKey
+}
@@ -1,16 +1,32 @@
 from rest_framework import serializers
 
 from app.enums import EventKey
+from app.enums.event_key import MAX_PRIORITY
+from app.http.requests.event.payload_validator import PAYLOAD_VALIDATORS
 from app.http.requests.validators import validate_dict_payload
 from app.models import Account, Strategy
 
+MAX_TTL_SECONDS = 604800
 
-class PushEventRequestSerializer(serializers.Serializer):
+
+class EventPayloadSerializer(serializers.Serializer):
     key = serializers.ChoiceField(choices=[(event_key.value, event_key.name) for event_key in EventKey])
     payload = serializers.DictField()
+    ttl_seconds = serializers.IntegerField(required=False, min_value=1, max_value=MAX_TTL_SECONDS)
+    not_before = serializers.DateTimeField(required=False)
+    priority = serializers.IntegerField(required=False, min_value=0, max_value=MAX_PRIORITY)
 
     def validate_payload(self, value):
-        return validate_dict_payload(value)
+        return validate_dict_payload(value, self.context.get("body_size"))
+
+    def validate(self, attrs):
+        attrs["payload"] = PAYLOAD_VALIDATORS[EventKey(attrs["key"])].validate(attrs["payload"])
+
+        return attrs
+
+
+class PushEventRequestSerializer(EventPayloadSerializer):
+    idempotency_key = serializers.CharField(required=False, max_length=255)
 
     def validate(self, attrs):
         account_id = self.context["account_id"]
@@ -18,11 +34,7 @@ class PushEventRequestSerializer(serializers.Serializer):
         if not Account.objects.filter(id=account_id).exists():
             raise serializers.ValidationError({"detail": "Account not found."})
 
-        event_key = EventKey(attrs["key"])
-        serializer_class = event_key.serializer()
-        serializer = serializer_class(data=attrs["payload"])
-        serializer.is_valid(raise_exception=True)
-        attrs["payload"] = {k: v for k, v in serializer.validated_data.items() if v is not None}
+        attrs = super().validate(attrs)
 
         magic_number = attrs["payload"].get("strategy")
         if (
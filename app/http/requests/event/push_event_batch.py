@@ -0,0 +1,58 @@
+from rest_framework import serializers
+
+from app.http.requests.event.push_event import EventPayloadSerializer
+from app.models import Account, Strategy
+
+MAX_BATCH_SIZE = 100
+
+
+class PushEventBatchItemSerializer(EventPayloadSerializer):
+    idempotency_key = serializers.CharField(required=False, max_length=255)
+
+
+class PushEventBatchRequestSerializer(serializers.Serializer):
+    events = serializers.ListField(child=serializers.DictField(), min_length=1, max_length=MAX_BATCH_SIZE)
+
+    def validate(self, attrs):
+        account_id = self.context["account_id"]
+
+        if not Account.objects.filter(id=account_id).exists():
+            raise serializers.ValidationError({"detail": "Account not found."})
+
+        items = []
+
+        for item in attrs["events"]:
+            serializer = PushEventBatchItemSerializer(data=item, context=self.context)
+
+            if serializer.is_valid():
+                items.append({"data": serializer.validated_data, "errors": None})
+            else:
+                items.append({"data": None, "errors": serializer.errors})
+
+        magic_numbers = {
+            item["data"]["payload"]["strategy"]
+            for item in items
+            if item["data"] is not None and item["data"]["payload"].get("strategy") is not None
+        }
+
+        if magic_numbers:
+            known = set(
+                Strategy.objects.filter(account_id=account_id, magic_number__in=magic_numbers).values_list(
+                    "magic_number", flat=True
+                )
+            )
+
+            for item in items:
+                magic_number = item["data"]["payload"].get("strategy") if item["data"] is not None else None
+
+                if magic_number is not None and magic_number not in known:
+                    item["data"] = None
+                    item["errors"] = {
+                        "payload": {
+                            "strategy": f"Strategy with magic number {magic_number} not found for this account."
+                        }
+                    }
+
+        attrs["events"] = items
+
+        return attrs
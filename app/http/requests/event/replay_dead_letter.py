@@ -0,0 +1,7 @@
+from rest_framework import serializers
+
+from app.http.requests.fields import ObjectIdField
+
+
+class ReplayDeadLetterRequestSerializer(serializers.Serializer):
+    event_id = ObjectIdField()
@@ -0,0 +1,8 @@
+from rest_framework import serializers
+
+from app.http.requests.event.consume_event import ConsumeEventRequestSerializer
+
+
+class StreamEventRequestSerializer(ConsumeEventRequestSerializer):
+    wait = None
+    claim = serializers.BooleanField(default=True)
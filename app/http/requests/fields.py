@@ -3,6 +3,8 @@ from bson.errors import InvalidId
 from django.core.validators import RegexValidator
 from rest_framework import serializers
 
+MAX_WAIT_SECONDS = 30
+
 
 class ObjectIdField(serializers.CharField):
     def __init__(self, **kwargs):
@@ -22,3 +24,11 @@ class ObjectIdField(serializers.CharField):
 
         except (InvalidId, TypeError) as error:
             raise serializers.ValidationError("Invalid ObjectId format.") from error
+
+
+class WaitSecondsField(serializers.IntegerField):
+    def __init__(self, **kwargs):
+        kwargs.setdefault("default", 0)
+        kwargs.setdefault("min_value", 0)
+        kwargs.setdefault("max_value", MAX_WAIT_SECONDS)
+        super().__init__(**kwargs)
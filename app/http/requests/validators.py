@@ -1,29 +1,158 @@
 import json
+from json.encoder import encode_basestring_ascii
+from math import isfinite
 
 from rest_framework import serializers
+from rest_framework.request import Request
 
 MAX_PAYLOAD_SIZE = 65536
 MAX_NESTING_DEPTH = 5
 
+# json.dumps output is at most this many times longer than the JSON text it was parsed from
+# (e.g. `1e15` -> `1000000000000000.0`, or a 2-byte UTF-8 character -> a 6-byte `\uXXXX` escape).
+MAX_SIZE_EXPANSION = 6
 
-def check_nesting_depth(data, current_depth=0):
-    if current_depth > MAX_NESTING_DEPTH:
-        raise serializers.ValidationError(f"Payload nesting depth exceeds maximum of {MAX_NESTING_DEPTH} levels.")
+NULL_TRUE_SIZE = 4
+FALSE_SIZE = 5
 
-    if isinstance(data, dict):
-        for value in data.values():
-            check_nesting_depth(value, current_depth + 1)
 
-    elif isinstance(data, list):
-        for item in data:
-            check_nesting_depth(item, current_depth + 1)
+def request_body_size(request: Request) -> int | None:
+    content_length = request.META.get("CONTENT_LENGTH")
 
+    if not content_length or not request.content_type.startswith("application/json"):
+        return None
 
-def validate_dict_payload(value):
-    serialized = json.dumps(value)
+    return int(content_length)
 
-    if len(serialized.encode()) > MAX_PAYLOAD_SIZE:
-        raise serializers.ValidationError(f"Payload size exceeds maximum of {MAX_PAYLOAD_SIZE} bytes.")
 
-    check_nesting_depth(value)
+def _float_string(value: float) -> str:
+    if value != value:  # noqa: PLR0124
+        return "NaN"
+
+    if value in (float("inf"), float("-inf")):
+        return "Infinity" if value > 0 else "-Infinity"
+
+    return float.__repr__(value)
+
+
+def _key_size(key) -> int:
+    if isinstance(key, str):
+        return len(encode_basestring_ascii(key))
+
+    if key is True or key is False or key is None:
+        return len(encode_basestring_ascii(json.dumps(key)))
+
+    if isinstance(key, float):
+        return len(encode_basestring_ascii(_float_string(key)))
+
+    if isinstance(key, int):
+        return len(int.__repr__(key)) + 2
+
+    raise TypeError(f"keys must be str, int, float, bool or None, not {key.__class__.__name__}")
+
+
+def _scalar_size(value) -> int:
+    if isinstance(value, str):
+        return len(encode_basestring_ascii(value))
+
+    if value is None or value is True:
+        return NULL_TRUE_SIZE
+
+    if value is False:
+        return FALSE_SIZE
+
+    if isinstance(value, int):
+        return len(int.__repr__(value))
+
+    if isinstance(value, float):
+        return len(_float_string(value))
+
+    return len(json.dumps(value))
+
+
+def _keys_size(node: dict) -> int:
+    try:
+        return sum(map(len, map(encode_basestring_ascii, node)))
+
+    except TypeError:
+        return sum(_key_size(key) for key in node)
+
+
+def _container_size(node: dict | list) -> int:
+    if not node:
+        return 2
+
+    if isinstance(node, dict):
+        return 4 * len(node) + _keys_size(node)
+
+    return 2 * len(node)
+
+
+def _children(node: dict | list):
+    return node.values() if isinstance(node, dict) else node
+
+
+def _size_error() -> serializers.ValidationError:
+    return serializers.ValidationError(f"Payload size exceeds maximum of {MAX_PAYLOAD_SIZE} bytes.")
+
+
+def _depth_error() -> serializers.ValidationError:
+    return serializers.ValidationError(f"Payload nesting depth exceeds maximum of {MAX_NESTING_DEPTH} levels.")
+
+
+def _check_depth(value: dict) -> None:
+    level = [value]
+
+    for _ in range(MAX_NESTING_DEPTH):
+        level = [child for node in level for child in _children(node) if isinstance(child, (dict, list))]
+
+    # Anything inside a non-empty container at the maximum depth is nested too deep.
+    if any(level):
+        raise _depth_error()
+
+
+def validate_dict_payload(value, body_size: int | None = None):
+    """Check the json.dumps size and the nesting depth of a parsed payload in one pass.
+
+    The size is counted without serializing and the walk stops as soon as it exceeds the limit. When
+    the raw request body is too small for its re-serialization to reach the limit, only depth is checked.
+    """
+    if body_size is not None and body_size * MAX_SIZE_EXPANSION <= MAX_PAYLOAD_SIZE:
+        _check_depth(value)
+
+        return value
+
+    size = 0
+    too_deep = False
+    stack = [(value, 0)]
+
+    while stack:
+        node, depth = stack.pop()
+
+        if depth >= MAX_NESTING_DEPTH and node:
+            too_deep = True
+
+        size += _container_size(node)
+        depth += 1
+
+        for child in _children(node):
+            kind = type(child)
+
+            if kind is str:
+                size += len(encode_basestring_ascii(child))
+            elif kind is float and isfinite(child):
+                size += len(float.__repr__(child))
+            elif kind is int:
+                size += len(int.__repr__(child))
+            elif isinstance(child, (dict, list)):
+                stack.append((child, depth))
+            else:
+                size += _scalar_size(child)
+
+        if size > MAX_PAYLOAD_SIZE:
+            raise _size_error()
+
+    if too_deep:
+        raise _depth_error()
+
     return value
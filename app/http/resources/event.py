@@ -3,18 +3,30 @@ from rest_framework import serializers
 
 class EventResource(serializers.Serializer):
     id = serializers.SerializerMethodField()
+    seq = serializers.IntegerField(allow_null=True, default=None)
     consumer_id = serializers.CharField(allow_null=True)
     account_id = serializers.CharField()
     user_id = serializers.CharField()
     key = serializers.CharField()
+    broadcast_id = serializers.CharField(allow_null=True, default=None)
     payload = serializers.DictField()
+    priority = serializers.IntegerField(default=0)
     response = serializers.DictField(allow_null=True)
     status = serializers.CharField()
+    not_before = serializers.DateTimeField(allow_null=True, default=None)
     delivered_at = serializers.DateTimeField(allow_null=True)
+    lease_expires_at = serializers.DateTimeField(allow_null=True)
     processed_at = serializers.DateTimeField(allow_null=True)
+    expires_at = serializers.DateTimeField(allow_null=True, default=None)
     attempts = serializers.IntegerField()
     created_at = serializers.DateTimeField()
     updated_at = serializers.DateTimeField()
 
     def get_id(self, obj):
         return str(obj["_id"])
+
+
+class EventDeadLetterResource(EventResource):
+    failure_reason = serializers.CharField()
+    last_error = serializers.CharField(allow_null=True)
+    failed_at = serializers.DateTimeField()
@@ -0,0 +1,31 @@
+from datetime import timedelta
+
+import structlog
+from django.utils import timezone
+
+from app.collections.event import ARCHIVE_BATCH_SIZE, Event
+
+logger = structlog.get_logger("scheduler")
+
+ARCHIVE_DELAY_SECONDS = 60
+
+
+def run():
+    logger.info("job_started", job="archive_events")
+    before = timezone.now() - timedelta(seconds=ARCHIVE_DELAY_SECONDS)
+    archived_count = 0
+
+    while True:
+        archived = Event.archive(before)
+        archived_count += archived
+
+        if archived < ARCHIVE_BATCH_SIZE:
+            break
+
+    logger.info(
+        "job_completed",
+        job="archive_events",
+        collection="events",
+        archived_count=archived_count,
+        delay_seconds=ARCHIVE_DELAY_SECONDS,
+    )
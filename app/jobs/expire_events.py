@@ -0,0 +1,21 @@
+import structlog
+from django.utils import timezone
+
+from app.collections.event import EXPIRE_BATCH_SIZE, Event
+
+logger = structlog.get_logger("scheduler")
+
+
+def run():
+    logger.info("job_started", job="expire_events")
+    now = timezone.now()
+    expired_count = 0
+
+    while True:
+        expired = Event.expire(now)
+        expired_count += expired
+
+        if expired < EXPIRE_BATCH_SIZE:
+            break
+
+    logger.info("job_completed", job="expire_events", collection="events", expired_count=expired_count)
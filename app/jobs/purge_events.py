@@ -3,8 +3,8 @@ from datetime import timedelta
 import structlog
 from django.utils import timezone
 
-from app.collections.event import Event
-from app.enums import EventStatus
+from app.collections.event_archive import EventArchive
+from app.collections.event_dead_letter import EventDeadLetter
 
 logger = structlog.get_logger("scheduler")
 
@@ -14,17 +14,14 @@ RETENTION_DAYS = 90
 def run():
     logger.info("job_started", job="purge_events")
     cutoff = timezone.now() - timedelta(days=RETENTION_DAYS)
-    query = {
-        "status": {"$in": [EventStatus.PROCESSED, EventStatus.FAILED]},
-        "created_at": {"$lt": cutoff},
-    }
-
-    result = Event.delete_where(query)
-
-    logger.info(
-        "job_completed",
-        job="purge_events",
-        collection="events",
-        deleted_count=result.deleted_count,
-        retention_days=RETENTION_DAYS,
-    )
+
+    for document in (EventArchive, EventDeadLetter):
+        deleted_count = document.purge(cutoff)
+
+        logger.info(
+            "job_completed",
+            job="purge_events",
+            collection=document.collection_name,
+            deleted_count=deleted_count,
+            retention_days=RETENTION_DAYS,
+        )
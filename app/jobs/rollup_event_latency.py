@@ -0,0 +1,23 @@
+from datetime import timedelta
+
+import structlog
+from django.utils import timezone
+
+from app.collections.event_latency import EventLatency
+
+logger = structlog.get_logger("scheduler")
+
+ROLLUP_DELAY_SECONDS = 5
+
+
+def run():
+    logger.info("job_started", job="rollup_event_latency")
+    until = timezone.now() - timedelta(seconds=ROLLUP_DELAY_SECONDS)
+    recorded_count = EventLatency.rollup(until)
+
+    logger.info(
+        "job_completed",
+        job="rollup_event_latency",
+        collection="event_latencies",
+        recorded_count=recorded_count,
+    )
@@ -0,0 +1,41 @@
+import math
+import time
+from collections.abc import Callable
+
+from django.core.management.base import BaseCommand, CommandParser
+
+DEFAULT_RUNS = 50
+
+
+class BaseBenchmarkCommand(BaseCommand):
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help=f"Runs per case (default: {DEFAULT_RUNS})")
+
+    def measure(self, run: Callable[[], object], runs: int, setup: Callable[[], object] | None = None) -> list[float]:
+        samples: list[float] = []
+
+        for _ in range(runs):
+            if setup is not None:
+                setup()
+
+            started = time.perf_counter()
+            run()
+            samples.append((time.perf_counter() - started) * 1000)
+
+        return samples
+
+    @staticmethod
+    def percentile(samples: list[float], percent: float) -> float:
+        ordered = sorted(samples)
+        rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+
+        return ordered[rank - 1]
+
+    def write_header(self) -> None:
+        self.stdout.write(f"{'case':<40} {'runs':>6} {'p50 ms':>10} {'p99 ms':>10} {'ops/s @p50':>12}")
+
+    def write_row(self, case: str, samples: list[float], operations: int = 1) -> None:
+        p50 = self.percentile(samples, 50)
+        p99 = self.percentile(samples, 99)
+        throughput = operations / (p50 / 1000) if p50 else 0.0
+        self.stdout.write(f"{case:<40} {len(samples):>6} {p50:>10.3f} {p99:>10.3f} {throughput:>12.1f}")
@@ -1,14 +1,16 @@
 import json
 import os
-import time
 
 import requests
 from django.core.management.base import BaseCommand
 
+from app.enums import EventStatus
+
 from ._event_api_client import EventApiClient
 
-MAX_POLL_ITERATIONS = 60
-POLL_INTERVAL_SECONDS = 1
+AWAITING_RESPONSE_STATUSES = (EventStatus.SCHEDULED, EventStatus.PENDING, EventStatus.DELIVERED)
+MAX_POLL_ITERATIONS = 2
+POLL_WAIT_SECONDS = 30
 
 
 class BaseEventCommand(BaseCommand):
@@ -45,18 +47,27 @@ class BaseEventCommand(BaseCommand):
         event_id = event["id"]
 
         self.stdout.write(f"\nEvent pushed  id={event_id}  key={event['key']}  status={event['status']}")
-        self.stdout.write("Polling for response...\n")
+        result = self.wait_for_response(client, account_id, event_id)
+
+        if result is not None:
+            self.print_json(result["data"])
+
+    def wait_for_response(self, client: EventApiClient, account_id: int, event_id: str) -> dict | None:
+        self.stdout.write("Waiting for response...\n")
 
         for attempt in range(1, MAX_POLL_ITERATIONS + 1):
-            time.sleep(POLL_INTERVAL_SECONDS)
-            result = client.poll_event_response(account_id, event_id)
-            if result is not None:
+            result = client.poll_event_response(account_id, event_id, wait=POLL_WAIT_SECONDS)
+            if result["success"]:
                 self.stdout.write(self.style.SUCCESS(f"Response received (attempt {attempt}/{MAX_POLL_ITERATIONS}):"))
-                self.print_json(result["data"])
-                return
-            self.stdout.write(f"  [{attempt}/{MAX_POLL_ITERATIONS}] no response yet")
+                return result
+            event_status = result.get("meta", {}).get("status")
+            if event_status not in AWAITING_RESPONSE_STATUSES:
+                self.stdout.write(self.style.ERROR(f"\n{result['message']} (status={event_status or 'gone'})"))
+                return None
+            self.stdout.write(f"  [{attempt}/{MAX_POLL_ITERATIONS}] no response yet (status={event_status})")
 
-        self.stdout.write(self.style.WARNING(f"\nNo response after {MAX_POLL_ITERATIONS} attempts."))
+        self.stdout.write(self.style.WARNING(f"\nNo response after {MAX_POLL_ITERATIONS * POLL_WAIT_SECONDS} seconds."))
+        return None
 
     def print_json(self, data) -> None:
         self.stdout.write(json.dumps(data, indent=2))
@@ -29,12 +29,12 @@ class EventApiClient:
         response.raise_for_status()
         return response.json()
 
-    def poll_event_response(self, account_id: int, event_id: str) -> dict | None:
+    def poll_event_response(self, account_id: int, event_id: str, wait: int = 0) -> dict:
         url = f"{self.base_url}/api/v1/account/{account_id}/event/{event_id}/response/"
-        response = self.session.get(url)
-        if response.status_code == requests.codes.ok:
-            return response.json()
-        return None
+        response = self.session.get(url, params={"wait": wait}, timeout=wait + 30)
+        if response.status_code not in (requests.codes.ok, requests.codes.not_found):
+            response.raise_for_status()
+        return response.json()
 
     def list_accounts(self) -> dict:
         url = f"{self.base_url}/api/v1/accounts/"
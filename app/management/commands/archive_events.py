@@ -0,0 +1,30 @@
+from datetime import timedelta
+
+import structlog
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from app.collections.event import ARCHIVE_BATCH_SIZE, Event
+
+logger = structlog.get_logger("archive")
+
+ARCHIVE_DELAY_SECONDS = 60
+
+
+class Command(BaseCommand):
+    help = "Move processed/failed events older than 60 seconds to the events archive"
+
+    def handle(self, *_args, **_options) -> None:
+        before = timezone.now() - timedelta(seconds=ARCHIVE_DELAY_SECONDS)
+        archived_count = 0
+
+        while True:
+            archived = Event.archive(before)
+            archived_count += archived
+
+            if archived < ARCHIVE_BATCH_SIZE:
+                break
+
+        logger.info(
+            "archive_completed", collection="events", archived_count=archived_count, delay_seconds=ARCHIVE_DELAY_SECONDS
+        )
@@ -0,0 +1,16 @@
+import structlog
+from django.core.management.base import BaseCommand
+
+from app.collections.event import Event
+
+logger = structlog.get_logger("backfill")
+
+
+class Command(BaseCommand):
+    help = "Fill event fields added after events were already stored, so older events are queued like new ones"
+
+    def handle(self, *_args, **_options) -> None:
+        leases = Event.backfill_leases()
+        priorities = Event.backfill_priorities()
+
+        logger.info("backfill_completed", collection="events", leases=leases, priorities=priorities)
@@ -0,0 +1,96 @@
+from functools import partial
+
+from django.core.management.base import CommandParser
+from django.utils import timezone
+
+from app.collections.event import CLAIM_SORT, Event
+from app.collections.event_counter import EventCounter
+from app.collections.event_sequence import EventSequence
+from app.collections.event_signal import EventSignal
+from app.enums import EventStatus
+
+from ._base_benchmark_command import BaseBenchmarkCommand
+
+BATCH_SIZES = (10, 50, 100)
+BENCHMARK_ACCOUNT_ID = -1
+BENCHMARK_CONSUMER_ID = "benchmark"
+
+
+class Command(BaseBenchmarkCommand):
+    help = "Compare p50/p99 consume latency of the per-document claim loop against the batch claim"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--account-id",
+            type=int,
+            default=BENCHMARK_ACCOUNT_ID,
+            help=f"Scratch account ID, its events are deleted (default: {BENCHMARK_ACCOUNT_ID})",
+        )
+
+    def handle(self, *_args, **options) -> None:
+        account_id = options["account_id"]
+        runs = options["runs"]
+
+        self.write_header()
+
+        try:
+            for size in BATCH_SIZES:
+                setup = partial(self.reseed, account_id, size)
+                legacy = self.measure(partial(self.legacy_claim, account_id, size), runs, setup=setup)
+                batch = self.measure(
+                    partial(Event.claim, {"account_id": account_id}, size, BENCHMARK_CONSUMER_ID),
+                    runs,
+                    setup=setup,
+                )
+
+                self.write_row(f"legacy find_one_and_update x{size}", legacy)
+                self.write_row(f"batch claim x{size}", batch)
+        finally:
+            self.reset(account_id)
+
+    @staticmethod
+    def reset(account_id: int) -> None:
+        Event.delete_where({"account_id": account_id})
+        EventCounter.delete_where({"account_id": account_id})
+        EventSequence.delete_where({"_id": account_id})
+        EventSignal.delete_where({"account_id": account_id})
+
+    @classmethod
+    def reseed(cls, account_id: int, size: int) -> None:
+        cls.reset(account_id)
+        # Seeding through insert_many keeps the counters the claim moves and the sequence in step with the events.
+        Event.insert_many(
+            [
+                Event.build(account_id, BENCHMARK_CONSUMER_ID, {"key": "get.account.info", "payload": {}})
+                for _ in range(size)
+            ]
+        )
+
+    @staticmethod
+    def legacy_claim(account_id: int, limit: int) -> list[dict]:
+        now = timezone.now()
+        consumed: list[dict] = []
+
+        for event in Event.where({"account_id": account_id, "status": EventStatus.PENDING}, sort=CLAIM_SORT):
+            if len(consumed) >= limit:
+                break
+
+            result = Event.find_one_and_update(
+                {"_id": event["_id"], "status": EventStatus.PENDING},
+                {
+                    "$set": {
+                        "status": EventStatus.DELIVERED,
+                        "consumer_id": BENCHMARK_CONSUMER_ID,
+                        "delivered_at": now,
+                        "updated_at": now,
+                    },
+                    "$inc": {"attempts": 1},
+                },
+                return_document=True,
+            )
+
+            if result:
+                consumed.append(result)
+
+        return consumed
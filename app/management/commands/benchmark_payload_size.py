@@ -0,0 +1,106 @@
+import contextlib
+import json
+from functools import partial
+
+from django.core.management.base import CommandParser
+from rest_framework import serializers
+
+from app.http.requests.validators import MAX_NESTING_DEPTH, MAX_PAYLOAD_SIZE, validate_dict_payload
+
+from ._base_benchmark_command import BaseBenchmarkCommand
+
+DEFAULT_ITERATIONS = 100
+SMALL_PAYLOAD_SIZE = 8 * 1024
+OVERSIZED_PAYLOAD_SIZE = 1024 * 1024
+
+
+def _fill(build, size: int) -> dict:
+    count = 1
+
+    while len(json.dumps(build(count * 2))) <= size:
+        count *= 2
+
+    low, high = count, count * 2
+
+    while low + 1 < high:
+        middle = (low + high) // 2
+
+        if len(json.dumps(build(middle))) <= size:
+            low = middle
+        else:
+            high = middle
+
+    return build(low)
+
+
+PAYLOADS = {
+    "ascii string": lambda count: {"comment": "x" * count},
+    "flat keys": lambda count: {f"field_{index}": index for index in range(count)},
+    "unicode text": lambda count: {"comment": "é日" * count},
+    "nested candles": lambda count: {
+        "symbol": "XAUUSD",
+        "candles": [
+            {"time": 1717400000 + index * 60, "ohlc": [2350.15, 2351.4, 2349.8, 2350.95], "volume": 120}
+            for index in range(count)
+        ],
+    },
+}
+
+
+class Command(BaseBenchmarkCommand):
+    help = "Compare payload size/depth validation of json.dumps plus recursion against the single-pass validator"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=DEFAULT_ITERATIONS,
+            help=f"Validations per run (default: {DEFAULT_ITERATIONS})",
+        )
+
+    def handle(self, *_args, **options) -> None:
+        runs = options["runs"]
+        iterations = options["iterations"]
+
+        self.write_header()
+
+        for name, build in PAYLOADS.items():
+            for size in (SMALL_PAYLOAD_SIZE, MAX_PAYLOAD_SIZE, OVERSIZED_PAYLOAD_SIZE):
+                payload = _fill(build, size)
+                body_size = len(json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode())
+                label = f"{name} {size // 1024}KB"
+
+                legacy = self.measure(partial(self.repeat, self.legacy_validate, iterations, payload), runs)
+                single = self.measure(partial(self.repeat, validate_dict_payload, iterations, payload), runs)
+                body = self.measure(partial(self.repeat, validate_dict_payload, iterations, payload, body_size), runs)
+
+                self.write_row(f"dumps {label}", legacy, operations=iterations)
+                self.write_row(f"single-pass {label}", single, operations=iterations)
+                self.write_row(f"single-pass +body {label}", body, operations=iterations)
+
+    @staticmethod
+    def repeat(validate, iterations: int, *args) -> None:
+        for _ in range(iterations):
+            with contextlib.suppress(serializers.ValidationError):
+                validate(*args)
+
+    @staticmethod
+    def legacy_validate(value: dict) -> None:
+        if len(json.dumps(value).encode()) > MAX_PAYLOAD_SIZE:
+            raise serializers.ValidationError("Payload too large.")
+
+        Command.legacy_depth(value)
+
+    @staticmethod
+    def legacy_depth(data, current_depth: int = 0) -> None:
+        if current_depth > MAX_NESTING_DEPTH:
+            raise serializers.ValidationError("Payload too deep.")
+
+        if isinstance(data, dict):
+            for value in data.values():
+                Command.legacy_depth(value, current_depth + 1)
+
+        elif isinstance(data, list):
+            for item in data:
+                Command.legacy_depth(item, current_depth + 1)
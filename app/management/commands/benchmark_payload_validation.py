@@ -0,0 +1,90 @@
+from functools import partial
+
+from django.core.management.base import CommandParser
+from rest_framework import serializers
+
+from app.enums import EventKey
+from app.http.requests.event.payload_validator import PAYLOAD_VALIDATORS
+
+from ._base_benchmark_command import BaseBenchmarkCommand
+
+DEFAULT_ITERATIONS = 1000
+PAYLOADS = {
+    EventKey.POST_ORDER: {"symbol": "EURUSD", "strategy": 1, "type": "buy", "volume": 0.1, "stop_loss": 1.09},
+    EventKey.GET_ORDER: {"id": "a1b2c3d4-e5f6-7890-abcd-ef1234567890"},
+    EventKey.PUT_ORDER: {"id": "a1b2c3d4-e5f6-7890-abcd-ef1234567890", "strategy": 1, "take_profit": 1.12},
+    EventKey.DELETE_ORDER: {"id": "a1b2c3d4-e5f6-7890-abcd-ef1234567890", "strategy": 1},
+    EventKey.GET_ORDERS: {"strategy": 1, "status": "open"},
+    EventKey.GET_KLINES: {"symbol": "XAUUSD", "timeframe": "D1", "from_date": "2025-01-01", "to_date": "2025-02-01"},
+    EventKey.GET_TICKER: {"symbols": "EURUSD,XAUUSD"},
+}
+FIELD_CLASSES = {
+    "string": serializers.CharField,
+    "float": serializers.FloatField,
+    "integer": serializers.IntegerField,
+}
+
+
+class Command(BaseBenchmarkCommand):
+    help = "Compare push payload validation cost per event key of per-request DRF serializers against the registry"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=DEFAULT_ITERATIONS,
+            help=f"Validations per run (default: {DEFAULT_ITERATIONS})",
+        )
+
+    def handle(self, *_args, **options) -> None:
+        runs = options["runs"]
+        iterations = options["iterations"]
+
+        self.write_header()
+
+        for event_key in EventKey:
+            payload = PAYLOADS.get(event_key, {})
+            legacy = self.measure(partial(self.legacy_validate, event_key, payload, iterations), runs)
+            registry = self.measure(partial(self.registry_validate, event_key, payload, iterations), runs)
+
+            self.write_row(f"serializer {event_key.value}", legacy, operations=iterations)
+            self.write_row(f"registry {event_key.value}", registry, operations=iterations)
+
+    @staticmethod
+    def legacy_validate(event_key: EventKey, payload: dict, iterations: int) -> None:
+        for _ in range(iterations):
+            serializer = Command.legacy_serializer(event_key)(data=payload)
+            serializer.is_valid(raise_exception=True)
+
+    @staticmethod
+    def registry_validate(event_key: EventKey, payload: dict, iterations: int) -> None:
+        validator = PAYLOAD_VALIDATORS[event_key]
+
+        for _ in range(iterations):
+            validator.validate(payload)
+
+    @staticmethod
+    def legacy_serializer(event_key: EventKey) -> type[serializers.Serializer]:
+        fields = {}
+
+        for field_name, definition in event_key.schema().items():
+            field_class = FIELD_CLASSES[definition["type"]]
+            kwargs = {"required": definition.get("required", False)}
+
+            if not kwargs["required"]:
+                kwargs["default"] = definition.get("default", None)
+                if kwargs["default"] is None:
+                    kwargs["allow_null"] = True
+
+            if "choices" in definition:
+                field_class = serializers.ChoiceField
+                kwargs["choices"] = [(choice, choice) for choice in definition["choices"]]
+
+            for option in ("min_value", "max_value", "max_length"):
+                if option in definition:
+                    kwargs[option] = definition[option]
+
+            fields[field_name] = field_class(**kwargs)
+
+        return type(f"{event_key.value}PayloadSerializer", (serializers.Serializer,), fields)
@@ -0,0 +1,87 @@
+from functools import partial
+
+from django.core.management.base import CommandError, CommandParser
+from django.db import transaction
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from app.collections.event import Event
+from app.collections.event_counter import EventCounter
+from app.collections.event_sequence import EventSequence
+from app.collections.event_signal import EventSignal
+from app.enums import SystemRole
+from app.http.controllers.event import EventController
+from app.http.requests.event.push_event_batch import MAX_BATCH_SIZE
+from app.models import Account, User
+
+from ._base_benchmark_command import BaseBenchmarkCommand
+
+BENCHMARK_ACCOUNT_ID = -1
+BENCHMARK_EMAIL = "benchmark@horizon5.local"
+DEFAULT_EVENTS = 50
+EVENT = {"key": "get.account.info", "payload": {}}
+
+
+class Command(BaseBenchmarkCommand):
+    help = "Compare push throughput of one request per event against the batch push endpoint"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--events", type=int, default=DEFAULT_EVENTS, help=f"Events per run (default: {DEFAULT_EVENTS})"
+        )
+
+    def handle(self, *_args, **options) -> None:
+        runs = options["runs"]
+        size = options["events"]
+
+        if not 1 <= size <= MAX_BATCH_SIZE:
+            raise CommandError(f"--events must be between 1 and {MAX_BATCH_SIZE}.")
+
+        factory = APIRequestFactory()
+
+        # Every run adds `size` events that are never consumed, so the queue cap would start answering 429s.
+        with transaction.atomic(), override_settings(EVENT_MAX_PENDING=0):
+            user = User.objects.create_user(email=BENCHMARK_EMAIL, role=SystemRole.ROOT)
+            Account.objects.create(id=BENCHMARK_ACCOUNT_ID, user=user)
+
+            try:
+                single = self.measure(partial(self.push_single, factory, user, size), runs)
+                batch = self.measure(partial(self.push_batch, factory, user, size), runs)
+
+                self.write_header()
+                self.write_row(f"single push x{size}", single, operations=size)
+                self.write_row(f"batch push x{size}", batch, operations=size)
+            finally:
+                Event.delete_where({"account_id": BENCHMARK_ACCOUNT_ID})
+                EventCounter.delete_where({"account_id": BENCHMARK_ACCOUNT_ID})
+                EventSequence.delete_where({"_id": BENCHMARK_ACCOUNT_ID})
+                EventSignal.delete_where({"account_id": BENCHMARK_ACCOUNT_ID})
+                transaction.set_rollback(True)
+
+    @staticmethod
+    def push_single(factory: APIRequestFactory, user: User, size: int) -> None:
+        view = EventController.as_view({"post": "push"})
+
+        for _ in range(size):
+            request = factory.post(f"/api/v1/account/{BENCHMARK_ACCOUNT_ID}/events/", EVENT, format="json")
+            force_authenticate(request, user=user)
+            Command.check_created(view(request, id=BENCHMARK_ACCOUNT_ID))
+
+    @staticmethod
+    def push_batch(factory: APIRequestFactory, user: User, size: int) -> None:
+        view = EventController.as_view({"post": "push_batch"})
+        request = factory.post(
+            f"/api/v1/account/{BENCHMARK_ACCOUNT_ID}/events/batch/",
+            {"events": [EVENT] * size},
+            format="json",
+        )
+        force_authenticate(request, user=user)
+        Command.check_created(view(request, id=BENCHMARK_ACCOUNT_ID))
+
+    @staticmethod
+    def check_created(response) -> None:
+        """Stop the run instead of timing rejected pushes."""
+        if response.status_code != status.HTTP_201_CREATED:
+            raise CommandError(f"Push returned {response.status_code} instead of 201: {response.data}")
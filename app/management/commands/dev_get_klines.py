@@ -1,10 +1,9 @@
 import csv
 import io
-import time
 
 from django.core.management.base import CommandParser
 
-from ._base_event_command import MAX_POLL_ITERATIONS, POLL_INTERVAL_SECONDS, BaseEventCommand
+from ._base_event_command import BaseEventCommand
 
 EVENT_KEY = "get.klines"
 MIN_CSV_ROWS_WITH_HEADER = 2
@@ -39,23 +38,14 @@ class Command(BaseEventCommand):
         event_id = event["id"]
 
         self.stdout.write(f"\nEvent pushed  id={event_id}  key={event['key']}  status={event['status']}")
-        self.stdout.write("Polling for response...\n")
-
-        response_data = None
-        for attempt in range(1, MAX_POLL_ITERATIONS + 1):
-            time.sleep(POLL_INTERVAL_SECONDS)
-            result = client.poll_event_response(account_id, event_id)
-            if result is not None:
-                self.stdout.write(self.style.SUCCESS(f"Response received (attempt {attempt}/{MAX_POLL_ITERATIONS}):"))
-                response_data = result["data"]["response"]
-                self.print_json(response_data)
-                break
-            self.stdout.write(f"  [{attempt}/{MAX_POLL_ITERATIONS}] no response yet")
-
-        if response_data is None:
-            self.stdout.write(self.style.WARNING(f"\nNo response after {MAX_POLL_ITERATIONS} attempts."))
+        result = self.wait_for_response(client, account_id, event_id)
+
+        if result is None:
             return
 
+        response_data = result["data"]["response"]
+        self.print_json(response_data)
+
         if response_data.get("status") != "success":
             self.stdout.write(self.style.ERROR("\nEvent completed with error."))
             return
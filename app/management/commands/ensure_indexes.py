@@ -0,0 +1,48 @@
+import structlog
+from django.core.management.base import BaseCommand
+
+from app.collections.account_snapshot import AccountSnapshot
+from app.collections.event import Event
+from app.collections.event_archive import EventArchive
+from app.collections.event_consumer import EventConsumer
+from app.collections.event_counter import EventCounter
+from app.collections.event_dead_letter import EventDeadLetter
+from app.collections.event_idempotency_key import EventIdempotencyKey
+from app.collections.event_latency import EventLatency
+from app.collections.heartbeat import Heartbeat
+from app.collections.log import Log
+from app.collections.order import Order
+from app.collections.strategy_snapshot import StrategySnapshot
+
+logger = structlog.get_logger("indexes")
+
+DOCUMENTS = (
+    AccountSnapshot,
+    Event,
+    EventArchive,
+    EventConsumer,
+    EventCounter,
+    EventDeadLetter,
+    EventIdempotencyKey,
+    EventLatency,
+    Heartbeat,
+    Log,
+    Order,
+    StrategySnapshot,
+)
+
+
+class Command(BaseCommand):
+    help = "Create declared MongoDB indexes and drop the ones no longer declared"
+
+    def handle(self, *_args, **_options) -> None:
+        for document in DOCUMENTS:
+            result = document.ensure_indexes()
+
+            logger.info(
+                "indexes_ensured",
+                collection=document.collection_name,
+                created=result["created"],
+                updated=result["updated"],
+                dropped=result["dropped"],
+            )
@@ -0,0 +1,37 @@
+import json
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.utils import timezone
+
+from app.collections.event_latency import EventLatency
+
+DEFAULT_HOURS = 24
+
+
+class Command(BaseCommand):
+    help = "Print queue wait, processing and round-trip latency percentiles from the hourly rollups (JSON output)"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--hours",
+            type=int,
+            default=DEFAULT_HOURS,
+            help=f"Hours of rollups to include, counting the current one (default: {DEFAULT_HOURS})",
+        )
+        parser.add_argument("--account", type=int, help="Only include this account")
+        parser.add_argument("--key", help="Only include this event key")
+
+    def handle(self, *_args, **options) -> None:
+        query = {}
+
+        if options["account"] is not None:
+            query["account_id"] = options["account"]
+
+        if options["key"] is not None:
+            query["key"] = options["key"]
+
+        hour = timezone.now().replace(minute=0, second=0, microsecond=0)
+        summary = EventLatency.summary(query, hour - timedelta(hours=options["hours"] - 1))
+
+        self.stdout.write(json.dumps(summary, indent=2, default=str))
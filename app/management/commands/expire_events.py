@@ -0,0 +1,24 @@
+import structlog
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from app.collections.event import EXPIRE_BATCH_SIZE, Event
+
+logger = structlog.get_logger("expire")
+
+
+class Command(BaseCommand):
+    help = "Move pending events past their expires_at to the dead-letter queue"
+
+    def handle(self, *_args, **_options) -> None:
+        now = timezone.now()
+        expired_count = 0
+
+        while True:
+            expired = Event.expire(now)
+            expired_count += expired
+
+            if expired < EXPIRE_BATCH_SIZE:
+                break
+
+        logger.info("expire_completed", collection="events", expired_count=expired_count)
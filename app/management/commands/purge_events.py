@@ -4,8 +4,8 @@ import structlog
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 
-from app.collections.event import Event
-from app.enums import EventStatus
+from app.collections.event_archive import EventArchive
+from app.collections.event_dead_letter import EventDeadLetter
 
 logger = structlog.get_logger("purge")
 
@@ -13,17 +13,17 @@ RETENTION_DAYS = 90
 
 
 class Command(BaseCommand):
-    help = "Purge terminal events (processed/failed) older than 90 days"
+    help = "Purge archived and dead-lettered events older than 90 days"
 
     def handle(self, *_args, **_options) -> None:
         cutoff = timezone.now() - timedelta(days=RETENTION_DAYS)
-        query = {
-            "status": {"$in": [EventStatus.PROCESSED, EventStatus.FAILED]},
-            "created_at": {"$lt": cutoff},
-        }
 
-        result = Event.delete_where(query)
+        for document in (EventArchive, EventDeadLetter):
+            deleted_count = document.purge(cutoff)
 
-        logger.info(
-            "purge_completed", collection="events", deleted_count=result.deleted_count, retention_days=RETENTION_DAYS
-        )
+            logger.info(
+                "purge_completed",
+                collection=document.collection_name,
+                deleted_count=deleted_count,
+                retention_days=RETENTION_DAYS,
+            )
@@ -0,0 +1,18 @@
+import structlog
+from django.core.management.base import BaseCommand
+
+from app.collections.event import Event
+from app.collections.event_archive import EventArchive
+from app.collections.event_counter import EventCounter
+from app.collections.event_dead_letter import EventDeadLetter
+
+logger = structlog.get_logger("counters")
+
+
+class Command(BaseCommand):
+    help = "Recount the per-account event counters from the events, archive and dead-letter collections"
+
+    def handle(self, *_args, **_options) -> None:
+        counters = EventCounter.rebuild((Event, EventArchive, EventDeadLetter))
+
+        logger.info("counters_rebuilt", collection=EventCounter.collection_name, counters=counters)
@@ -0,0 +1,21 @@
+from datetime import timedelta
+
+import structlog
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from app.collections.event_latency import EventLatency
+
+logger = structlog.get_logger("rollup")
+
+ROLLUP_DELAY_SECONDS = 5
+
+
+class Command(BaseCommand):
+    help = "Add events acked since the last rollup to the hourly latency histograms"
+
+    def handle(self, *_args, **_options) -> None:
+        until = timezone.now() - timedelta(seconds=ROLLUP_DELAY_SECONDS)
+        recorded_count = EventLatency.rollup(until)
+
+        logger.info("rollup_completed", collection="event_latencies", recorded_count=recorded_count)
@@ -1,17 +1,44 @@
 from apscheduler.triggers.cron import CronTrigger
 
 from app.jobs import (
+    archive_events,
     check_stuck_events,
     clean_expired_media,
+    expire_events,
     purge_account_snapshots,
     purge_events,
     purge_heartbeats,
     purge_logs,
     purge_strategy_snapshots,
+    rollup_event_latency,
 )
 
 
 def register_jobs(scheduler):
+    scheduler.add_job(
+        archive_events.run,
+        trigger=CronTrigger(minute="*"),
+        id="archive_events",
+        max_instances=1,
+        replace_existing=True,
+    )
+
+    scheduler.add_job(
+        expire_events.run,
+        trigger=CronTrigger(minute="*"),
+        id="expire_events",
+        max_instances=1,
+        replace_existing=True,
+    )
+
+    scheduler.add_job(
+        rollup_event_latency.run,
+        trigger=CronTrigger(minute="*"),
+        id="rollup_event_latency",
+        max_instances=1,
+        replace_existing=True,
+    )
+
     scheduler.add_job(
         check_stuck_events.run,
         trigger=CronTrigger(hour=3, minute=0),
@@ -3,6 +3,8 @@ from app.http.controllers.account_snapshot import AccountSnapshotController
 from app.http.controllers.api_key import ApiKeyController
 from app.http.controllers.auth import AuthController
 from app.http.controllers.event import EventController
+from app.http.controllers.event_broadcast import EventBroadcastController
+from app.http.controllers.event_dead_letter import EventDeadLetterController
 from app.http.controllers.health import HealthController
 from app.http.controllers.heartbeat import HeartbeatController
 from app.http.controllers.log import LogController
@@ -39,8 +41,12 @@ urlpatterns = Route.collect(
     ),
     Route.prefix("account/<int:id>/events").group(
         Route.post("", EventController, "push"),
+        Route.post("batch/", EventController, "push_batch"),
         Route.post("consume/", EventController, "consume"),
+        Route.patch("ack/", EventController, "ack_batch"),
         Route.get("history/", EventController, "history"),
+        Route.get("stream/", EventController, "stream"),
+        Route.get("stats/", EventController, "stats"),
     ),
     Route.prefix("account/<int:id>/event/<str:event_id>").group(
         Route.patch("ack/", EventController, "ack"),
@@ -60,6 +66,13 @@ urlpatterns = Route.collect(
     ),
     Route.prefix("events").group(
         Route.get("keys/", EventController, "keys"),
+        Route.post("consume/", EventController, "consume_accounts"),
+        Route.get("stats/", EventController, "fleet_stats"),
+        Route.get("latency/", EventController, "latency"),
+        Route.post("broadcast/", EventBroadcastController, "store"),
+        Route.get("broadcast/<str:broadcast_id>/", EventBroadcastController, "show"),
+        Route.get("dead-letter/", EventDeadLetterController, "index"),
+        Route.post("dead-letter/<str:event_id>/replay/", EventDeadLetterController, "replay"),
     ),
     Route.prefix("heartbeat").group(
         Route.post("", HeartbeatController, "store"),
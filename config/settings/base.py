@@ -94,6 +94,18 @@ STORAGE_MAX_UPLOAD_SIZE = env.int("STORAGE_MAX_UPLOAD_SIZE", default=1_073_741_8
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+EVENT_LEASE_SECONDS = env.int("EVENT_LEASE_SECONDS", default=60)
+EVENT_CONSUMER_LEASE_SECONDS = env.int("EVENT_CONSUMER_LEASE_SECONDS", default=90)
+EVENT_DEFAULT_MAX_ATTEMPTS = env.int("EVENT_DEFAULT_MAX_ATTEMPTS", default=5)
+EVENT_IDEMPOTENCY_TTL_SECONDS = env.int("EVENT_IDEMPOTENCY_TTL_SECONDS", default=86400)
+EVENT_POLL_MIN_MS = env.int("EVENT_POLL_MIN_MS", default=1000)
+EVENT_POLL_MAX_MS = env.int("EVENT_POLL_MAX_MS", default=30000)
+EVENT_MAX_PENDING = env.int("EVENT_MAX_PENDING", default=10000)
+EVENT_MAX_WAITERS = env.int("EVENT_MAX_WAITERS", default=8)
+EVENT_MAX_ATTEMPTS: dict[str, int] = env.dict("EVENT_MAX_ATTEMPTS", cast={"value": int}, default={})  # type: ignore[arg-type]
+EVENT_PRIORITIES: dict[str, int] = env.dict("EVENT_PRIORITIES", cast={"value": int}, default={})  # type: ignore[arg-type]
+EVENT_TTL_SECONDS: dict[str, int] = env.dict("EVENT_TTL_SECONDS", cast={"value": int}, default={})  # type: ignore[arg-type]
+
 _mongodb_host: str = env("MONGODB_HOST", default="127.0.0.1")  # type: ignore[arg-type]
 _mongodb_port: int = env.int("MONGODB_PORT", default=27017)  # type: ignore[arg-type]
 _mongodb_database: str = env("MONGODB_DB", default=env("POSTGRES_DB"))  # type: ignore[arg-type]
@@ -10,4 +10,10 @@ log_title "DATABASE MIGRATIONS"
 log_info "Running Django migrations..."
 docker_compose exec horizon-mt-api-web uv run python manage.py migrate
 
+log_info "Ensuring MongoDB indexes..."
+docker_compose exec horizon-mt-api-web uv run python manage.py ensure_indexes
+
+log_info "Backfilling event fields..."
+docker_compose exec horizon-mt-api-web uv run python manage.py backfill_events
+
 log_info "Done"
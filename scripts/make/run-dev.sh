@@ -12,6 +12,8 @@ docker_compose up -d horizon-mt-api-postgres horizon-mt-api-mongodb
 
 log_info "Running database migrations..."
 docker_compose run --rm horizon-mt-api-web uv run python manage.py migrate
+docker_compose run --rm horizon-mt-api-web uv run python manage.py ensure_indexes
+docker_compose run --rm horizon-mt-api-web uv run python manage.py backfill_events
 
 log_info "Starting application services..."
 docker_compose up -d horizon-mt-api-web horizon-mt-api-scheduler
@@ -6,6 +6,7 @@ from django.conf import settings
 from pymongo import IndexModel, MongoClient
 
 from app.collections.base import BaseDocument
+from app.collections.event_signal import EventSignal
 
 
 class ConcreteDocument(BaseDocument):
@@ -42,3 +43,5 @@ def clean_collections(mongodb_database):
     yield
     for name in mongodb_database.list_collection_names():
         mongodb_database.drop_collection(name)
+
+    EventSignal.ready = False
@@ -2,6 +2,7 @@ import pytest
 from rest_framework import status
 
 from app.collections.event import Event
+from app.collections.event_signal import EventSignal
 from app.enums import EventStatus
 from tests.feature.events.conftest import create_event, fake_object_id
 
@@ -93,3 +94,11 @@ class TestAckEvent:
         response = root_client.patch(ack_url(platform_account.id, event["_id"]), format="json")
 
         assert response.status_code == status.HTTP_200_OK
+
+    def test_should_signal_response_waiters(self, platform_client, platform_account, platform_user):
+        event = create_event(platform_account.id, platform_user.pk, status=EventStatus.DELIVERED)
+
+        platform_client.patch(ack_url(platform_account.id, event["_id"]), format="json")
+
+        signal = EventSignal.find_one({"account_id": platform_account.id, "event_ids": event["_id"]})
+        assert signal["status"] == EventStatus.PROCESSED
@@ -0,0 +1,116 @@
+import pytest
+from rest_framework import status
+
+from app.collections.event import Event
+from app.enums import EventStatus
+from tests.feature.events.conftest import create_event, fake_object_id
+
+
+def ack_batch_url(account_id):
+    return f"/api/v1/account/{account_id}/events/ack/"
+
+
+@pytest.mark.django_db
+class TestAckEventBatch:
+    def test_should_process_all_delivered_events(self, platform_client, platform_account, platform_user):
+        first = create_event(platform_account.id, platform_user.pk, status=EventStatus.DELIVERED)
+        second = create_event(platform_account.id, platform_user.pk, status=EventStatus.DELIVERED)
+
+        response = platform_client.patch(
+            ack_batch_url(platform_account.id),
+            {"events": [{"event_id": str(first["_id"])}, {"event_id": str(second["_id"])}]},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["meta"] == {"count": 2, "failed": 0}
+        assert Event.count({"status": EventStatus.PROCESSED}) == 2
+
+    def test_should_store_each_response(self, platform_client, platform_account, platform_user):
+        event = create_event(platform_account.id, platform_user.pk, status=EventStatus.DELIVERED)
+
+        platform_client.patch(
+            ack_batch_url(platform_account.id),
+            {"events": [{"event_id": str(event["_id"]), "response": {"order_id": 1}}]},
+            format="json",
+        )
+
+        updated = Event.find_one({"_id": event["_id"]})
+        assert updated["response"] == {"order_id": 1}
+        assert updated["processed_at"] is not None
+
+    def test_should_report_missing_and_invalid_status_events(self, platform_client, platform_account, platform_user):
+        delivered = create_event(platform_account.id, platform_user.pk, status=EventStatus.DELIVERED)
+        pending = create_event(platform_account.id, platform_user.pk, status=EventStatus.PENDING)
+        missing_id = fake_object_id()
+
+        response = platform_client.patch(
+            ack_batch_url(platform_account.id),
+            {
+                "events": [
+                    {"event_id": str(delivered["_id"])},
+                    {"event_id": str(pending["_id"])},
+                    {"event_id": missing_id},
+                ]
+            },
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [event["id"] for event in response.data["data"]["processed"]] == [str(delivered["_id"])]
+        assert response.data["data"]["invalid_status"] == [str(pending["_id"])]
+        assert response.data["data"]["not_found"] == [missing_id]
+        assert response.data["meta"] == {"count": 1, "failed": 2}
+
+    def test_should_not_process_events_of_other_accounts(
+        self, platform_client, platform_account, platform_user, producer_account
+    ):
+        event = create_event(producer_account.id, platform_user.pk, status=EventStatus.DELIVERED)
+
+        response = platform_client.patch(
+            ack_batch_url(platform_account.id),
+            {"events": [{"event_id": str(event["_id"])}]},
+            format="json",
+        )
+
+        assert response.data["data"]["not_found"] == [str(event["_id"])]
+        assert Event.find_one({"_id": event["_id"]})["status"] == EventStatus.DELIVERED
+
+    def test_should_return_400_when_event_id_is_repeated(self, platform_client, platform_account):
+        event_id = fake_object_id()
+
+        response = platform_client.patch(
+            ack_batch_url(platform_account.id),
+            {"events": [{"event_id": event_id}, {"event_id": event_id}]},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_should_return_400_when_event_id_is_invalid(self, platform_client, platform_account):
+        response = platform_client.patch(
+            ack_batch_url(platform_account.id),
+            {"events": [{"event_id": "invalid-id"}]},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_should_return_400_when_events_is_empty(self, platform_client, platform_account):
+        response = platform_client.patch(ack_batch_url(platform_account.id), {"events": []}, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_should_return_401_when_unauthenticated(self, api_client, platform_account):
+        response = api_client.patch(ack_batch_url(platform_account.id), {"events": []}, format="json")
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_should_return_403_when_account_owner_has_producer_role(self, producer_client, producer_account):
+        response = producer_client.patch(
+            ack_batch_url(producer_account.id),
+            {"events": [{"event_id": fake_object_id()}]},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -0,0 +1,127 @@
+import pytest
+from rest_framework import status
+
+from app.collections.event import Event
+from app.enums import AccountStatus, EventStatus
+from app.models import Account
+from tests.feature.events.conftest import create_event
+
+BROADCAST_URL = "/api/v1/events/broadcast/"
+DISABLE_PAYLOAD = {"key": "patch.account.disable", "payload": {}}
+
+
+def show_url(broadcast_id):
+    return f"{BROADCAST_URL}{broadcast_id}/"
+
+
+@pytest.mark.django_db
+class TestBroadcastEvents:
+    def test_should_create_one_event_per_listed_account(self, root_client, producer_account, platform_account):
+        response = root_client.post(
+            BROADCAST_URL,
+            {**DISABLE_PAYLOAD, "accounts": [producer_account.id, platform_account.id]},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        broadcast_id = response.data["data"]["broadcast_id"]
+        events = list(Event.where({}))
+        assert len(events) == 2
+        assert {event["account_id"] for event in events} == {producer_account.id, platform_account.id}
+        assert {str(event["broadcast_id"]) for event in events} == {broadcast_id}
+
+    def test_should_skip_accounts_with_full_queues(self, settings, root_client, producer_account, platform_account):
+        settings.EVENT_MAX_PENDING = 1
+        create_event(platform_account.id, platform_account.user_id)
+
+        response = root_client.post(
+            BROADCAST_URL,
+            {**DISABLE_PAYLOAD, "accounts": [producer_account.id, platform_account.id]},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["meta"]["count"] == 1
+        assert response.data["meta"]["full"] == [platform_account.id]
+
+    def test_should_select_accounts_by_filter(self, root_client, producer_account, platform_account):
+        Account.objects.filter(id=platform_account.id).update(status=AccountStatus.INACTIVE)
+
+        response = root_client.post(
+            BROADCAST_URL, {**DISABLE_PAYLOAD, "filter": {"status": AccountStatus.ACTIVE}}, format="json"
+        )
+
+        assert response.data["meta"]["count"] == 1
+        assert Event.find_one({})["account_id"] == producer_account.id
+
+    def test_should_limit_producers_to_their_own_accounts(self, producer_client, producer_account, platform_account):
+        response = producer_client.post(BROADCAST_URL, {**DISABLE_PAYLOAD, "filter": {}}, format="json")
+
+        assert response.data["meta"]["count"] == 1
+        assert Event.find_one({})["account_id"] == producer_account.id
+
+    def test_should_return_400_when_listing_accounts_not_owned_by_producer(
+        self, producer_client, producer_account, platform_account
+    ):
+        response = producer_client.post(
+            BROADCAST_URL, {**DISABLE_PAYLOAD, "accounts": [producer_account.id, platform_account.id]}, format="json"
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert Event.count() == 0
+
+    def test_should_return_400_when_accounts_and_filter_are_both_missing(self, root_client):
+        response = root_client.post(BROADCAST_URL, DISABLE_PAYLOAD, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_should_validate_payload_once_against_key_schema(self, root_client, producer_account):
+        response = root_client.post(
+            BROADCAST_URL,
+            {"key": "post.order", "payload": {"symbol": "BTCUSDT"}, "accounts": [producer_account.id]},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_should_return_403_when_user_is_platform(self, platform_client):
+        response = platform_client.post(BROADCAST_URL, {**DISABLE_PAYLOAD, "filter": {}}, format="json")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db
+class TestShowBroadcast:
+    def test_should_aggregate_statuses_and_responses(self, root_client, producer_account, platform_account):
+        created = root_client.post(
+            BROADCAST_URL,
+            {**DISABLE_PAYLOAD, "accounts": [producer_account.id, platform_account.id]},
+            format="json",
+        )
+        broadcast_id = created.data["data"]["broadcast_id"]
+        Event.collection().update_one(
+            {"account_id": producer_account.id},
+            {"$set": {"status": EventStatus.PROCESSED, "response": {"disabled": True}}},
+        )
+
+        response = root_client.get(show_url(broadcast_id))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["data"]["statuses"] == {EventStatus.PROCESSED: 1, EventStatus.PENDING: 1}
+        responses = {event["account_id"]: event["response"] for event in response.data["data"]["events"]}
+        assert responses == {producer_account.id: {"disabled": True}, platform_account.id: None}
+
+    def test_should_filter_history_by_broadcast(self, root_client, producer_account):
+        created = root_client.post(BROADCAST_URL, {**DISABLE_PAYLOAD, "accounts": [producer_account.id]}, format="json")
+        broadcast_id = created.data["data"]["broadcast_id"]
+
+        response = root_client.get(f"/api/v1/account/{producer_account.id}/events/history/?broadcast_id={broadcast_id}")
+
+        assert [event["broadcast_id"] for event in response.data["data"]] == [broadcast_id]
+
+    def test_should_return_404_for_broadcast_of_another_producer(self, root_client, producer_client, producer_account):
+        created = root_client.post(BROADCAST_URL, {**DISABLE_PAYLOAD, "accounts": [producer_account.id]}, format="json")
+
+        response = producer_client.get(show_url(created.data["data"]["broadcast_id"]))
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,81 @@
+import pytest
+from rest_framework import status
+
+from app.models import Account
+from tests.feature.events.conftest import create_event
+
+CONSUME_URL = "/api/v1/events/consume/"
+
+
+@pytest.mark.django_db
+class TestConsumeAccountsEvents:
+    def test_should_claim_events_across_requested_accounts(
+        self, platform_client, platform_account, producer_account, platform_user
+    ):
+        create_event(platform_account.id, platform_user.pk)
+        create_event(producer_account.id, platform_user.pk)
+
+        response = platform_client.post(f"{CONSUME_URL}?accounts={platform_account.id},{producer_account.id}")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["meta"]["count"] == 2
+        assert {event["account_id"] for event in response.data["data"]} == {
+            str(platform_account.id),
+            str(producer_account.id),
+        }
+
+    def test_should_report_remaining_events_across_accounts(
+        self, platform_client, platform_account, producer_account, platform_user
+    ):
+        for account_id in (platform_account.id, producer_account.id, producer_account.id):
+            create_event(account_id, platform_user.pk)
+
+        response = platform_client.post(f"{CONSUME_URL}?accounts={platform_account.id},{producer_account.id}&limit=1")
+
+        assert response.data["meta"]["remaining"] == 2
+        assert response.data["meta"]["next_poll_ms"] == 0
+
+    def test_should_default_to_accounts_owned_by_caller(
+        self, platform_client, platform_account, producer_account, platform_user
+    ):
+        create_event(platform_account.id, platform_user.pk)
+        create_event(producer_account.id, platform_user.pk)
+
+        response = platform_client.post(CONSUME_URL)
+
+        assert response.data["meta"]["accounts"] == [platform_account.id]
+        assert [event["account_id"] for event in response.data["data"]] == [str(platform_account.id)]
+
+    def test_should_share_limit_fairly_between_accounts(self, platform_client, platform_user):
+        for account_id in (1, 2, 3):
+            Account.objects.create(id=account_id, user=platform_user)
+
+        for _ in range(20):
+            create_event(1, platform_user.pk)
+
+        create_event(2, platform_user.pk)
+        create_event(3, platform_user.pk)
+
+        response = platform_client.post(f"{CONSUME_URL}?accounts=1,2,3&limit=6")
+
+        account_ids = [event["account_id"] for event in response.data["data"]]
+        assert len(account_ids) == 6
+        assert account_ids.count("2") == 1
+        assert account_ids.count("3") == 1
+
+    def test_should_return_400_when_account_does_not_exist(self, platform_client, platform_account):
+        response = platform_client.post(f"{CONSUME_URL}?accounts={platform_account.id},424242")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_should_return_400_when_accounts_are_not_numeric(self, platform_client):
+        response = platform_client.post(f"{CONSUME_URL}?accounts=1,abc")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_should_return_400_when_accounts_are_combined_with_group(self, platform_client, platform_account):
+        response = platform_client.post(
+            f"{CONSUME_URL}?accounts={platform_account.id}&group=platform&consumer=terminal-a"
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -1,12 +1,17 @@
+import threading
+import time
 from datetime import timedelta
+from unittest.mock import patch
 
 import pytest
+from django.conf import settings
 from django.utils import timezone
 from rest_framework import status
 
 from app.collections.event import Event
+from app.collections.event_signal import EventSignal
 from app.enums import EventStatus
-from tests.feature.events.conftest import create_event
+from tests.feature.events.conftest import create_event, fake_object_id
 
 
 def consume_url(account_id):
@@ -36,6 +41,43 @@ class TestConsumeEvents:
         assert event["delivered_at"] is not None
         assert event["attempts"] == 1
 
+    def test_should_set_lease_expiration_on_delivered_events(self, platform_client, platform_account, platform_user):
+        create_event(platform_account.id, platform_user.pk)
+
+        platform_client.post(consume_url(platform_account.id))
+
+        event = Event.find_one({"account_id": platform_account.id})
+        assert event["lease_expires_at"] > event["delivered_at"]
+
+    def test_should_redeliver_events_whose_lease_expired(self, platform_client, platform_account, platform_user):
+        create_event(
+            platform_account.id,
+            platform_user.pk,
+            status=EventStatus.DELIVERED,
+            attempts=1,
+            lease_expires_at=timezone.now() - timedelta(seconds=1),
+        )
+
+        response = platform_client.post(consume_url(platform_account.id))
+
+        assert response.data["meta"]["count"] == 1
+        event = Event.find_one({"account_id": platform_account.id})
+        assert event["attempts"] == 2
+        assert Event.count({"_id": event["_id"], "lease_expires_at": {"$gt": timezone.now()}}) == 1
+
+    def test_should_not_redeliver_events_with_active_lease(self, platform_client, platform_account, platform_user):
+        create_event(
+            platform_account.id,
+            platform_user.pk,
+            status=EventStatus.DELIVERED,
+            attempts=1,
+            lease_expires_at=timezone.now() + timedelta(minutes=1),
+        )
+
+        response = platform_client.post(consume_url(platform_account.id))
+
+        assert response.data["meta"]["count"] == 0
+
     def test_should_return_events_ordered_by_created_at_ascending(
         self, platform_client, platform_account, platform_user
     ):
@@ -232,3 +274,205 @@ class TestConsumeEvents:
 
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data["data"]) == 1
+
+    def test_should_return_pending_events_immediately_when_waiting(
+        self, platform_client, platform_account, platform_user
+    ):
+        create_event(platform_account.id, platform_user.pk)
+        started = time.monotonic()
+
+        response = platform_client.post(f"{consume_url(platform_account.id)}?wait=10")
+
+        assert response.data["meta"]["count"] == 1
+        assert time.monotonic() - started < 5
+
+    def test_should_return_empty_list_when_wait_times_out(self, platform_client, platform_account):
+        response = platform_client.post(f"{consume_url(platform_account.id)}?wait=1")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["data"] == []
+        assert response.data["meta"]["count"] == 0
+
+    def test_should_answer_at_once_when_every_wait_slot_is_taken(self, platform_client, platform_account):
+        started = time.monotonic()
+
+        with patch("app.http.controllers.event.long_poll_slots", threading.BoundedSemaphore(1)) as slots:
+            slots.acquire()
+            response = platform_client.post(f"{consume_url(platform_account.id)}?wait=10")
+
+        assert response.data["meta"]["count"] == 0
+        assert time.monotonic() - started < 5
+
+    def test_should_wake_up_when_event_is_pushed_while_waiting(self, platform_client, platform_account, platform_user):
+        def push():
+            event = create_event(platform_account.id, platform_user.pk)
+            EventSignal.notify(platform_account.id, EventStatus.PENDING, [event["_id"]])
+
+        timer = threading.Timer(0.5, push)
+        started = time.monotonic()
+        timer.start()
+
+        response = platform_client.post(f"{consume_url(platform_account.id)}?wait=10")
+        timer.join()
+
+        assert response.data["meta"]["count"] == 1
+        assert time.monotonic() - started < 5
+
+    def test_should_not_deliver_scheduled_events_before_not_before(
+        self, platform_client, platform_account, platform_user
+    ):
+        create_event(
+            platform_account.id,
+            platform_user.pk,
+            status=EventStatus.SCHEDULED,
+            not_before=timezone.now() + timedelta(minutes=5),
+        )
+
+        response = platform_client.post(consume_url(platform_account.id))
+
+        assert response.data["meta"]["count"] == 0
+        assert Event.count({"status": EventStatus.SCHEDULED}) == 1
+
+    def test_should_deliver_scheduled_events_once_due(self, platform_client, platform_account, platform_user):
+        create_event(
+            platform_account.id,
+            platform_user.pk,
+            status=EventStatus.SCHEDULED,
+            not_before=timezone.now() - timedelta(seconds=1),
+        )
+
+        response = platform_client.post(consume_url(platform_account.id))
+
+        assert response.data["meta"]["count"] == 1
+        assert response.data["data"][0]["status"] == EventStatus.DELIVERED
+
+    def test_should_wake_up_when_scheduled_event_becomes_due_while_waiting(
+        self, platform_client, platform_account, platform_user
+    ):
+        create_event(
+            platform_account.id,
+            platform_user.pk,
+            status=EventStatus.SCHEDULED,
+            not_before=timezone.now() + timedelta(seconds=1),
+        )
+        started = time.monotonic()
+
+        response = platform_client.post(f"{consume_url(platform_account.id)}?wait=10")
+
+        assert response.data["meta"]["count"] == 1
+        assert time.monotonic() - started < 5
+
+    def test_should_return_400_when_wait_exceeds_maximum(self, platform_client, platform_account):
+        response = platform_client.post(f"{consume_url(platform_account.id)}?wait=31")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_should_ack_previous_batch_and_claim_next(self, platform_client, platform_account, platform_user):
+        delivered = create_event(
+            platform_account.id, platform_user.pk, status=EventStatus.DELIVERED, consumer_id=str(platform_user.pk)
+        )
+        pending = create_event(platform_account.id, platform_user.pk)
+
+        response = platform_client.post(
+            consume_url(platform_account.id),
+            {"acks": [{"event_id": str(delivered["_id"]), "response": {"ticket": 1}}]},
+            format="json",
+        )
+
+        assert [event["id"] for event in response.data["data"]] == [str(pending["_id"])]
+        assert response.data["meta"]["acks"] == {
+            "processed": [str(delivered["_id"])],
+            "not_found": [],
+            "invalid_status": [],
+        }
+
+        acked = Event.find_one({"_id": delivered["_id"]})
+        assert acked["status"] == EventStatus.PROCESSED
+        assert acked["response"] == {"ticket": 1}
+
+    def test_should_report_acks_that_could_not_be_applied(self, platform_client, platform_account, platform_user):
+        pending = create_event(platform_account.id, platform_user.pk)
+        missing = fake_object_id()
+
+        response = platform_client.post(
+            f"{consume_url(platform_account.id)}?key=get.order",
+            {"acks": [{"event_id": str(pending["_id"])}, {"event_id": missing}]},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["meta"]["acks"] == {
+            "processed": [],
+            "not_found": [missing],
+            "invalid_status": [str(pending["_id"])],
+        }
+
+    def test_should_omit_ack_results_without_acks(self, platform_client, platform_account):
+        response = platform_client.post(consume_url(platform_account.id))
+
+        assert "acks" not in response.data["meta"]
+
+    def test_should_return_400_when_acks_repeat_an_event(self, platform_client, platform_account):
+        event_id = fake_object_id()
+
+        response = platform_client.post(
+            consume_url(platform_account.id),
+            {"acks": [{"event_id": event_id}, {"event_id": event_id}]},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_should_hint_immediate_poll_while_events_remain(self, platform_client, platform_account, platform_user):
+        for _ in range(3):
+            create_event(platform_account.id, platform_user.pk)
+
+        response = platform_client.post(f"{consume_url(platform_account.id)}?limit=2")
+
+        assert response.data["meta"]["remaining"] == 1
+        assert response.data["meta"]["next_poll_ms"] == 0
+
+    def test_should_hint_minimum_interval_for_recently_active_account(
+        self, platform_client, platform_account, platform_user
+    ):
+        create_event(platform_account.id, platform_user.pk)
+
+        response = platform_client.post(consume_url(platform_account.id))
+
+        assert response.data["meta"]["remaining"] == 0
+        assert response.data["meta"]["next_poll_ms"] == settings.EVENT_POLL_MIN_MS
+
+    def test_should_back_off_when_queued_events_only_match_other_filters(
+        self, platform_client, platform_account, platform_user
+    ):
+        create_event(
+            platform_account.id,
+            platform_user.pk,
+            key="post.order",
+            symbol="EURUSD",
+            payload={"symbol": "EURUSD", "strategy": 1, "type": "sell", "volume": 0.1},
+        )
+
+        response = platform_client.post(f"{consume_url(platform_account.id)}?symbol=XAUUSD")
+
+        assert response.data["meta"]["remaining"] == 0
+        assert response.data["meta"]["next_poll_ms"] == settings.EVENT_POLL_MIN_MS
+
+    def test_should_hint_maximum_interval_for_idle_account(self, platform_client, platform_account):
+        response = platform_client.post(consume_url(platform_account.id))
+
+        assert response.data["meta"]["remaining"] == 0
+        assert response.data["meta"]["next_poll_ms"] == settings.EVENT_POLL_MAX_MS
+
+    def test_should_hint_poll_when_scheduled_event_is_due(self, platform_client, platform_account, platform_user):
+        create_event(
+            platform_account.id,
+            platform_user.pk,
+            status=EventStatus.SCHEDULED,
+            not_before=timezone.now() + timedelta(seconds=5),
+            created_at=timezone.now() - timedelta(hours=1),
+        )
+
+        response = platform_client.post(consume_url(platform_account.id))
+
+        assert 0 < response.data["meta"]["next_poll_ms"] <= 5000
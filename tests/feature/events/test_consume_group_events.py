@@ -0,0 +1,78 @@
+import time
+
+import pytest
+from rest_framework import status
+
+from app.collections.event_consumer import EventConsumer
+from app.enums import EventStatus
+from app.models import Account
+from tests.feature.events.conftest import create_event
+
+
+def consume_url(group="platform", consumer="terminal-a", **params):
+    query = "&".join(f"{name}={value}" for name, value in {"group": group, "consumer": consumer, **params}.items())
+    return f"/api/v1/events/consume/?{query}"
+
+
+@pytest.mark.django_db
+class TestConsumeGroupEvents:
+    def test_should_return_events_from_every_assigned_account(
+        self, platform_client, platform_account, producer_account, platform_user
+    ):
+        create_event(platform_account.id, platform_user.pk)
+        create_event(producer_account.id, platform_user.pk)
+
+        response = platform_client.post(consume_url())
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["meta"]["count"] == 2
+        assert sorted(response.data["meta"]["accounts"]) == sorted([platform_account.id, producer_account.id])
+        assert {event["status"] for event in response.data["data"]} == {EventStatus.DELIVERED}
+
+    def test_should_split_accounts_between_members(self, platform_client, platform_user):
+        for account_id in range(1, 21):
+            Account.objects.create(id=account_id, user=platform_user)
+            create_event(account_id, platform_user.pk)
+
+        EventConsumer.join("platform", "terminal-b", str(platform_user.pk))
+        first = platform_client.post(consume_url(consumer="terminal-a", limit=100))
+        second = platform_client.post(consume_url(consumer="terminal-b", limit=100))
+
+        assert first.data["meta"]["members"] == 2
+        assert first.data["meta"]["count"] + second.data["meta"]["count"] == 20
+        assert not set(first.data["meta"]["accounts"]) & set(second.data["meta"]["accounts"])
+
+    def test_should_answer_at_once_when_member_has_no_accounts(self, settings, platform_client, platform_user):
+        Account.objects.all().delete()
+
+        started = time.monotonic()
+        response = platform_client.post(consume_url(wait=5))
+
+        assert time.monotonic() - started < 5
+        assert response.data["data"] == []
+        assert response.data["meta"]["next_poll_ms"] == settings.EVENT_POLL_MAX_MS
+
+    def test_should_register_consumer_as_group_member(self, platform_client, platform_account):
+        platform_client.post(consume_url())
+
+        assert EventConsumer.members("platform") == ["terminal-a"]
+
+    def test_should_return_400_when_group_is_missing(self, platform_client):
+        response = platform_client.post("/api/v1/events/consume/?consumer=terminal-a")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_should_return_400_when_consumer_name_is_invalid(self, platform_client):
+        response = platform_client.post(consume_url(consumer="terminal%20a"))
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_should_return_403_when_user_is_producer(self, producer_client):
+        response = producer_client.post(consume_url())
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_should_return_401_when_unauthenticated(self, api_client):
+        response = api_client.post(consume_url())
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,100 @@
+import pytest
+from django.utils import timezone
+from rest_framework import status
+
+from app.collections.event import Event
+from app.collections.event_dead_letter import EventDeadLetter
+from app.enums import EventFailureReason, EventStatus
+from tests.feature.events.conftest import create_event, fake_object_id
+
+DEAD_LETTER_URL = "/api/v1/events/dead-letter/"
+
+
+def replay_url(event_id):
+    return f"{DEAD_LETTER_URL}{event_id}/replay/"
+
+
+def create_dead_letter(account_id, user_id, **overrides):
+    event = create_event(
+        account_id,
+        user_id,
+        status=EventStatus.FAILED,
+        attempts=5,
+        failure_reason=EventFailureReason.MAX_ATTEMPTS,
+        last_error="Lease expired without acknowledgement after 5 delivery attempts (consumer ea).",
+        failed_at=timezone.now(),
+        **overrides,
+    )
+    Event.delete(event["_id"])
+
+    return EventDeadLetter.create(event)
+
+
+@pytest.mark.django_db
+class TestListDeadLetterEvents:
+    def test_should_return_200_with_dead_lettered_events(self, root_client, producer_account, producer_user):
+        event = create_dead_letter(producer_account.id, producer_user.pk)
+
+        response = root_client.get(DEAD_LETTER_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["data"][0]["id"] == str(event["_id"])
+        assert response.data["data"][0]["failure_reason"] == EventFailureReason.MAX_ATTEMPTS
+        assert response.data["data"][0]["last_error"] == event["last_error"]
+
+    def test_should_paginate_with_cursor(self, root_client, producer_account, producer_user):
+        events = [create_dead_letter(producer_account.id, producer_user.pk) for _ in range(3)]
+
+        first = root_client.get(DEAD_LETTER_URL, {"limit": 2})
+        second = root_client.get(DEAD_LETTER_URL, {"limit": 2, "cursor": first.data["meta"]["next_cursor"]})
+
+        assert [event["id"] for event in first.data["data"]] == [str(events[2]["_id"]), str(events[1]["_id"])]
+        assert [event["id"] for event in second.data["data"]] == [str(events[0]["_id"])]
+        assert second.data["meta"]["next_cursor"] is None
+
+    def test_should_filter_by_account_and_key(self, root_client, producer_account, producer_user):
+        create_dead_letter(producer_account.id, producer_user.pk)
+        create_dead_letter(producer_account.id, producer_user.pk, key="get.ticker")
+        create_dead_letter(producer_account.id + 1, producer_user.pk)
+
+        response = root_client.get(DEAD_LETTER_URL, {"account_id": producer_account.id, "key": "post.order"})
+
+        assert response.data["meta"]["count"] == 1
+
+    def test_should_return_403_when_not_root(self, producer_client):
+        response = producer_client.get(DEAD_LETTER_URL)
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db
+class TestReplayDeadLetterEvent:
+    def test_should_move_event_back_to_pending(self, root_client, producer_account, producer_user):
+        event = create_dead_letter(producer_account.id, producer_user.pk)
+
+        response = root_client.post(replay_url(event["_id"]))
+
+        replayed = Event.find_one({"_id": event["_id"]})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["data"]["status"] == EventStatus.PENDING
+        assert replayed["attempts"] == 0
+        assert "failure_reason" not in replayed
+        assert EventDeadLetter.count() == 0
+
+    def test_should_return_404_when_event_is_not_dead_lettered(self, root_client):
+        response = root_client.post(replay_url(fake_object_id()))
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_should_return_400_when_event_id_is_invalid(self, root_client):
+        response = root_client.post(replay_url("invalid-id"))
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_should_return_403_when_not_root(self, producer_client, producer_account, producer_user):
+        event = create_dead_letter(producer_account.id, producer_user.pk)
+
+        response = producer_client.post(replay_url(event["_id"]))
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -0,0 +1,55 @@
+import pytest
+from django.utils import timezone
+from rest_framework import status
+
+from app.collections.event_latency import EventLatency
+from app.enums import EventStatus
+from tests.feature.events.conftest import create_event
+
+LATENCY_URL = "/api/v1/events/latency/"
+
+
+def ack_url(account_id, event_id):
+    return f"/api/v1/account/{account_id}/event/{event_id}/ack/"
+
+
+@pytest.mark.django_db
+class TestEventLatency:
+    def test_should_return_percentiles_of_acked_events(
+        self, root_client, platform_client, platform_account, platform_user
+    ):
+        event = create_event(
+            platform_account.id, platform_user.pk, status=EventStatus.DELIVERED, delivered_at=timezone.now()
+        )
+        platform_client.patch(ack_url(platform_account.id, event["_id"]), format="json")
+        EventLatency.rollup(timezone.now())
+
+        response = root_client.get(LATENCY_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.data["data"]
+        assert data["totals"]["count"] == 1
+        assert set(data["totals"]["round_trip"]) == {"p50", "p95", "p99", "buckets"}
+        assert data["keys"][0]["key"] == "post.order"
+        assert data["accounts"][0]["account_id"] == platform_account.id
+
+    def test_should_filter_by_account(self, root_client, platform_account, platform_user):
+        event = create_event(
+            platform_account.id, platform_user.pk, status=EventStatus.PROCESSED, delivered_at=timezone.now()
+        )
+        EventLatency.record([{**event, "processed_at": timezone.now()}])
+
+        response = root_client.get(LATENCY_URL, {"account_id": platform_account.id + 1})
+
+        assert response.data["data"]["totals"]["count"] == 0
+        assert response.data["data"]["accounts"] == []
+
+    def test_should_return_400_for_invalid_hours(self, root_client):
+        response = root_client.get(LATENCY_URL, {"hours": 0})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_should_return_403_for_non_root(self, platform_client):
+        response = platform_client.get(LATENCY_URL)
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
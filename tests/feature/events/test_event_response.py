@@ -1,6 +1,13 @@
+import threading
+import time
+
 import pytest
+from django.utils import timezone
 from rest_framework import status
 
+from app.collections.event import Event
+from app.collections.event_dead_letter import EventDeadLetter
+from app.collections.event_signal import EventSignal
 from app.enums import EventStatus
 from tests.feature.events.conftest import create_event, fake_object_id
 
@@ -41,6 +48,35 @@ class TestEventResponse:
         response = producer_client.get(response_url(producer_account.id, event["_id"]))
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.data["meta"] == {"status": EventStatus.PENDING}
+
+    def test_should_report_event_acknowledged_without_response(self, producer_client, producer_account, producer_user):
+        event = create_event(producer_account.id, producer_user.pk, status=EventStatus.PROCESSED, response=None)
+
+        response = producer_client.get(response_url(producer_account.id, event["_id"]))
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.data["meta"] == {"status": EventStatus.PROCESSED}
+
+    def test_should_return_response_of_archived_event(self, producer_client, producer_account, producer_user):
+        event = create_event(producer_account.id, producer_user.pk, status=EventStatus.PROCESSED, response={"ok": 1})
+        Event.archive(timezone.now())
+
+        response = producer_client.get(response_url(producer_account.id, event["_id"]))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["data"]["response"] == {"ok": 1}
+
+    def test_should_return_404_when_event_was_dead_lettered(self, producer_client, producer_account, producer_user):
+        event = create_event(producer_account.id, producer_user.pk, status=EventStatus.FAILED)
+        Event.delete(event["_id"])
+        EventDeadLetter.create(event)
+
+        response = producer_client.get(response_url(producer_account.id, event["_id"]))
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.data["message"] == "Event failed and was moved to the dead-letter queue."
+        assert response.data["meta"] == {"status": EventStatus.FAILED}
 
     def test_should_return_400_when_account_does_not_exist(self, root_client):
         response = root_client.get(response_url(999999999, fake_object_id()))
@@ -80,3 +116,35 @@ class TestEventResponse:
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data["data"]["response"] == {"result": "done"}
+
+    def test_should_wait_until_event_is_acknowledged(self, producer_client, producer_account, producer_user):
+        event = create_event(producer_account.id, producer_user.pk, status=EventStatus.DELIVERED)
+
+        def ack():
+            Event.update_one(str(event["_id"]), {"status": EventStatus.PROCESSED, "response": {"result": "done"}})
+            EventSignal.notify(producer_account.id, EventStatus.PROCESSED, [event["_id"]])
+
+        timer = threading.Timer(0.5, ack)
+        started = time.monotonic()
+        timer.start()
+
+        response = producer_client.get(f"{response_url(producer_account.id, event['_id'])}?wait=10")
+        timer.join()
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["data"]["response"] == {"result": "done"}
+        assert time.monotonic() - started < 5
+
+    def test_should_return_404_when_wait_times_out(self, producer_client, producer_account, producer_user):
+        event = create_event(producer_account.id, producer_user.pk, status=EventStatus.DELIVERED)
+
+        response = producer_client.get(f"{response_url(producer_account.id, event['_id'])}?wait=1")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_should_return_400_when_wait_exceeds_maximum(self, producer_client, producer_account, producer_user):
+        event = create_event(producer_account.id, producer_user.pk)
+
+        response = producer_client.get(f"{response_url(producer_account.id, event['_id'])}?wait=31")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
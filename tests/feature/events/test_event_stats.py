@@ -0,0 +1,69 @@
+import pytest
+from rest_framework import status
+
+from app.enums import EventStatus
+from tests.feature.events.conftest import create_event
+
+FLEET_STATS_URL = "/api/v1/events/stats/"
+
+
+def stats_url(account_id):
+    return f"/api/v1/account/{account_id}/events/stats/"
+
+
+def consume_url(account_id):
+    return f"/api/v1/account/{account_id}/events/consume/"
+
+
+def ack_url(account_id, event_id):
+    return f"/api/v1/account/{account_id}/event/{event_id}/ack/"
+
+
+@pytest.mark.django_db
+class TestEventStats:
+    def test_should_count_pushed_events(self, platform_client, platform_account, platform_user):
+        create_event(platform_account.id, platform_user.pk)
+        create_event(platform_account.id, platform_user.pk, key="get.order")
+
+        response = platform_client.get(stats_url(platform_account.id))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["data"]["totals"][EventStatus.PENDING] == 2
+        assert [row["key"] for row in response.data["data"]["keys"]] == ["get.order", "post.order"]
+
+    def test_should_follow_consume_and_ack(self, platform_client, platform_account, platform_user):
+        event = create_event(platform_account.id, platform_user.pk)
+        create_event(platform_account.id, platform_user.pk)
+
+        platform_client.post(f"{consume_url(platform_account.id)}?limit=1")
+        platform_client.patch(ack_url(platform_account.id, event["_id"]), format="json")
+
+        totals = platform_client.get(stats_url(platform_account.id)).data["data"]["totals"]
+
+        assert totals[EventStatus.PENDING] == 1
+        assert totals[EventStatus.DELIVERED] == 0
+        assert totals[EventStatus.PROCESSED] == 1
+
+    def test_should_return_400_when_account_not_found(self, platform_client):
+        response = platform_client.get(stats_url(999999))
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_should_return_403_for_foreign_account(self, producer_client, platform_account):
+        response = producer_client.get(stats_url(platform_account.id))
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_should_return_fleet_totals_to_root(self, root_client, platform_account, platform_user):
+        create_event(platform_account.id, platform_user.pk)
+
+        response = root_client.get(FLEET_STATS_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["data"]["totals"][EventStatus.PENDING] == 1
+        assert response.data["data"]["accounts"][0]["account_id"] == platform_account.id
+
+    def test_should_return_403_on_fleet_stats_for_non_root(self, platform_client):
+        response = platform_client.get(FLEET_STATS_URL)
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
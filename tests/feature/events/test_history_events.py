@@ -4,6 +4,8 @@ import pytest
 from django.utils import timezone
 from rest_framework import status
 
+from app.collections.event import Event
+from app.collections.event_sequence import EventSequence
 from app.enums import EventStatus
 from tests.feature.events.conftest import create_event
 
@@ -72,6 +74,89 @@ class TestHistoryEvents:
         assert len(response.data["data"]) == 1
         assert response.data["data"][0]["key"] == "get.account.info"
 
+    def test_should_page_forward_from_after_cursor(self, producer_client, producer_account, producer_user):
+        for _ in range(5):
+            create_event(producer_account.id, producer_user.pk)
+
+        response = producer_client.get(f"{history_url(producer_account.id)}?after=2&limit=2")
+
+        assert [event["seq"] for event in response.data["data"]] == [3, 4]
+        assert response.data["meta"] == {"count": 2, "last_seq": 4}
+
+    def test_should_page_backward_from_before_cursor(self, producer_client, producer_account, producer_user):
+        for _ in range(5):
+            create_event(producer_account.id, producer_user.pk)
+
+        response = producer_client.get(f"{history_url(producer_account.id)}?before=4&limit=2")
+
+        assert [event["seq"] for event in response.data["data"]] == [3, 2]
+        assert response.data["meta"]["last_seq"] == 2
+
+    def test_should_page_between_cursors(self, producer_client, producer_account, producer_user):
+        for _ in range(5):
+            create_event(producer_account.id, producer_user.pk)
+
+        response = producer_client.get(f"{history_url(producer_account.id)}?after=1&before=4")
+
+        assert [event["seq"] for event in response.data["data"]] == [2, 3]
+
+    def test_should_page_across_archived_events(self, producer_client, producer_account, producer_user):
+        for index in range(4):
+            create_event(
+                producer_account.id,
+                producer_user.pk,
+                status=EventStatus.PROCESSED if index % 2 else EventStatus.PENDING,
+            )
+
+        Event.archive(timezone.now())
+
+        response = producer_client.get(f"{history_url(producer_account.id)}?after=0")
+
+        assert [event["seq"] for event in response.data["data"]] == [1, 2, 3, 4]
+
+    def test_should_return_400_when_before_is_not_after_after(self, producer_client, producer_account):
+        response = producer_client.get(f"{history_url(producer_account.id)}?after=5&before=5")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_should_include_archived_events(self, producer_client, producer_account, producer_user):
+        create_event(producer_account.id, producer_user.pk, status=EventStatus.PROCESSED)
+        Event.archive(timezone.now())
+        create_event(producer_account.id, producer_user.pk)
+
+        response = producer_client.get(history_url(producer_account.id))
+
+        assert [event["status"] for event in response.data["data"]] == [EventStatus.PENDING, EventStatus.PROCESSED]
+
+    def test_should_include_dead_lettered_events(self, producer_client, producer_account, producer_user):
+        now = timezone.now()
+        event = create_event(
+            producer_account.id,
+            producer_user.pk,
+            status=EventStatus.DELIVERED,
+            attempts=1,
+            lease_expires_at=now - timedelta(seconds=1),
+        )
+        Event.dead_letter([event["_id"]], now)
+
+        response = producer_client.get(history_url(producer_account.id))
+
+        assert [event["status"] for event in response.data["data"]] == [EventStatus.FAILED]
+
+    def test_should_stop_below_a_seq_still_being_written(self, producer_client, producer_account, producer_user):
+        create_event(producer_account.id, producer_user.pk)
+        in_flight = EventSequence.reserve(producer_account.id)
+        create_event(producer_account.id, producer_user.pk)
+
+        response = producer_client.get(f"{history_url(producer_account.id)}?after=0")
+
+        assert [event["seq"] for event in response.data["data"]] == [1]
+
+        EventSequence.release(producer_account.id, in_flight)
+        response = producer_client.get(f"{history_url(producer_account.id)}?after=0")
+
+        assert [event["seq"] for event in response.data["data"]] == [1, 3]
+
     def test_should_return_empty_list_when_no_events(self, producer_client, producer_account):
         response = producer_client.get(history_url(producer_account.id))
 
@@ -23,6 +23,19 @@ class TestListEventKeys:
             assert "name" in entry
             assert "schema" in entry
 
+    def test_should_return_etag(self, authenticated_client):
+        response = authenticated_client.get(URL)
+
+        assert response["ETag"].startswith('"')
+
+    def test_should_return_304_when_etag_matches(self, authenticated_client):
+        etag = authenticated_client.get(URL)["ETag"]
+
+        response = authenticated_client.get(URL, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == etag
+
     def test_should_return_401_when_unauthenticated(self, api_client):
         response = api_client.get(URL)
 
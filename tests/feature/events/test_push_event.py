@@ -1,4 +1,8 @@
+from datetime import timedelta
+
 import pytest
+from bson import ObjectId
+from django.utils import timezone
 from rest_framework import status
 
 from app.collections.event import Event
@@ -44,27 +48,149 @@ class TestPushEvent:
         assert event["response"] is None
         assert event["attempts"] == 0
 
+    def test_should_number_events_per_account(self, producer_client, producer_account, producer_strategy):
+        first = producer_client.post(push_url(producer_account.id), VALID_PAYLOAD, format="json")
+        second = producer_client.post(push_url(producer_account.id), VALID_PAYLOAD, format="json")
+
+        assert first.data["data"]["seq"] == 1
+        assert second.data["data"]["seq"] == 2
+
+    def test_should_return_429_with_retry_after_when_queue_is_full(
+        self, settings, producer_client, producer_account, producer_strategy
+    ):
+        settings.EVENT_MAX_PENDING = 1
+        producer_client.post(push_url(producer_account.id), VALID_PAYLOAD, format="json")
+
+        response = producer_client.post(push_url(producer_account.id), VALID_PAYLOAD, format="json")
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert response.data["success"] is False
+        assert response.data["message"].startswith("Event queue is full.")
+        assert int(response["Retry-After"]) >= 1
+        assert Event.count({"account_id": producer_account.id}) == 1
+
+    def test_should_return_original_event_for_idempotent_retry_when_queue_is_full(
+        self, settings, producer_client, producer_account, producer_strategy
+    ):
+        settings.EVENT_MAX_PENDING = 1
+        payload = {**VALID_PAYLOAD, "idempotency_key": "order-1"}
+        created = producer_client.post(push_url(producer_account.id), payload, format="json")
+
+        response = producer_client.post(push_url(producer_account.id), payload, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["data"]["id"] == created.data["data"]["id"]
+
+    def test_should_accept_events_again_once_queue_drains(
+        self, settings, producer_client, producer_account, producer_strategy
+    ):
+        settings.EVENT_MAX_PENDING = 1
+        created = producer_client.post(push_url(producer_account.id), VALID_PAYLOAD, format="json")
+        Event.claim({"account_id": producer_account.id, "_id": ObjectId(created.data["data"]["id"])}, 1, "consumer")
+
+        response = producer_client.post(push_url(producer_account.id), VALID_PAYLOAD, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+
     def test_should_return_all_resource_fields(self, producer_client, producer_account, producer_strategy):
         response = producer_client.post(push_url(producer_account.id), VALID_PAYLOAD, format="json")
 
         data = response.data["data"]
         expected_fields = {
             "id",
+            "seq",
             "consumer_id",
             "account_id",
             "user_id",
             "key",
+            "broadcast_id",
             "payload",
+            "priority",
             "response",
             "status",
+            "not_before",
             "delivered_at",
+            "lease_expires_at",
             "processed_at",
+            "expires_at",
             "attempts",
             "created_at",
             "updated_at",
         }
         assert set(data.keys()) == expected_fields
 
+    def test_should_return_original_event_with_200_when_idempotency_key_is_reused(
+        self, producer_client, producer_account, producer_strategy
+    ):
+        payload = {**VALID_PAYLOAD, "idempotency_key": "order-42"}
+
+        first = producer_client.post(push_url(producer_account.id), payload, format="json")
+        retry = producer_client.post(push_url(producer_account.id), payload, format="json")
+
+        assert first.status_code == status.HTTP_201_CREATED
+        assert retry.status_code == status.HTTP_200_OK
+        assert retry.data["data"]["id"] == first.data["data"]["id"]
+        assert Event.count({"account_id": producer_account.id}) == 1
+
+    def test_should_create_separate_events_for_different_idempotency_keys(
+        self, producer_client, producer_account, producer_strategy
+    ):
+        for idempotency_key in ("order-42", "order-43"):
+            response = producer_client.post(
+                push_url(producer_account.id), {**VALID_PAYLOAD, "idempotency_key": idempotency_key}, format="json"
+            )
+
+            assert response.status_code == status.HTTP_201_CREATED
+
+        assert Event.count({"account_id": producer_account.id}) == 2
+
+    def test_should_set_expiry_from_ttl_seconds(self, producer_client, producer_account, producer_strategy):
+        producer_client.post(push_url(producer_account.id), {**VALID_PAYLOAD, "ttl_seconds": 30}, format="json")
+
+        event = Event.find_one({"account_id": producer_account.id})
+        assert event["expires_at"] - event["created_at"] == timedelta(seconds=30)
+
+    def test_should_default_expiry_to_event_key_ttl(self, producer_client, producer_account, producer_strategy):
+        producer_client.post(push_url(producer_account.id), VALID_PAYLOAD, format="json")
+        producer_client.post(push_url(producer_account.id), {"key": "get.account.info", "payload": {}}, format="json")
+
+        order = Event.find_one({"account_id": producer_account.id, "key": "post.order"})
+        info = Event.find_one({"account_id": producer_account.id, "key": "get.account.info"})
+        assert order["expires_at"] - order["created_at"] == timedelta(seconds=600)
+        assert info["expires_at"] is None
+
+    def test_should_schedule_event_with_future_not_before(self, producer_client, producer_account, producer_strategy):
+        not_before = timezone.now() + timedelta(hours=1)
+
+        response = producer_client.post(
+            push_url(producer_account.id), {**VALID_PAYLOAD, "not_before": not_before.isoformat()}, format="json"
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["data"]["status"] == EventStatus.SCHEDULED
+        event = Event.find_one({"account_id": producer_account.id})
+        assert event["expires_at"] - event["not_before"] == timedelta(seconds=600)
+
+    def test_should_queue_event_with_past_not_before_as_pending(
+        self, producer_client, producer_account, producer_strategy
+    ):
+        not_before = timezone.now() - timedelta(minutes=1)
+
+        response = producer_client.post(
+            push_url(producer_account.id), {**VALID_PAYLOAD, "not_before": not_before.isoformat()}, format="json"
+        )
+
+        assert response.data["data"]["status"] == EventStatus.PENDING
+
+    def test_should_default_priority_to_event_key_and_allow_override(
+        self, producer_client, producer_account, producer_strategy
+    ):
+        default = producer_client.post(push_url(producer_account.id), VALID_PAYLOAD, format="json")
+        override = producer_client.post(push_url(producer_account.id), {**VALID_PAYLOAD, "priority": 9}, format="json")
+
+        assert default.data["data"]["priority"] == 5
+        assert override.data["data"]["priority"] == 9
+
     def test_should_validate_payload_against_key_schema(self, producer_client, producer_account):
         payload = {
             "key": "post.order",
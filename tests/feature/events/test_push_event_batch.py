@@ -0,0 +1,164 @@
+import pytest
+from rest_framework import status
+
+from app.collections.event import Event
+from app.enums import EventStatus
+
+
+def push_batch_url(account_id):
+    return f"/api/v1/account/{account_id}/events/batch/"
+
+
+POST_ORDER = {
+    "key": "post.order",
+    "payload": {
+        "symbol": "BTCUSDT",
+        "strategy": 1,
+        "type": "buy",
+        "volume": 0.5,
+    },
+}
+GET_ACCOUNT_INFO = {"key": "get.account.info", "payload": {}}
+
+
+@pytest.mark.django_db
+class TestPushEventBatch:
+    def test_should_return_201_with_per_item_results(self, producer_client, producer_account, producer_strategy):
+        response = producer_client.post(
+            push_batch_url(producer_account.id),
+            {"events": [POST_ORDER, GET_ACCOUNT_INFO]},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["meta"] == {"count": 2, "failed": 0}
+        assert [item["index"] for item in response.data["data"]] == [0, 1]
+        assert all(item["success"] for item in response.data["data"])
+        assert response.data["data"][0]["data"]["key"] == "post.order"
+        assert response.data["data"][1]["data"]["key"] == "get.account.info"
+
+    def test_should_return_429_when_batch_would_overflow_queue(
+        self, settings, producer_client, producer_account, producer_strategy
+    ):
+        settings.EVENT_MAX_PENDING = 1
+
+        response = producer_client.post(
+            push_batch_url(producer_account.id),
+            {"events": [POST_ORDER, GET_ACCOUNT_INFO]},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert "Retry-After" in response
+        assert Event.count({}) == 0
+
+    def test_should_create_pending_events_in_order(self, producer_client, producer_account, producer_strategy):
+        producer_client.post(
+            push_batch_url(producer_account.id),
+            {"events": [POST_ORDER, GET_ACCOUNT_INFO]},
+            format="json",
+        )
+
+        events = list(Event.where({"account_id": producer_account.id}).sort("_id", 1))
+        assert [event["key"] for event in events] == ["post.order", "get.account.info"]
+        assert [event["seq"] for event in events] == [1, 2]
+        assert all(event["status"] == EventStatus.PENDING for event in events)
+
+    def test_should_return_existing_events_for_retried_idempotency_keys(
+        self, producer_client, producer_account, producer_strategy
+    ):
+        batch = {"events": [{**POST_ORDER, "idempotency_key": "order-1"}, GET_ACCOUNT_INFO]}
+        first = producer_client.post(push_batch_url(producer_account.id), batch, format="json")
+
+        retry = producer_client.post(
+            push_batch_url(producer_account.id), {"events": [batch["events"][0]]}, format="json"
+        )
+
+        assert retry.status_code == status.HTTP_200_OK
+        assert retry.data["meta"] == {"count": 0, "failed": 0}
+        assert retry.data["data"][0]["data"]["id"] == first.data["data"][0]["data"]["id"]
+        assert Event.count({"account_id": producer_account.id}) == 2
+
+    def test_should_create_keyed_items_in_order(self, producer_client, producer_account, producer_strategy):
+        producer_client.post(
+            push_batch_url(producer_account.id),
+            {"events": [GET_ACCOUNT_INFO, {**POST_ORDER, "idempotency_key": "order-1"}, GET_ACCOUNT_INFO]},
+            format="json",
+        )
+
+        events = list(Event.where({"account_id": producer_account.id}).sort("seq", 1))
+        assert [event["key"] for event in events] == ["get.account.info", "post.order", "get.account.info"]
+        assert events[1]["idempotency_key"] == "order-1"
+
+    def test_should_report_invalid_items_and_create_valid_ones(self, producer_client, producer_account):
+        invalid = {"key": "post.order", "payload": {"symbol": "BTCUSDT"}}
+
+        response = producer_client.post(
+            push_batch_url(producer_account.id),
+            {"events": [invalid, GET_ACCOUNT_INFO]},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["meta"] == {"count": 1, "failed": 1}
+        assert response.data["data"][0]["success"] is False
+        assert "message" in response.data["data"][0]
+        assert response.data["data"][1]["success"] is True
+        assert Event.count({"account_id": producer_account.id}) == 1
+
+    def test_should_reject_items_with_unknown_strategy(self, producer_client, producer_account, producer_strategy):
+        unknown_strategy = {**POST_ORDER, "payload": {**POST_ORDER["payload"], "strategy": 99}}
+
+        response = producer_client.post(
+            push_batch_url(producer_account.id),
+            {"events": [POST_ORDER, unknown_strategy]},
+            format="json",
+        )
+
+        assert response.data["data"][0]["success"] is True
+        assert response.data["data"][1]["success"] is False
+        assert "magic number 99" in response.data["data"][1]["message"]
+
+    def test_should_return_400_when_no_item_is_valid(self, producer_client, producer_account):
+        response = producer_client.post(
+            push_batch_url(producer_account.id),
+            {"events": [{"key": "invalid.key", "payload": {}}]},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["meta"] == {"count": 0, "failed": 1}
+        assert Event.count() == 0
+
+    def test_should_return_400_when_events_is_empty(self, producer_client, producer_account):
+        response = producer_client.post(push_batch_url(producer_account.id), {"events": []}, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_should_return_400_when_batch_exceeds_maximum(self, producer_client, producer_account):
+        response = producer_client.post(
+            push_batch_url(producer_account.id),
+            {"events": [GET_ACCOUNT_INFO] * 101},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_should_return_400_when_account_does_not_exist(self, root_client):
+        response = root_client.post(push_batch_url(999999999), {"events": [GET_ACCOUNT_INFO]}, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_should_return_401_when_unauthenticated(self, api_client, producer_account):
+        response = api_client.post(push_batch_url(producer_account.id), {"events": [GET_ACCOUNT_INFO]}, format="json")
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_should_return_403_when_account_owner_has_platform_role(self, platform_client, platform_account):
+        response = platform_client.post(
+            push_batch_url(platform_account.id),
+            {"events": [GET_ACCOUNT_INFO]},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
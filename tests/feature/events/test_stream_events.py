@@ -0,0 +1,147 @@
+import asyncio
+import json
+
+import pytest
+from asgiref.sync import async_to_sync, sync_to_async
+from django.test import AsyncClient
+from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken
+
+from app.collections.event import Event
+from app.collections.event_signal import EventSignal, event_notifier
+from app.enums import EventStatus
+from tests.feature.events.conftest import create_event
+
+STREAM_READ_TIMEOUT = 5
+
+
+def stream_url(account_id):
+    return f"/api/v1/account/{account_id}/events/stream/"
+
+
+def parse_message(chunk):
+    fields = {}
+
+    for line in chunk.decode().strip().splitlines():
+        name, _, value = line.partition(": ")
+        fields[name] = value
+
+    return fields
+
+
+def open_stream(user, url, messages, on_open=None):
+    """Read the first messages of a stream through the ASGI handler, then disconnect."""
+
+    async def read():
+        client = AsyncClient(headers={"Authorization": f"Bearer {AccessToken.for_user(user)}"})
+        response = await client.get(url, headers={"Accept": "text/event-stream"})
+        chunks = aiter(response.streaming_content)
+        received = [await anext(chunks)]
+
+        if on_open is not None:
+            await sync_to_async(on_open)()
+
+        while len(received) < messages:
+            received.append(await asyncio.wait_for(anext(chunks), STREAM_READ_TIMEOUT))
+
+        await chunks.aclose()
+
+        return response, received
+
+    return async_to_sync(read)()
+
+
+@pytest.mark.django_db
+class TestStreamEvents:
+    def test_should_claim_pending_events(self, platform_user, platform_account):
+        event = create_event(platform_account.id, platform_user.pk)
+
+        response, received = open_stream(platform_user, stream_url(platform_account.id), 2)
+        message = parse_message(received[1])
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "text/event-stream"
+        assert received[0] == b"retry: 3000\n\n"
+        assert message["id"] == str(event["_id"])
+        assert message["event"] == "event"
+        assert json.loads(message["data"])["status"] == EventStatus.DELIVERED
+
+        stored = Event.find_one({"_id": event["_id"]})
+        assert stored["status"] == EventStatus.DELIVERED
+        assert stored["consumer_id"] == str(platform_user.pk)
+
+    def test_should_relay_state_transitions_without_claiming(self, platform_user, platform_account):
+        event = create_event(platform_account.id, platform_user.pk)
+
+        _, received = open_stream(
+            platform_user,
+            f"{stream_url(platform_account.id)}?claim=false",
+            2,
+            on_open=lambda: EventSignal.notify(platform_account.id, EventStatus.PENDING, [event["_id"]]),
+        )
+        message = parse_message(received[1])
+
+        assert message["event"] == "status"
+        assert json.loads(message["data"]) == {"status": EventStatus.PENDING, "event_ids": [str(event["_id"])]}
+        assert Event.find_one({"_id": event["_id"]})["status"] == EventStatus.PENDING
+
+    def test_should_claim_events_pushed_after_connecting(self, platform_user, platform_account):
+        pushed = {}
+
+        def push():
+            pushed["event"] = create_event(platform_account.id, platform_user.pk)
+            EventSignal.notify(platform_account.id, EventStatus.PENDING, [pushed["event"]["_id"]])
+
+        _, received = open_stream(platform_user, stream_url(platform_account.id), 2, on_open=push)
+        message = parse_message(received[1])
+
+        assert message["event"] == "event"
+        assert message["id"] == str(pushed["event"]["_id"])
+
+    def test_should_unsubscribe_when_client_disconnects(self, platform_user, platform_account):
+        create_event(platform_account.id, platform_user.pk)
+
+        open_stream(platform_user, stream_url(platform_account.id), 2)
+
+        assert platform_account.id not in event_notifier.subscribers
+
+    def test_should_return_501_outside_asgi(self, platform_client, platform_account):
+        response = platform_client.get(stream_url(platform_account.id))
+
+        assert response.status_code == status.HTTP_501_NOT_IMPLEMENTED
+
+    def test_should_allow_owner_to_watch(self, producer_client, producer_account):
+        response = producer_client.get(f"{stream_url(producer_account.id)}?claim=false")
+
+        assert response.status_code == status.HTTP_501_NOT_IMPLEMENTED
+
+    def test_should_return_403_when_owner_claims(self, producer_client, producer_account):
+        response = producer_client.get(stream_url(producer_account.id))
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_should_return_403_when_watching_foreign_account(self, producer_client, platform_account):
+        response = producer_client.get(f"{stream_url(platform_account.id)}?claim=false")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_should_return_400_when_account_not_found(self, platform_client):
+        response = platform_client.get(stream_url(999999))
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_should_return_400_for_invalid_key(self, platform_client, platform_account):
+        response = platform_client.get(f"{stream_url(platform_account.id)}?key=invalid.key")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_should_return_401_without_auth(self, api_client, platform_account):
+        response = api_client.get(stream_url(platform_account.id))
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_should_accept_event_stream_requests(self, platform_client):
+        response = platform_client.get(stream_url(999999), HTTP_ACCEPT="text/event-stream")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["success"] is False
@@ -1,8 +1,11 @@
 from datetime import UTC, datetime
+from unittest.mock import patch
 
 from bson import ObjectId
 from django.utils import timezone
+from pymongo import IndexModel
 
+from app.collections.base import MANAGED_INDEXES_COLLECTION, STAND_IN_FIELD, STAND_IN_SUFFIX
 from tests.conftest import ConcreteDocument, ConcreteDocumentWithIndexes
 
 
@@ -28,6 +31,85 @@ class TestEnsureIndexes:
         index_info = ConcreteDocument.collection().index_information()
         assert "name_index" not in index_info
 
+    def test_drops_indexes_it_created_that_are_no_longer_declared(self):
+        ConcreteDocumentWithIndexes.collection().create_index([("legacy", 1)], name="legacy_index")
+        ConcreteDocumentWithIndexes.collection().database[MANAGED_INDEXES_COLLECTION].insert_one(
+            {"_id": ConcreteDocumentWithIndexes.collection_name, "names": ["legacy_index", "name_index"]}
+        )
+
+        result = ConcreteDocumentWithIndexes.ensure_indexes()
+
+        index_info = ConcreteDocumentWithIndexes.collection().index_information()
+        assert set(index_info) == {"_id_", "name_index"}
+        assert result == {"created": ["name_index"], "updated": [], "dropped": ["legacy_index"]}
+
+    def test_keeps_indexes_added_by_hand(self):
+        ConcreteDocumentWithIndexes.collection().create_index([("manual", 1)], name="manual_index")
+
+        result = ConcreteDocumentWithIndexes.ensure_indexes()
+
+        assert "manual_index" in ConcreteDocumentWithIndexes.collection().index_information()
+        assert result["dropped"] == []
+
+    def test_recreates_indexes_whose_definition_changed(self):
+        ConcreteDocumentWithIndexes.collection().create_index([("name", 1)], name="name_index", unique=True)
+
+        result = ConcreteDocumentWithIndexes.ensure_indexes()
+
+        assert result["updated"] == ["name_index"]
+        assert "unique" not in ConcreteDocumentWithIndexes.collection().index_information()["name_index"]
+
+    def test_drops_the_stand_in_after_rebuilding(self):
+        ConcreteDocumentWithIndexes.collection().create_index([("name", 1)], name="name_index", unique=True)
+
+        ConcreteDocumentWithIndexes.ensure_indexes()
+
+        assert set(ConcreteDocumentWithIndexes.collection().index_information()) == {"_id_", "name_index"}
+
+    def test_drops_stand_ins_left_by_an_interrupted_run(self):
+        ConcreteDocumentWithIndexes.collection().create_index(
+            [("name", 1), (STAND_IN_FIELD, 1)], name=f"name_index{STAND_IN_SUFFIX}"
+        )
+
+        result = ConcreteDocumentWithIndexes.ensure_indexes()
+
+        assert result["dropped"] == [f"name_index{STAND_IN_SUFFIX}"]
+
+    def test_drops_retired_indexes_once_their_replacements_exist(self):
+        ConcreteDocumentWithIndexes.collection().create_index([("legacy", 1)], name="legacy_index")
+
+        with patch.object(ConcreteDocumentWithIndexes, "retired_indexes", ["legacy_index"]):
+            result = ConcreteDocumentWithIndexes.ensure_indexes()
+
+        assert set(ConcreteDocumentWithIndexes.collection().index_information()) == {"_id_", "name_index"}
+        assert result == {"created": ["name_index"], "updated": [], "dropped": ["legacy_index"]}
+
+    def test_updates_ttl_in_place(self):
+        with patch.object(
+            ConcreteDocumentWithIndexes,
+            "indexes",
+            [IndexModel([("created_at", 1)], name="created_ttl", expireAfterSeconds=60)],
+        ):
+            ConcreteDocumentWithIndexes.ensure_indexes()
+
+        with patch.object(
+            ConcreteDocumentWithIndexes,
+            "indexes",
+            [IndexModel([("created_at", 1)], name="created_ttl", expireAfterSeconds=120)],
+        ):
+            result = ConcreteDocumentWithIndexes.ensure_indexes()
+
+        index_info = ConcreteDocumentWithIndexes.collection().index_information()
+        assert result["updated"] == ["created_ttl"]
+        assert index_info["created_ttl"]["expireAfterSeconds"] == 120
+
+    def test_skips_indexes_that_already_exist(self):
+        ConcreteDocumentWithIndexes.ensure_indexes()
+
+        result = ConcreteDocumentWithIndexes.ensure_indexes()
+
+        assert result == {"created": [], "updated": [], "dropped": []}
+
 
 class TestCreate:
     def test_inserts_document_and_returns_it_with_id(self):
@@ -66,6 +148,23 @@ class TestCreate:
         assert result["updated_at"] == existing_time
 
 
+class TestInsertMany:
+    def test_inserts_documents_and_assigns_ids(self):
+        result = ConcreteDocument.insert_many([{"name": "one"}, {"name": "two"}])
+
+        assert all(isinstance(document["_id"], ObjectId) for document in result)
+        assert ConcreteDocument.count() == 2
+
+    def test_sets_created_at_and_updated_at_timestamps(self):
+        result = ConcreteDocument.insert_many([{"name": "one"}])
+
+        assert result[0]["created_at"] is not None
+        assert result[0]["updated_at"] is not None
+
+    def test_does_nothing_when_documents_are_empty(self):
+        assert ConcreteDocument.insert_many([]) == []
+
+
 class TestFind:
     def test_returns_document_by_id(self):
         created = ConcreteDocument.create({"name": "findable"})
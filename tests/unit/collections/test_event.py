@@ -0,0 +1,394 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from bson import ObjectId
+from django.utils import timezone
+
+from app.collections.event import ACTIVE_FILTER, CLAIM_SORT, MAX_QUEUE_BRANCHES, Event
+from app.collections.event_archive import EventArchive
+from app.collections.event_dead_letter import EventDeadLetter
+from app.collections.event_idempotency_key import EventIdempotencyKey
+from app.enums import EventFailureReason, EventStatus
+
+
+def create_event(account_id=1, **overrides):
+    now = timezone.now()
+    defaults = {
+        "account_id": account_id,
+        "consumer_id": None,
+        "key": "get.account.info",
+        "payload": {},
+        "response": None,
+        "status": EventStatus.PENDING,
+        "delivered_at": None,
+        "processed_at": None,
+        "attempts": 0,
+        "created_at": now,
+        "updated_at": now,
+    }
+    defaults.update(overrides)
+    return Event.create(defaults)
+
+
+class TestIndexes:
+    def test_queue_indexes_only_cover_active_events(self):
+        Event.ensure_indexes()
+        create_event(status=EventStatus.PROCESSED)
+
+        plan = Event.where({"account_id": 1, "status": EventStatus.PENDING}).sort(CLAIM_SORT).explain()
+
+        assert "queue_account_status_priority_created" in str(plan["queryPlanner"]["winningPlan"])
+        index = Event.collection().index_information()["queue_account_status_priority_created"]
+        assert index["partialFilterExpression"] == ACTIVE_FILTER
+
+
+class TestCreateIdempotent:
+    def build(self, account_id=1):
+        return {"account_id": account_id, "key": "get.account.info", "payload": {}, "status": EventStatus.PENDING}
+
+    def test_creates_event_once_per_key(self):
+        EventIdempotencyKey.ensure_indexes()
+
+        first, first_created = Event.create_idempotent(self.build(), "retry-1")
+        second, second_created = Event.create_idempotent(self.build(), "retry-1")
+
+        assert (first_created, second_created) == (True, False)
+        assert second["_id"] == first["_id"]
+        assert Event.count() == 1
+
+    def test_scopes_keys_to_the_account(self):
+        Event.create_idempotent(self.build(account_id=1), "retry-1")
+        _, created = Event.create_idempotent(self.build(account_id=2), "retry-1")
+
+        assert created is True
+        assert Event.count() == 2
+
+    def test_returns_original_event_after_it_was_archived(self):
+        event, _ = Event.create_idempotent(self.build(), "retry-1")
+        Event.update_one(str(event["_id"]), {"status": EventStatus.PROCESSED})
+        Event.archive(timezone.now())
+
+        duplicate, created = Event.create_idempotent(self.build(), "retry-1")
+
+        assert created is False
+        assert duplicate["_id"] == event["_id"]
+        assert Event.count() == 0
+
+    def test_inserts_event_reserved_by_an_interrupted_push(self):
+        EventIdempotencyKey.reserve(1, "retry-1", ObjectId())
+
+        event, created = Event.create_idempotent(self.build(), "retry-1")
+
+        assert created is True
+        assert event["_id"] == EventIdempotencyKey.find_one({"idempotency_key": "retry-1"})["event_id"]
+
+
+class TestClaim:
+    def test_claims_pending_events_up_to_limit(self):
+        for _ in range(5):
+            create_event()
+
+        claimed = Event.claim({"account_id": 1}, 3, "consumer")
+
+        assert len(claimed) == 3
+        assert Event.count({"status": EventStatus.DELIVERED}) == 3
+        assert Event.count({"status": EventStatus.PENDING}) == 2
+
+    def test_marks_claimed_events_as_delivered_to_consumer(self):
+        create_event()
+
+        claimed = Event.claim({"account_id": 1}, 10, "consumer")
+
+        assert claimed[0]["status"] == EventStatus.DELIVERED
+        assert claimed[0]["consumer_id"] == "consumer"
+        assert claimed[0]["delivered_at"] is not None
+        assert claimed[0]["attempts"] == 1
+
+    def test_returns_events_oldest_first(self):
+        now = timezone.now()
+        newer = create_event(created_at=now)
+        older = create_event(created_at=now - timedelta(seconds=5))
+
+        claimed = Event.claim({"account_id": 1}, 10, "consumer")
+
+        assert [event["_id"] for event in claimed] == [older["_id"], newer["_id"]]
+
+    def test_claims_each_event_only_once(self):
+        for _ in range(3):
+            create_event()
+
+        first = Event.claim({"account_id": 1}, 10, "first")
+        second = Event.claim({"account_id": 1}, 10, "second")
+
+        assert len(first) == 3
+        assert second == []
+
+    def test_ignores_events_that_are_not_pending(self):
+        create_event(status=EventStatus.DELIVERED)
+        create_event(status=EventStatus.PROCESSED)
+
+        assert Event.claim({"account_id": 1}, 10, "consumer") == []
+
+    def test_reclaims_delivered_events_with_expired_lease(self):
+        create_event(
+            status=EventStatus.DELIVERED,
+            attempts=1,
+            lease_expires_at=timezone.now() - timedelta(seconds=1),
+        )
+
+        claimed = Event.claim({"account_id": 1}, 10, "consumer")
+
+        assert len(claimed) == 1
+        assert claimed[0]["attempts"] == 2
+
+    def test_claims_higher_priority_events_first(self):
+        now = timezone.now()
+        create_event(key="get.klines", priority=0, created_at=now - timedelta(seconds=5))
+        urgent = create_event(key="delete.order", priority=8, created_at=now)
+
+        claimed = Event.claim({"account_id": 1}, 1, "consumer")
+
+        assert claimed[0]["_id"] == urgent["_id"]
+
+    def test_urgent_event_jumps_a_large_backlog_without_sorting_it(self):
+        Event.ensure_indexes()
+        now = timezone.now()
+        Event.collection().insert_many(
+            [
+                {
+                    "account_id": 1,
+                    "key": "get.klines",
+                    "payload": {},
+                    "priority": 0,
+                    "status": EventStatus.PENDING,
+                    "attempts": 0,
+                    "created_at": now - timedelta(seconds=10_000 - index),
+                    "updated_at": now,
+                }
+                for index in range(10_000)
+            ]
+        )
+        urgent = create_event(key="delete.order", priority=8)
+
+        plan = Event.where({"account_id": 1, **Event.claimable(now)}).sort(CLAIM_SORT).limit(1).explain()
+        claimed = Event.claim({"account_id": 1}, 1, "consumer")
+
+        assert claimed[0]["_id"] == urgent["_id"]
+        assert plan["executionStats"]["totalDocsExamined"] < 100
+
+    def test_splits_limit_fairly_across_accounts(self):
+        now = timezone.now()
+
+        for index in range(50):
+            create_event(account_id=1, created_at=now - timedelta(seconds=100 - index))
+
+        quiet = [create_event(account_id=account_id, created_at=now) for account_id in (2, 3, 4)]
+
+        claimed = Event.claim({"account_id": {"$in": [1, 2, 3, 4]}}, 8, "consumer")
+
+        assert len(claimed) == 8
+        assert {event["_id"] for event in quiet} <= {event["_id"] for event in claimed}
+
+    def test_gives_unused_share_to_accounts_with_more_events(self):
+        for _ in range(20):
+            create_event(account_id=1)
+
+        create_event(account_id=2)
+
+        claimed = Event.claim({"account_id": {"$in": [1, 2]}}, 10, "consumer")
+
+        assert len(claimed) == 10
+        assert sum(event["account_id"] == 2 for event in claimed) == 1
+
+    def test_only_reads_accounts_with_queued_events(self):
+        create_event(account_id=2)
+
+        with patch.object(Event, "queue_heads", wraps=Event.queue_heads) as queue_heads:
+            claimed = Event.claim({"account_id": {"$in": [1, 2, 3]}}, 10, "consumer")
+
+        assert [event["account_id"] for event in claimed] == [2]
+        assert queue_heads.call_args.args[1] == [2]
+
+    def test_caps_the_accounts_read_per_round(self):
+        for account_id in range(1, MAX_QUEUE_BRANCHES + 11):
+            create_event(account_id=account_id)
+
+        with patch.object(Event, "queue_heads", wraps=Event.queue_heads) as queue_heads:
+            claimed = Event.claim({"account_id": {"$in": list(range(1, MAX_QUEUE_BRANCHES + 11))}}, 100, "consumer")
+
+        assert len(claimed) == MAX_QUEUE_BRANCHES + 10
+        assert [len(call.args[1]) for call in queue_heads.call_args_list] == [MAX_QUEUE_BRANCHES, 10]
+
+    def test_only_claims_events_matching_query(self):
+        create_event(account_id=1)
+        create_event(account_id=2)
+
+        claimed = Event.claim({"account_id": 2}, 10, "consumer")
+
+        assert len(claimed) == 1
+        assert claimed[0]["account_id"] == 2
+
+    def test_moves_expired_events_over_max_attempts_to_dead_letter(self, settings):
+        settings.EVENT_MAX_ATTEMPTS = {"get.account.info": 2}
+        expired = timezone.now() - timedelta(seconds=1)
+        event = create_event(status=EventStatus.DELIVERED, attempts=2, consumer_id="ea", lease_expires_at=expired)
+
+        assert Event.claim({"account_id": 1}, 10, "consumer") == []
+
+        dead_letter = EventDeadLetter.find_one({"_id": event["_id"]})
+
+        assert Event.count() == 0
+        assert dead_letter["status"] == EventStatus.FAILED
+        assert dead_letter["failure_reason"] == EventFailureReason.MAX_ATTEMPTS
+        assert "2 delivery attempts" in dead_letter["last_error"]
+
+    def test_keeps_claiming_past_dead_lettered_events(self, settings):
+        settings.EVENT_MAX_ATTEMPTS = {"get.account.info": 1}
+        now = timezone.now()
+        create_event(
+            status=EventStatus.DELIVERED,
+            attempts=1,
+            lease_expires_at=now - timedelta(seconds=1),
+            created_at=now - timedelta(seconds=5),
+        )
+        pending = create_event(created_at=now)
+
+        claimed = Event.claim({"account_id": 1}, 1, "consumer")
+
+        assert [event["_id"] for event in claimed] == [pending["_id"]]
+        assert EventDeadLetter.count() == 1
+
+
+class TestExpire:
+    def test_claim_skips_expired_events(self):
+        create_event(expires_at=timezone.now() - timedelta(seconds=1))
+        fresh = create_event(expires_at=timezone.now() + timedelta(minutes=5))
+
+        claimed = Event.claim({"account_id": 1}, 10, "consumer")
+
+        assert [event["_id"] for event in claimed] == [fresh["_id"]]
+
+    def test_moves_expired_pending_events_to_dead_letter(self):
+        event = create_event(expires_at=timezone.now() - timedelta(seconds=1))
+        create_event(expires_at=None)
+
+        assert Event.expire(timezone.now()) == 1
+
+        dead_letter = EventDeadLetter.find_one({"_id": event["_id"]})
+
+        assert Event.count() == 1
+        assert dead_letter["status"] == EventStatus.FAILED
+        assert dead_letter["failure_reason"] == EventFailureReason.EXPIRED
+
+    def test_moves_expired_scheduled_events_to_dead_letter(self):
+        now = timezone.now()
+        event = create_event(
+            status=EventStatus.SCHEDULED,
+            not_before=now - timedelta(minutes=2),
+            expires_at=now - timedelta(minutes=1),
+        )
+
+        assert Event.expire(now) == 1
+        assert EventDeadLetter.find_one({"_id": event["_id"]})["status"] == EventStatus.FAILED
+        assert "dead_lettered_from" not in EventDeadLetter.find_one({"_id": event["_id"]})
+        assert Event.promote(1, now) == 0
+
+    def test_purges_old_dead_letters(self):
+        now = timezone.now()
+        event = create_event(expires_at=now - timedelta(seconds=1))
+        Event.expire(now)
+
+        assert EventDeadLetter.purge(now - timedelta(days=1)) == 0
+        assert EventDeadLetter.purge(now + timedelta(seconds=1)) == 1
+        assert EventDeadLetter.find_one({"_id": event["_id"]}) is None
+
+    def test_leaves_events_under_an_active_lease(self):
+        now = timezone.now()
+        create_event(
+            status=EventStatus.DELIVERED,
+            attempts=1,
+            lease_expires_at=now + timedelta(seconds=30),
+            expires_at=now - timedelta(seconds=1),
+        )
+
+        assert Event.expire(now) == 0
+        assert Event.count({"status": EventStatus.DELIVERED}) == 1
+
+
+class TestAcknowledge:
+    def test_processes_delivered_events_and_clears_lease(self):
+        event = create_event(status=EventStatus.DELIVERED, lease_expires_at=timezone.now())
+
+        result = Event.acknowledge(1, [{"event_id": event["_id"], "response": {"ok": True}}])
+
+        assert len(result["processed"]) == 1
+        assert result["processed"][0]["status"] == EventStatus.PROCESSED
+        assert result["processed"][0]["lease_expires_at"] is None
+        assert result["processed"][0]["response"] == {"ok": True}
+
+    def test_reports_events_that_are_not_delivered(self):
+        event = create_event(status=EventStatus.PENDING)
+
+        result = Event.acknowledge(1, [{"event_id": event["_id"]}])
+
+        assert result["processed"] == []
+        assert result["invalid_status"] == [event["_id"]]
+
+
+class TestArchive:
+    def test_moves_terminal_events_to_archive(self):
+        before = timezone.now()
+        processed = create_event(status=EventStatus.PROCESSED, updated_at=before - timedelta(seconds=1))
+        pending = create_event(updated_at=before - timedelta(seconds=1))
+
+        assert Event.archive(before) == 1
+
+        assert EventArchive.find_one({"_id": processed["_id"]}) is not None
+        assert [event["_id"] for event in Event.all()] == [pending["_id"]]
+
+    def test_leaves_recently_finished_events_in_place(self):
+        before = timezone.now()
+        create_event(status=EventStatus.PROCESSED, updated_at=before + timedelta(seconds=1))
+
+        assert Event.archive(before) == 0
+        assert EventArchive.count() == 0
+
+    def test_completes_a_previously_interrupted_move(self):
+        before = timezone.now()
+        event = create_event(status=EventStatus.PROCESSED, updated_at=before - timedelta(seconds=1))
+        EventArchive.collection().insert_one(dict(event))
+
+        assert Event.archive(before) == 1
+        assert Event.count() == 0
+        assert EventArchive.count() == 1
+
+
+class TestHistory:
+    def test_merges_hot_and_archived_events_newest_first(self):
+        now = timezone.now()
+        archived = create_event(status=EventStatus.PROCESSED, created_at=now - timedelta(seconds=2))
+        Event.archive(now)
+        pending = create_event(created_at=now - timedelta(seconds=1))
+        oldest = create_event(created_at=now - timedelta(seconds=3))
+
+        events = Event.history({"account_id": 1}, 2)
+
+        assert [event["_id"] for event in events] == [pending["_id"], archived["_id"]]
+        assert oldest["_id"] not in [event["_id"] for event in events]
+
+
+class TestBackfill:
+    def test_gives_leases_to_events_delivered_before_leases(self):
+        delivered_at = timezone.now() - timedelta(hours=1)
+        create_event(status=EventStatus.DELIVERED, attempts=1, delivered_at=delivered_at)
+
+        assert Event.backfill_leases() == 1
+        assert [event["status"] for event in Event.claim({"account_id": 1}, 10, "consumer")] == [EventStatus.DELIVERED]
+
+    def test_gives_queued_events_without_priority_their_key_priority(self):
+        old = create_event(created_at=timezone.now() - timedelta(minutes=5))
+        Event.collection().update_one({"_id": old["_id"]}, {"$unset": {"priority": ""}})
+        create_event(priority=0)
+
+        assert Event.backfill_priorities() == 1
+        assert Event.claim({"account_id": 1}, 1, "consumer")[0]["_id"] == old["_id"]
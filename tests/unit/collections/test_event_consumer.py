@@ -0,0 +1,59 @@
+from datetime import timedelta
+
+from django.utils import timezone
+
+from app.collections.event_consumer import EventConsumer, rendezvous_owner
+
+ACCOUNT_IDS = list(range(1, 201))
+
+
+class TestRendezvousOwner:
+    def test_assigns_each_account_to_exactly_one_member(self):
+        members = ["terminal-a", "terminal-b", "terminal-c"]
+        owners = {account_id: rendezvous_owner("platform", account_id, members) for account_id in ACCOUNT_IDS}
+
+        assert set(owners.values()) == set(members)
+
+    def test_new_member_only_takes_accounts_from_others(self):
+        before = {account_id: rendezvous_owner("platform", account_id, ["a", "b", "c"]) for account_id in ACCOUNT_IDS}
+        after = {
+            account_id: rendezvous_owner("platform", account_id, ["a", "b", "c", "d"]) for account_id in ACCOUNT_IDS
+        }
+
+        moved = [account_id for account_id in ACCOUNT_IDS if before[account_id] != after[account_id]]
+
+        assert moved
+        assert all(after[account_id] == "d" for account_id in moved)
+
+
+class TestAssign:
+    def test_splits_accounts_across_live_members(self):
+        EventConsumer.join("platform", "terminal-a", "user")
+        EventConsumer.join("platform", "terminal-b", "user")
+
+        first, members = EventConsumer.assign("platform", "terminal-a", ACCOUNT_IDS)
+        second, _ = EventConsumer.assign("platform", "terminal-b", ACCOUNT_IDS)
+
+        assert members == ["terminal-a", "terminal-b"]
+        assert sorted(first + second) == ACCOUNT_IDS
+        assert not set(first) & set(second)
+
+    def test_ignores_members_with_expired_lease(self):
+        EventConsumer.join("platform", "terminal-a", "user")
+        EventConsumer.join("platform", "terminal-b", "user")
+        EventConsumer.collection().update_one(
+            {"consumer": "terminal-b"}, {"$set": {"lease_expires_at": timezone.now() - timedelta(seconds=1)}}
+        )
+
+        assigned, members = EventConsumer.assign("platform", "terminal-a", ACCOUNT_IDS)
+
+        assert members == ["terminal-a"]
+        assert assigned == ACCOUNT_IDS
+
+    def test_keeps_groups_independent(self):
+        EventConsumer.join("platform", "terminal-a", "user")
+        EventConsumer.join("backtest", "terminal-b", "user")
+
+        assigned, _ = EventConsumer.assign("platform", "terminal-a", ACCOUNT_IDS)
+
+        assert assigned == ACCOUNT_IDS
@@ -0,0 +1,91 @@
+from django.utils import timezone
+
+from app.collections.event import Event
+from app.collections.event_counter import EventCounter, zero_counts
+from app.enums import EventStatus
+
+
+def document(account_id=1, key="post.order"):
+    return {"account_id": account_id, "key": key}
+
+
+class TestApply:
+    def test_moves_counts_between_statuses(self):
+        EventCounter.added([{**document(), "status": EventStatus.PENDING}] * 3)
+        EventCounter.move([document()] * 2, EventStatus.PENDING, EventStatus.DELIVERED)
+
+        counter = EventCounter.find_one({"account_id": 1, "key": "post.order"})
+
+        assert counter[EventStatus.PENDING] == 1
+        assert counter[EventStatus.DELIVERED] == 2
+
+    def test_skips_empty_changes(self):
+        EventCounter.move([document()], EventStatus.PENDING, EventStatus.PENDING)
+
+        assert EventCounter.find_one({"account_id": 1}) is None
+
+
+class TestReads:
+    def test_for_account_sums_every_key(self):
+        EventCounter.added([{**document(), "status": EventStatus.PENDING}])
+        EventCounter.added([{**document(key="get.order"), "status": EventStatus.DELIVERED}])
+
+        stats = EventCounter.for_account(1)
+
+        assert stats["totals"] == {**zero_counts(), EventStatus.PENDING: 1, EventStatus.DELIVERED: 1}
+        assert [row["key"] for row in stats["keys"]] == ["get.order", "post.order"]
+
+    def test_backlog_filters_by_key(self):
+        EventCounter.added([{**document(), "status": EventStatus.PENDING}] * 2)
+        EventCounter.added([{**document(key="get.order"), "status": EventStatus.SCHEDULED}])
+
+        backlog = EventCounter.backlog({"account_id": {"$in": [1, 2]}})
+
+        assert (backlog[EventStatus.PENDING], backlog[EventStatus.SCHEDULED]) == (2, 1)
+        assert EventCounter.backlog({"account_id": 1, "key": "get.order"})[EventStatus.PENDING] == 0
+
+    def test_backlog_reports_the_latest_push(self):
+        before = timezone.now()
+        EventCounter.added([{**document(), "status": EventStatus.PENDING}])
+        EventCounter.move([document()], EventStatus.PENDING, EventStatus.DELIVERED)
+
+        backlog = EventCounter.backlog({"account_id": 1})
+
+        assert backlog[EventStatus.PENDING] == 0
+        assert backlog["last_pushed_at"] >= before
+        assert EventCounter.backlog({"account_id": 2})["last_pushed_at"] is None
+
+    def test_fleet_groups_by_account(self):
+        EventCounter.added([{**document(), "status": EventStatus.PENDING}])
+        EventCounter.added([{**document(account_id=2), "status": EventStatus.PENDING}] * 2)
+
+        fleet = EventCounter.fleet()
+
+        assert fleet["totals"][EventStatus.PENDING] == 3
+        assert [(row["account_id"], row[EventStatus.PENDING]) for row in fleet["accounts"]] == [(1, 1), (2, 2)]
+
+    def test_overflow_counts_scheduled_and_pending_events(self, settings):
+        settings.EVENT_MAX_PENDING = 2
+        EventCounter.added(
+            [{**document(), "status": EventStatus.SCHEDULED}, {**document(), "status": EventStatus.PENDING}]
+        )
+        EventCounter.added([{**document(account_id=2), "status": EventStatus.DELIVERED}] * 5)
+
+        assert EventCounter.overflow([1, 2]) == {1: 1}
+        assert EventCounter.overflow([2], incoming=3) == {2: 1}
+
+    def test_overflow_is_disabled_without_limit(self, settings):
+        settings.EVENT_MAX_PENDING = 0
+        EventCounter.added([{**document(), "status": EventStatus.PENDING}] * 3)
+
+        assert EventCounter.overflow([1]) == {}
+
+
+class TestRebuild:
+    def test_recounts_from_collections_and_drops_stale_counters(self):
+        Event.collection().insert_many([{**document(), "status": EventStatus.PENDING} for _ in range(2)])
+        EventCounter.added([{**document(account_id=2), "status": EventStatus.PENDING}])
+
+        assert EventCounter.rebuild((Event,)) == 1
+        assert EventCounter.for_account(1)["totals"][EventStatus.PENDING] == 2
+        assert EventCounter.find_one({"account_id": 2}) is None
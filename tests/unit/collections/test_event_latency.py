@@ -0,0 +1,82 @@
+from datetime import UTC, datetime, timedelta
+
+from app.collections.event import Event
+from app.collections.event_archive import EventArchive
+from app.collections.event_latency import ROLLUP_WATERMARK, EventLatency, bucket_label, percentile
+from app.collections.rollup_watermark import RollupWatermark
+from app.enums import EventStatus
+
+NOW = datetime(2026, 6, 3, 14, 30, tzinfo=UTC)
+
+
+def processed_event(account_id=1, key="post.order", wait_ms=40, processing_ms=200, processed_at=NOW):
+    delivered_at = processed_at - timedelta(milliseconds=processing_ms)
+
+    return {
+        "account_id": account_id,
+        "key": key,
+        "status": EventStatus.PROCESSED,
+        "created_at": delivered_at - timedelta(milliseconds=wait_ms),
+        "delivered_at": delivered_at,
+        "processed_at": processed_at,
+    }
+
+
+class TestBuckets:
+    def test_labels_values_with_the_upper_bound(self):
+        assert bucket_label(0) == "10"
+        assert bucket_label(10) == "10"
+        assert bucket_label(11) == "25"
+        assert bucket_label(10**7) == "inf"
+
+    def test_percentile_reads_the_bucket_holding_the_rank(self):
+        histogram = {"10": 90, "100": 9, "inf": 1}
+
+        assert percentile(histogram, 50) == 10
+        assert percentile(histogram, 95) == 100
+        assert percentile(histogram, 99) == 100
+        assert percentile({"inf": 1}, 50) is None
+        assert percentile({}, 50) is None
+
+
+class TestRollup:
+    def test_records_hot_and_archived_events_once(self):
+        archived = processed_event(processed_at=NOW - timedelta(minutes=1))
+        Event.collection().insert_one(processed_event())
+        Event.collection().insert_one(archived)
+        EventArchive.collection().insert_one(archived)
+
+        assert EventLatency.rollup(NOW) == 2
+
+        row = EventLatency.find_one({"account_id": 1, "key": "post.order"})
+        assert row["count"] == 2
+        assert row["queue_wait"] == {"50": 2}
+        assert row["processing"] == {"250": 2}
+        assert RollupWatermark.get(ROLLUP_WATERMARK) == NOW
+
+    def test_resumes_from_the_watermark(self):
+        Event.collection().insert_one(processed_event(processed_at=NOW - timedelta(minutes=1)))
+        EventLatency.rollup(NOW)
+        Event.collection().insert_one(processed_event(processed_at=NOW + timedelta(minutes=1)))
+
+        assert EventLatency.rollup(NOW + timedelta(minutes=2)) == 1
+        assert EventLatency.find_one({"account_id": 1})["count"] == 2
+
+
+class TestSummary:
+    def test_groups_percentiles_by_key_and_account(self):
+        EventLatency.record(
+            [
+                processed_event(wait_ms=5),
+                processed_event(wait_ms=5),
+                processed_event(account_id=2, key="get.order", wait_ms=2000),
+            ]
+        )
+
+        summary = EventLatency.summary({}, NOW - timedelta(hours=1))
+
+        assert summary["totals"]["count"] == 3
+        assert summary["totals"]["queue_wait"]["p50"] == 10
+        assert summary["totals"]["queue_wait"]["p99"] == 2500
+        assert [row["key"] for row in summary["keys"]] == ["get.order", "post.order"]
+        assert [(row["account_id"], row["count"]) for row in summary["accounts"]] == [(1, 2), (2, 1)]
@@ -0,0 +1,50 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.utils import timezone
+
+from app.collections.event_sequence import CLAIM_TIMEOUT, EventSequence
+
+
+class TestReserve:
+    def test_starts_each_account_at_one(self):
+        assert EventSequence.reserve(1) == 1
+        assert EventSequence.reserve(2) == 1
+        assert EventSequence.reserve(1) == 2
+
+    def test_reserves_consecutive_blocks(self):
+        assert EventSequence.reserve(1, 3) == 1
+        assert EventSequence.reserve(1, 2) == 4
+        assert EventSequence.reserve(1) == 6
+
+    def test_never_hands_out_a_number_twice_under_concurrency(self):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            numbers = list(executor.map(lambda _: EventSequence.reserve(1), range(200)))
+
+        assert sorted(numbers) == list(range(1, 201))
+
+
+class TestHorizon:
+    def test_is_none_when_nothing_is_in_flight(self):
+        EventSequence.release(1, EventSequence.reserve(1))
+
+        assert EventSequence.horizon(1) is None
+
+    def test_is_the_lowest_number_still_being_written(self):
+        first = EventSequence.reserve(1, 2)
+        EventSequence.reserve(1)
+
+        assert EventSequence.horizon(1) == first
+
+        EventSequence.release(1, first)
+
+        assert EventSequence.horizon(1) == 3
+
+    def test_ignores_claims_of_pushes_that_died(self):
+        EventSequence.reserve(1)
+        EventSequence.collection().update_one(
+            {"_id": 1}, {"$set": {"inflight.0.at": timezone.now() - CLAIM_TIMEOUT * 2}}
+        )
+
+        assert EventSequence.horizon(1) is None
+        assert EventSequence.reserve(1) == 2
+        assert len(EventSequence.find_one({"_id": 1})["inflight"]) == 1
@@ -0,0 +1,51 @@
+import time
+
+from bson import ObjectId
+
+from app.collections.event_signal import SIGNAL_COLLECTION_MAX, SIGNAL_COLLECTION_SIZE, EventSignal
+from app.enums import EventStatus
+
+
+class TestEnsureCollection:
+    def test_creates_capped_collection(self):
+        EventSignal.ensure_collection()
+
+        assert EventSignal.collection().options()["capped"] is True
+
+    def test_converts_existing_collection_to_capped(self):
+        EventSignal.collection().insert_one({"account_id": 1})
+
+        EventSignal.ensure_collection()
+
+        assert EventSignal.collection().options()["capped"] is True
+
+    def test_shrinks_existing_capped_collection(self):
+        EventSignal.collection().database.create_collection(
+            EventSignal.collection_name, capped=True, size=16 * 1024 * 1024
+        )
+
+        EventSignal.ensure_collection()
+
+        options = EventSignal.collection().options()
+        assert options["size"] == SIGNAL_COLLECTION_SIZE
+        assert options["max"] == SIGNAL_COLLECTION_MAX
+
+
+class TestListen:
+    def test_wait_returns_signal_for_matching_account(self):
+        event_id = ObjectId()
+
+        with EventSignal.listen({"account_id": 1}) as cursor:
+            EventSignal.notify(1, EventStatus.PENDING, [event_id])
+            signal = EventSignal.wait(cursor, time.monotonic() + 5)
+
+        assert signal is not None
+        assert signal["event_ids"] == [event_id]
+        assert signal["status"] == EventStatus.PENDING
+
+    def test_wait_returns_none_when_deadline_expires(self):
+        with EventSignal.listen({"account_id": 1}) as cursor:
+            EventSignal.notify(2, EventStatus.PENDING, [ObjectId()])
+            signal = EventSignal.wait(cursor, time.monotonic() + 1)
+
+        assert signal is None
@@ -0,0 +1,55 @@
+import pytest
+from rest_framework import serializers
+
+from app.enums import EventKey
+from app.http.requests.event.payload_validator import PAYLOAD_VALIDATORS
+
+ORDER = {"symbol": "BTCUSDT", "strategy": 1, "type": "buy", "volume": 0.5}
+
+
+def errors_for(event_key, payload):
+    with pytest.raises(serializers.ValidationError) as error:
+        PAYLOAD_VALIDATORS[event_key].validate(payload)
+
+    return {field: [(str(detail), detail.code) for detail in details] for field, details in error.value.detail.items()}
+
+
+class TestPayloadValidator:
+    def test_returns_coerced_payload_without_unset_optional_fields(self):
+        payload = {**ORDER, "symbol": " BTCUSDT ", "strategy": "1.0", "volume": "0.5", "unknown": 1}
+
+        validated = PAYLOAD_VALIDATORS[EventKey.POST_ORDER].validate(payload)
+
+        assert validated == {"symbol": "BTCUSDT", "strategy": 1, "type": "buy", "volume": 0.5}
+
+    def test_drops_fields_for_keys_without_schema(self):
+        assert PAYLOAD_VALIDATORS[EventKey.GET_ACCOUNT_INFO].validate({"anything": 1}) == {}
+
+    def test_reports_required_and_null_fields_in_schema_order(self):
+        errors = errors_for(EventKey.POST_ORDER, {"symbol": None, "price": None})
+
+        assert list(errors) == ["symbol", "strategy", "type", "volume"]
+        assert errors["symbol"] == [("This field may not be null.", "null")]
+        assert errors["strategy"] == [("This field is required.", "required")]
+
+    def test_reports_drf_messages_for_invalid_values(self):
+        errors = errors_for(
+            EventKey.POST_ORDER,
+            {"symbol": " ", "strategy": 1.5, "type": "hold", "volume": 0.001, "comment": "x" * 256},
+        )
+
+        assert errors == {
+            "symbol": [("This field may not be blank.", "blank")],
+            "strategy": [("A valid integer is required.", "invalid")],
+            "type": [('"hold" is not a valid choice.', "invalid_choice")],
+            "volume": [("Ensure this value is greater than or equal to 0.01.", "min_value")],
+            "comment": [("Ensure this field has no more than 255 characters.", "max_length")],
+        }
+
+    def test_rejects_non_finite_numbers_and_non_scalar_strings(self):
+        errors = errors_for(EventKey.POST_ORDER, {**ORDER, "symbol": ["BTCUSDT"], "volume": "nan"})
+
+        assert errors == {
+            "symbol": [("Not a valid string.", "invalid")],
+            "volume": [("A valid number is required.", "invalid")],
+        }
@@ -0,0 +1,69 @@
+import json
+
+import pytest
+from rest_framework import serializers
+
+from app.http.requests.validators import MAX_NESTING_DEPTH, MAX_PAYLOAD_SIZE, validate_dict_payload
+
+SIZE_MESSAGE = f"Payload size exceeds maximum of {MAX_PAYLOAD_SIZE} bytes."
+DEPTH_MESSAGE = f"Payload nesting depth exceeds maximum of {MAX_NESTING_DEPTH} levels."
+
+
+def payload_of_size(size, text="x"):
+    payload = {"data": ""}
+    overhead = len(json.dumps(payload))
+    payload["data"] = text * ((size - overhead) // len(json.dumps(text)[1:-1]))
+
+    return payload
+
+
+def nested(depth):
+    payload = {}
+
+    for _ in range(depth):
+        payload = {"level": payload}
+
+    return payload
+
+
+def error_message(payload, body_size=None):
+    with pytest.raises(serializers.ValidationError) as error:
+        validate_dict_payload(payload, body_size)
+
+    return str(error.value.detail[0])
+
+
+class TestValidateDictPayload:
+    def test_accepts_payload_exactly_at_size_limit(self):
+        payload = payload_of_size(MAX_PAYLOAD_SIZE)
+
+        assert len(json.dumps(payload)) == MAX_PAYLOAD_SIZE
+        assert validate_dict_payload(payload) is payload
+
+    def test_rejects_payload_one_byte_over_size_limit(self):
+        payload = payload_of_size(MAX_PAYLOAD_SIZE)
+        payload["data"] += "x"
+
+        assert error_message(payload) == SIZE_MESSAGE
+
+    def test_measures_non_ascii_text_as_escaped_json(self):
+        payload = payload_of_size(MAX_PAYLOAD_SIZE + 6, text="é")
+
+        assert error_message(payload) == SIZE_MESSAGE
+
+    def test_accepts_maximum_nesting_depth(self):
+        assert validate_dict_payload(nested(MAX_NESTING_DEPTH)) is not None
+
+    def test_rejects_payload_nested_too_deep(self):
+        assert error_message(nested(MAX_NESTING_DEPTH + 1)) == DEPTH_MESSAGE
+
+    def test_reports_size_before_depth(self):
+        payload = payload_of_size(MAX_PAYLOAD_SIZE + 100)
+        payload["nested"] = nested(MAX_NESTING_DEPTH + 1)
+
+        assert error_message(payload) == SIZE_MESSAGE
+
+    def test_still_checks_depth_for_small_request_bodies(self):
+        payload = nested(MAX_NESTING_DEPTH + 1)
+
+        assert error_message(payload, body_size=len(json.dumps(payload))) == DEPTH_MESSAGE